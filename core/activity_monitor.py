@@ -13,7 +13,6 @@ try:
     PYNPUT_AVAILABLE = True
 except ImportError:
     PYNPUT_AVAILABLE = False
-    logging.warning("pynput 未安装，活跃度监测功能将不可用")
 
 logger = logging.getLogger(__name__)
 
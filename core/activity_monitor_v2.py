@@ -18,14 +18,12 @@ try:
     PYNPUT_AVAILABLE = True
 except ImportError:
     PYNPUT_AVAILABLE = False
-    logging.warning("pynput 未安装，活跃度监测功能将不可用")
 
 try:
     import psutil
     PSUTIL_AVAILABLE = True
 except ImportError:
     PSUTIL_AVAILABLE = False
-    logging.warning("psutil 未安装，CPU使用率检测将不可用")
 
 from core.types import ActivityCard
 
@@ -34,7 +32,6 @@ try:
     WIN32_AVAILABLE = True
 except ImportError:
     WIN32_AVAILABLE = False
-    logging.warning("win32gui 未安装，窗口焦点检测将不可用")
 
 logger = logging.getLogger(__name__)
 
@@ -191,7 +188,7 @@ class SmartActivityMonitor:
             if current_window != self._last_window:
                 # 窗口焦点变化
                 if self._last_window is not None:
-                    logger.debug(f"检测到窗口焦点变化")
+                    logger.debug("检测到窗口焦点变化")
                     self._record_activity("window_focus_change")
                 
                 self._last_window = current_window
@@ -218,7 +215,7 @@ class SmartActivityMonitor:
                 self._cpu_usage = psutil.cpu_percent(interval=1)
                 self._last_cpu_check = time.time()
                 
-                logger.debug(f"CPU使用率: {self._cpu_usage:.1f}%")
+                logger.debug("CPU使用率: %.1f%%", self._cpu_usage)
                 
                 # 如果CPU使用率高，记录为活跃
                 if self._cpu_usage >= self.cpu_threshold:
@@ -263,7 +260,7 @@ class SmartActivityMonitor:
         is_thinking = activity_count >= self.min_activity_count
         
         if is_thinking:
-            logger.debug(f"检测到思考状态（{self.thinking_window}秒内有{activity_count}次操作）")
+            logger.debug("检测到思考状态（%s秒内有%s次操作）", self.thinking_window, activity_count)
         
         return is_thinking
     
@@ -283,11 +280,11 @@ class SmartActivityMonitor:
         # 超过闲置阈值，检查是否在思考
         # 如果在思考，不算闲置
         if self._is_thinking():
-            logger.debug(f"闲置时间超过阈值（{idle_time:.0f}秒），但在思考窗口内有活动")
+            logger.debug("闲置时间超过阈值（%.0f秒），但在思考窗口内有活动", idle_time)
             return False
         
         # 超过闲置阈值且不在思考，判定为闲置
-        logger.debug(f"判定为真正闲置（闲置时间: {idle_time:.0f}秒）")
+        logger.debug("判定为真正闲置（闲置时间: %.0f秒）", idle_time)
         return True
     
     def _monitor_loop(self):
@@ -316,7 +313,7 @@ class SmartActivityMonitor:
                 recent_activities = self._count_recent_activities(self.thinking_window)
                 
                 # 定期输出状态日志
-                logger.debug(f"监测状态 - 闲置时间: {idle_time:.0f}秒, 近期活动: {recent_activities}次, 当前状态: {'闲置' if is_idle else '活跃'}")
+                logger.debug("监测状态 - 闲置时间: %.0f秒, 近期活动: %s次, 当前状态: %s", idle_time, recent_activities, '闲置' if is_idle else '活跃')
                 
                 # 检查是否需要触发闲置回调
                 with self._state_lock:
@@ -589,7 +586,7 @@ class SmartAutoPauseRecorder:
                 "type": activity_type
             })
             
-        logger.debug(f"检测到活动: {activity_type}")
+        logger.debug("检测到活动: %s", activity_type)
     
     def _check_activity_since(self, start_time: float) -> bool:
         """检查从指定时间开始到现在是否有活动"""
@@ -744,7 +741,7 @@ class SmartAutoPauseRecorder:
             logger.info(f"状态转换: REST_WAIT_30 -> REST_DETECT_90 (elapsed={elapsed:.1f}秒)")
             return
             
-        logger.debug(f"REST_WAIT_30状态: 已等待{elapsed:.1f}秒，还需{30-elapsed:.1f}秒")
+        logger.debug("REST_WAIT_30状态: 已等待%.1f秒，还需%.1f秒", elapsed, 30 - elapsed)
         self._stop_event.wait(1)
     
     def _state_rest_detect_90(self):
@@ -913,7 +910,7 @@ class SmartAutoPauseRecorder:
     def _update_rest_card_end_time_for_loop(self):
         """更新休息卡片的结束时间（后台更新循环调用，不清除卡片ID）"""
         if not self._current_rest_card_id or not self._rest_start_time:
-            logger.debug(f"跳过更新休息卡片: _current_rest_card_id={self._current_rest_card_id}, _rest_start_time={self._rest_start_time}")
+            logger.debug("跳过更新休息卡片: _current_rest_card_id=%s, _rest_start_time=%s", self._current_rest_card_id, self._rest_start_time)
             return
             
         current_time = datetime.now()
@@ -961,7 +958,7 @@ class SmartAutoPauseRecorder:
         logger.info("休息卡片更新循环已启动")
         while not self._rest_card_update_stop_event.is_set():
             try:
-                logger.debug(f"休息卡片更新循环检查: _current_rest_card_id={self._current_rest_card_id}, _rest_start_time={self._rest_start_time}")
+                logger.debug("休息卡片更新循环检查: _current_rest_card_id=%s, _rest_start_time=%s", self._current_rest_card_id, self._rest_start_time)
                 if self._current_rest_card_id and self._rest_start_time:
                     self._update_rest_card_end_time_for_loop()
                 self._rest_card_update_stop_event.wait(60)  # 每60秒更新一次
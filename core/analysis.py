@@ -256,28 +256,29 @@ class AnalysisScheduler:
                 window_records = None
                 if chunk.window_records_path:
                     window_records_file = Path(chunk.window_records_path)
-                    if window_records_file.exists():
-                        try:
-                            import json
-                            with open(window_records_file, 'r', encoding='utf-8') as f:
-                                window_records = json.load(f)
-                            logger.debug(f"已加载 {len(window_records)} 条窗口记录")
-                            
-                            # 提取卡片开始时间
-                            if isinstance(window_records, list) and len(window_records) > 0:
-                                first_record = window_records[0]
-                                if isinstance(first_record, dict) and first_record.get("event") == "card_start":
-                                    card_start_time_str = first_record.get("card_start_time")
-                                    if card_start_time_str:
-                                        try:
-                                            from datetime import datetime
-                                            card_start_time = datetime.fromisoformat(card_start_time_str)
-                                            chunk_card_start_times[chunk.id] = card_start_time
-                                            logger.debug(f"从窗口记录提取卡片开始时间: {card_start_time}")
-                                        except Exception as e:
-                                            logger.warning(f"解析卡片开始时间失败: {e}")
-                        except Exception as e:
-                            logger.warning(f"读取窗口记录失败: {e}")
+                    try:
+                        import json
+                        with open(window_records_file, 'r', encoding='utf-8') as f:
+                            window_records = json.load(f)
+                        logger.debug(f"已加载 {len(window_records)} 条窗口记录")
+                        
+                        # 提取卡片开始时间
+                        if isinstance(window_records, list) and len(window_records) > 0:
+                            first_record = window_records[0]
+                            if isinstance(first_record, dict) and first_record.get("event") == "card_start":
+                                card_start_time_str = first_record.get("card_start_time")
+                                if card_start_time_str:
+                                    try:
+                                        from datetime import datetime
+                                        card_start_time = datetime.fromisoformat(card_start_time_str)
+                                        chunk_card_start_times[chunk.id] = card_start_time
+                                        logger.debug(f"从窗口记录提取卡片开始时间: {card_start_time}")
+                                    except Exception as e:
+                                        logger.warning(f"解析卡片开始时间失败: {e}")
+                    except FileNotFoundError:
+                        pass  # 没有窗口记录文件时直接跳过，不单独 stat 探测
+                    except Exception as e:
+                        logger.warning(f"读取窗口记录失败: {e}")
                 
                 observations = await self.provider.transcribe_video(
                     chunk.file_path,
@@ -789,19 +790,23 @@ class AnalysisScheduler:
         deleted_count = 0
         for chunk in chunks:
             try:
-                # 删除视频文件
+                # 删除视频文件（直接删除，文件不存在时由异常判断，不先 exists() 探测）
                 chunk_path = Path(chunk.file_path)
-                if chunk_path.exists():
+                try:
                     chunk_path.unlink()
                     deleted_count += 1
                     logger.debug(f"已删除视频切片: {chunk_path.name}")
+                except FileNotFoundError:
+                    pass
                 
                 # 删除窗口记录文件
                 if chunk.window_records_path:
                     window_records_path = Path(chunk.window_records_path)
-                    if window_records_path.exists():
+                    try:
                         window_records_path.unlink()
                         logger.debug(f"已删除窗口记录: {window_records_path.name}")
+                    except FileNotFoundError:
+                        pass
             except Exception as e:
                 logger.warning(f"删除文件失败 {chunk.file_path}: {e}")
         
@@ -41,6 +41,21 @@ DEFAULT_VALUES = {
     ConfigKey.DB_IDLE_TIMEOUT: "300.0",
 }
 
+# 需要解析为 int / float 的配置键（模块加载时构建一次，解析时只做成员判断）
+INT_CONFIG_KEYS = frozenset({
+    ConfigKey.VIDEO_MAX_FRAMES,
+    ConfigKey.BATCH_CHUNK_COUNT,
+    ConfigKey.LOG_MAX_SIZE_MB,
+    ConfigKey.LOG_BACKUP_COUNT,
+    ConfigKey.LOG_RETENTION_DAYS,
+    ConfigKey.DB_POOL_SIZE,
+})
+FLOAT_CONFIG_KEYS = frozenset({
+    ConfigKey.API_TIMEOUT,
+    ConfigKey.DB_POOL_TIMEOUT,
+    ConfigKey.DB_IDLE_TIMEOUT,
+})
+
 
 class ConfigManager(QObject):
     """
@@ -120,6 +135,10 @@ class ConfigManager(QObject):
             key: 配置键
             value: 配置值
         """
+        # 值未变化时跳过数据库写入和变更信号
+        if key in self._cache and self._cache[key] == value:
+            return
+        
         # 序列化值
         str_value = self._serialize_value(value)
         
@@ -169,27 +188,14 @@ class ConfigManager(QObject):
             return None
         
         # 整数类型
-        int_keys = {
-            ConfigKey.VIDEO_MAX_FRAMES,
-            ConfigKey.BATCH_CHUNK_COUNT,
-            ConfigKey.LOG_MAX_SIZE_MB,
-            ConfigKey.LOG_BACKUP_COUNT,
-            ConfigKey.LOG_RETENTION_DAYS,
-            ConfigKey.DB_POOL_SIZE,
-        }
-        if key in int_keys:
+        if key in INT_CONFIG_KEYS:
             try:
                 return int(str_value)
             except ValueError:
                 return str_value
         
         # 浮点数类型
-        float_keys = {
-            ConfigKey.API_TIMEOUT,
-            ConfigKey.DB_POOL_TIMEOUT,
-            ConfigKey.DB_IDLE_TIMEOUT,
-        }
-        if key in float_keys:
+        if key in FLOAT_CONFIG_KEYS:
             try:
                 return float(str_value)
             except ValueError:
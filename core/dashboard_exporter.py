@@ -5,6 +5,7 @@ Dayflow - 仪表盘导出器
 import logging
 import webbrowser
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional, List, Dict
@@ -73,6 +74,15 @@ def format_duration(minutes: int) -> str:
         return f"{mins}m"
 
 
+@lru_cache(maxsize=4)
+def _get_template_environment(template_dir: Path) -> Environment:
+    """按模板目录缓存 Jinja2 环境，多次导出复用已编译的模板"""
+    env = Environment(loader=FileSystemLoader(template_dir))
+    # 添加自定义过滤器
+    env.filters['format_duration'] = format_duration
+    return env
+
+
 class DashboardExporter:
     """仪表盘导出器"""
     
@@ -82,10 +92,7 @@ class DashboardExporter:
         
         # 模板目录 - 支持打包后的路径
         self.template_dir = self._get_template_dir()
-        self.env = Environment(loader=FileSystemLoader(self.template_dir))
-        
-        # 添加自定义过滤器
-        self.env.filters['format_duration'] = format_duration
+        self.env = _get_template_environment(self.template_dir)
     
     def _get_template_dir(self) -> Path:
         """获取模板目录路径"""
@@ -27,14 +27,18 @@ class DataMigrationManager:
     CONFIG_KEY_DATA_ROOT = "data_root"
     CONFIG_KEY_OLD_DATA_ROOT = "old_data_root_to_delete"
     
+    # 配置文件解析缓存（类级共享）：(路径, st_mtime_ns, st_size, 配置字典)
+    # 启动时 main 与设置页各建一个管理器，文件未变时不重复解析
+    _config_cache: Optional[Tuple[Path, int, int, dict]] = None
+    
     def __init__(self):
         self.config_file = Path.home() / self.CONFIG_FILE
         self.default_data_dir = self._get_default_data_dir()
         logger.info(f"数据迁移管理器初始化，当前数据目录: {self.default_data_dir}")
     
     def _get_config_file(self) -> Path:
-        """获取配置文件路径"""
-        return Path.home() / self.CONFIG_FILE
+        """获取配置文件路径（构造时已解析，不再每次调用 Path.home()）"""
+        return self.config_file
     
     def _read_config(self) -> Optional[dict]:
         """
@@ -44,15 +48,27 @@ class DataMigrationManager:
             配置字典，如果文件不存在或解析失败则返回 None
         """
         config_file = self._get_config_file()
-        if not config_file.exists():
+        try:
+            st = config_file.stat()
+        except OSError:
             return None
         
+        # 文件未变化时直接返回缓存（浅拷贝，调用方可能修改后再写回）
+        cached = DataMigrationManager._config_cache
+        if cached and cached[:3] == (config_file, st.st_mtime_ns, st.st_size):
+            return dict(cached[3])
+        
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                config = json.load(f)
         except Exception as e:
             logger.warning(f"读取配置文件失败: {e}")
             return None
+        
+        if isinstance(config, dict):
+            DataMigrationManager._config_cache = (config_file, st.st_mtime_ns, st.st_size, config)
+            return dict(config)
+        return config
     
     def _write_config(self, config: dict) -> None:
         """
@@ -66,6 +82,17 @@ class DataMigrationManager:
         """
         config_file = self._get_config_file()
         
+        # 内容与磁盘上的文件一致时跳过写入（缓存仅在文件未被外部修改时有效）
+        cached = DataMigrationManager._config_cache
+        if cached and cached[3] == config:
+            try:
+                st = config_file.stat()
+                if cached[:3] == (config_file, st.st_mtime_ns, st.st_size):
+                    logger.debug("配置文件内容未变化，跳过写入")
+                    return
+            except OSError:
+                pass
+        
         try:
             # 创建临时文件
             with tempfile.NamedTemporaryFile(
@@ -77,15 +104,37 @@ class DataMigrationManager:
             ) as temp_file:
                 json.dump(config, temp_file, indent=2, ensure_ascii=False)
                 temp_file_path = Path(temp_file.name)
+                # 重命名前落盘，避免崩溃后留下空文件或截断的配置
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
             
             # 原子重命名
             temp_file_path.replace(config_file)
+            self._fsync_dir(config_file.parent)
+            st = config_file.stat()
+            DataMigrationManager._config_cache = (config_file, st.st_mtime_ns, st.st_size, dict(config))
             logger.info(f"配置文件写入成功: {config_file}")
             
         except Exception as e:
             logger.error(f"写入配置文件失败: {e}")
             raise DataMigrationError(f"写入配置文件失败: {str(e)}")
     
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """同步目录项，确保重命名持久化（仅 POSIX；Windows 无法以此方式打开目录）"""
+        if os.name == 'nt':
+            return
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
     def _get_default_data_dir(self) -> Path:
         """
         获取默认数据目录 - 支持配置驱动
@@ -104,7 +153,7 @@ class DataMigrationManager:
             if data_root:
                 try:
                     config_path = Path(data_root)
-                    if config_path.exists() and config_path.is_dir():
+                    if config_path.is_dir():  # 不存在时 is_dir() 也返回 False，一次 stat 即可
                         logger.info(f"使用配置文件中的数据目录: {config_path}")
                         return config_path
                     else:
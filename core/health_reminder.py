@@ -45,15 +45,15 @@ class ActivitySession:
         return self.category in ENTERTAINMENT_CATEGORIES
 
 # 活动类别定义
-WORK_CATEGORIES = {
+WORK_CATEGORIES = frozenset({
     "工作", "编程", "学习", "会议", "开发", "写作", 
     "Work", "Programming", "Study", "Meeting", "Development", "Writing"
-}
+})
 
-ENTERTAINMENT_CATEGORIES = {
+ENTERTAINMENT_CATEGORIES = frozenset({
     "娱乐", "游戏", "社交", "休息", "视频", "音乐", 
     "Entertainment", "Game", "Social", "Break", "Video", "Music"
-}
+})
 
 def _now_local() -> datetime:
     """获取当前本地时间"""
@@ -113,10 +113,12 @@ class HealthReminder:
         
         try:
             # 保存到存储
-            self.storage.set_setting("health_work_threshold", str(work_threshold))
-            self.storage.set_setting("health_entertainment_threshold", str(entertainment_threshold))
-            self.storage.set_setting("health_cooldown", str(cooldown))
-            self.storage.set_setting("health_reminder_enabled", "true")
+            self.storage.set_settings({
+                "health_work_threshold": str(work_threshold),
+                "health_entertainment_threshold": str(entertainment_threshold),
+                "health_cooldown": str(cooldown),
+                "health_reminder_enabled": "true",
+            })
             
             # 更新本地配置
             self.work_threshold_minutes = work_threshold
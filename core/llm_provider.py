@@ -13,13 +13,15 @@ from datetime import datetime, timedelta
 from urllib.parse import unquote
 
 import httpx
-import cv2
 
 import config
 from core.types import Observation, ActivityCard, AppSite
 
 logger = logging.getLogger(__name__)
 
+# 抽帧时顺序解码的帧数上限：低于此值时顺序 grab() 一遍，高于此值仍按帧号跳转
+SEQUENTIAL_DECODE_MAX_FRAMES = 600
+
 # 系统提示词
 TRANSCRIBE_SYSTEM_PROMPT = """你是屏幕活动分析助手。根据截图和窗口信息，描述用户的具体行为。
 
@@ -321,6 +323,9 @@ class DayflowBackendProvider:
         Returns:
             List[str]: base64 编码的图片列表
         """
+        # OpenCV 导入较重，只有抽帧时才需要；总结生成等纯文本请求不必加载
+        import cv2
+        
         frames_base64 = []
         
         cap = cv2.VideoCapture(video_path)
@@ -337,21 +342,47 @@ class DayflowBackendProvider:
         actual_frames = min(max_frames, total_frames)
         frame_indices = [int(i * total_frames / actual_frames) for i in range(actual_frames)]
         
-        for idx in frame_indices:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-            ret, frame = cap.read()
-            if not ret:
-                continue
-            
-            # 压缩图片以减少传输大小
-            frame = cv2.resize(frame, (1280, 720))
+        for frame in self._read_frames_at(cap, frame_indices, total_frames):
+            # 压缩图片以减少传输大小（已是目标尺寸时跳过缩放）
+            if frame.shape[1] != 1280 or frame.shape[0] != 720:
+                frame = cv2.resize(frame, (1280, 720))
             _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
-            base64_image = base64.b64encode(buffer).decode('utf-8')
+            # base64 输出只含 ASCII 字符，按 ascii 解码走最快路径
+            base64_image = base64.b64encode(buffer).decode('ascii')
             frames_base64.append(base64_image)
         
         cap.release()
         return frames_base64
     
+    def _read_frames_at(self, cap, frame_indices: List[int], total_frames: int):
+        """
+        按升序帧号依次产出帧
+        
+        录屏切片帧率很低（每段几十帧），顺序 grab() 一遍、只对选中帧 retrieve()，
+        比每帧 CAP_PROP_POS_FRAMES 跳转（每次都从关键帧重新解码）便宜；
+        帧数较多的视频仍按帧号跳转读取。
+        """
+        import cv2
+        
+        if not frame_indices:
+            return
+        if total_frames > SEQUENTIAL_DECODE_MAX_FRAMES:
+            for idx in frame_indices:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+                ret, frame = cap.read()
+                if ret:
+                    yield frame
+            return
+        
+        wanted = set(frame_indices)
+        for idx in range(frame_indices[-1] + 1):
+            if not cap.grab():
+                return
+            if idx in wanted:
+                ret, frame = cap.retrieve()
+                if ret:
+                    yield frame
+    
     def _supports_thinking(self, model: str) -> bool:
         """检查模型是否支持 thinking 参数（仅 GLM-4.5 及以上）"""
         thinking_supported_models = [
@@ -2,22 +2,114 @@
 Dayflow - 日志轮转管理器
 支持文件大小限制、自动轮转、过期清理
 """
+import atexit
 import logging
 import os
+import queue
+import time
 from datetime import datetime, timedelta
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """
+    缓存秒级时间戳文本的日志格式化器
+    
+    默认 formatTime 每条记录都要 localtime + strftime；时间精度到秒（毫秒单独拼接），
+    同一秒内的记录复用上一次格式化的结果。
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_text = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_text, record.msecs)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    批量落盘的轮转文件处理器
+    
+    标准实现每条记录都会 stat 一次日志路径、seek/tell 判断是否轮转（会强制刷新缓冲），
+    写完再 flush，一条日志对应多次系统调用。这里在打开文件时取一次大小、之后按写入字节累加，
+    日志队列积压时累计若干条才 flush，把大量单行写入合并成块写入；
+    队列处理空后由 _IdleFlushQueueListener 调用 flush_pending() 立即写出，日志不会滞留在内存中。
+    WARNING 及以上级别立即 flush，避免异常退出时丢失关键日志；
+    关闭/轮转/进程退出（logging.shutdown）时缓冲区照常写出。
+    """
+    
+    FLUSH_EVERY_RECORDS = 50
+    
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        self._pending = 0
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        stream = super()._open()
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            size = len(msg.encode(self.encoding or "utf-8", errors="replace"))
+            if self.maxBytes > 0 and self._size and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            self._pending += 1
+            if record.levelno >= logging.WARNING or self._pending >= self.FLUSH_EVERY_RECORDS:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self) -> None:
+        super().flush()
+        self._pending = 0
+    
+    def flush_pending(self) -> None:
+        """有未写出的记录时 flush（由日志监听线程在队列空闲时调用）"""
+        if self._pending:
+            self.flush()
+
+
+class _IdleFlushQueueListener(QueueListener):
+    """队列处理空后立即让处理器写出缓冲，积压时才合并写入"""
+    
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                flush_pending = getattr(handler, "flush_pending", None)
+                if flush_pending:
+                    flush_pending()
+
+
 class LogManager:
     """
     日志管理器
     
     功能:
-    - 使用 RotatingFileHandler 实现日志轮转
+    - 使用 RotatingFileHandler 实现日志轮转（批量 flush，减少逐条写盘）
     - 支持可配置的文件大小限制
     - 支持可配置的备份文件数量
     - 支持按保留天数清理过期日志
@@ -53,8 +145,10 @@ class LogManager:
         # 确保日志目录存在
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
-        self._file_handler: Optional[RotatingFileHandler] = None
+        self._file_handler: Optional[BufferedRotatingFileHandler] = None
         self._console_handler: Optional[logging.StreamHandler] = None
+        self._queue_listener: Optional[QueueListener] = None
+        self._atexit_registered = False
     
     @property
     def log_file_path(self) -> Path:
@@ -65,11 +159,16 @@ class LogManager:
         """
         配置并返回根日志记录器
         
+        重复调用是幂等的：已配置时直接返回，不会重新打开日志文件、
+        再起一个监听线程或重复注册退出回调
+        
         Returns:
             配置好的根日志记录器
         """
         # 获取根日志记录器
         root_logger = logging.getLogger()
+        if self._queue_listener is not None:
+            return root_logger
         root_logger.setLevel(self.log_level)
         
         # 清除现有处理器
@@ -77,17 +176,29 @@ class LogManager:
         
         # 日志格式
         log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-        formatter = logging.Formatter(log_format)
+        formatter = CachedTimeFormatter(log_format)
         
         # 创建轮转文件处理器
         self._file_handler = self._create_rotating_handler()
         self._file_handler.setFormatter(formatter)
-        root_logger.addHandler(self._file_handler)
         
         # 创建控制台处理器
         self._console_handler = logging.StreamHandler()
         self._console_handler.setFormatter(formatter)
-        root_logger.addHandler(self._console_handler)
+        
+        # 根记录器只挂 QueueHandler：调用 logger.info 的线程（录制/分析/UI）只做入队，
+        # 格式化、轮转和写盘都在 QueueListener 的后台线程完成
+        log_queue: queue.Queue = queue.Queue(-1)
+        root_logger.addHandler(QueueHandler(log_queue))
+        self._queue_listener = _IdleFlushQueueListener(
+            log_queue, self._file_handler, self._console_handler,
+            respect_handler_level=True
+        )
+        self._queue_listener.start()
+        # 退出时先停监听线程（处理完队列中剩余记录），再由 logging.shutdown 刷新关闭处理器
+        if not self._atexit_registered:
+            atexit.register(self._stop_listener)
+            self._atexit_registered = True
         
         # 降低第三方库日志级别
         logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -100,18 +211,19 @@ class LogManager:
         
         return root_logger
     
-    def _create_rotating_handler(self) -> RotatingFileHandler:
+    def _create_rotating_handler(self) -> BufferedRotatingFileHandler:
         """
         创建轮转文件处理器
         
         Returns:
-            配置好的 RotatingFileHandler
+            配置好的 BufferedRotatingFileHandler（首条日志写入时才打开文件）
         """
-        handler = RotatingFileHandler(
+        handler = BufferedRotatingFileHandler(
             filename=str(self.log_file_path),
             maxBytes=self.max_size_bytes,
             backupCount=self.backup_count,
-            encoding="utf-8"
+            encoding="utf-8",
+            delay=True
         )
         return handler
     
@@ -213,7 +325,12 @@ class LogManager:
         """
         if self._file_handler:
             try:
-                self._file_handler.doRollover()
+                # 监听线程可能正在写入，轮转期间持有处理器锁
+                self._file_handler.acquire()
+                try:
+                    self._file_handler.doRollover()
+                finally:
+                    self._file_handler.release()
                 logger.info("已强制执行日志轮转")
                 return True
             except Exception as e:
@@ -221,8 +338,16 @@ class LogManager:
                 return False
         return False
     
+    def _stop_listener(self) -> None:
+        """停止后台日志线程，队列中剩余的记录会先写完"""
+        if self._queue_listener:
+            self._queue_listener.stop()
+            self._queue_listener = None
+    
     def close(self) -> None:
         """关闭日志处理器"""
+        self._stop_listener()
+        
         if self._file_handler:
             self._file_handler.close()
             self._file_handler = None
@@ -22,6 +22,11 @@ CATEGORY_COLORS = {
     "其他": "#8b5cf6",    # 浅紫色
 }
 
+# 未知分类使用的颜色
+DEFAULT_CATEGORY_COLOR = CATEGORY_COLORS["其他"]
+
+WEEKDAY_NAMES = ("周一", "周二", "周三", "周四", "周五", "周六", "周日")
+
 
 class StatsCollector:
     """统计数据收集器"""
@@ -30,15 +35,10 @@ class StatsCollector:
         self.storage = storage
     
     def _get_cards_in_range(self, start_date: date, end_date: date) -> List:
-        """获取日期范围内的所有卡片"""
-        cards = []
-        current = start_date
-        while current <= end_date:
-            dt = datetime(current.year, current.month, current.day)
-            day_cards = self.storage.get_cards_for_date(dt)
-            cards.extend(day_cards)
-            current += timedelta(days=1)
-        return cards
+        """获取日期范围内的所有卡片（按开始时间升序）"""
+        start = datetime(start_date.year, start_date.month, start_date.day)
+        end = datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59, 999999)
+        return self.storage.get_cards_in_range(start, end)
     
     def get_total_duration(self, start_date: date, end_date: date) -> int:
         """
@@ -144,7 +144,7 @@ class StatsCollector:
             result.append({
                 "name": category,
                 "value": round(duration, 1),
-                "color": CATEGORY_COLORS.get(category, CATEGORY_COLORS["其他"])
+                "color": CATEGORY_COLORS.get(category, DEFAULT_CATEGORY_COLOR)
             })
         
         return result
@@ -169,11 +169,8 @@ class StatsCollector:
             if not card.start_time or not card.end_time:
                 continue
             
-            # 计算活动覆盖的小时
-            start_hour = card.start_time.hour
-            end_hour = card.end_time.hour
-            
             # 简化处理：将活动分配到开始小时
+            start_hour = card.start_time.hour
             duration = card.duration_minutes
             hourly_data[start_hour]["score_sum"] += card.productivity_score * duration
             hourly_data[start_hour]["duration"] += duration
@@ -212,21 +209,20 @@ class StatsCollector:
             dt = datetime(target_date.year, target_date.month, target_date.day)
             cards = self.storage.get_cards_for_date(dt)
             
-            total_duration = sum(card.duration_minutes for card in cards)
+            # 单次遍历同时累计总时长和加权效率（duration_minutes 每张卡片只计算一次）
+            total_duration = 0
+            weighted_score = 0
+            for card in cards:
+                duration = card.duration_minutes
+                total_duration += duration
+                weighted_score += card.productivity_score * duration
             
             # 计算加权平均效率
-            if total_duration > 0:
-                weighted_score = sum(
-                    card.productivity_score * card.duration_minutes 
-                    for card in cards
-                )
-                avg_score = weighted_score / total_duration
-            else:
-                avg_score = 0
+            avg_score = weighted_score / total_duration if total_duration > 0 else 0
             
             result.append({
                 "date": target_date.strftime("%m-%d"),
-                "weekday": ["周一", "周二", "周三", "周四", "周五", "周六", "周日"][target_date.weekday()],
+                "weekday": WEEKDAY_NAMES[target_date.weekday()],
                 "duration": round(total_duration, 1),
                 "score": round(avg_score, 1)
             })
@@ -283,11 +279,9 @@ class StatsCollector:
         Returns:
             活动列表 [{start, end, category, title, summary, score, apps}]
         """
+        # 数据库已按开始时间排序
         cards = self._get_cards_in_range(start_date, end_date)
         
-        # 按开始时间排序
-        cards.sort(key=lambda c: c.start_time or datetime.min)
-        
         result = []
         for card in cards:
             # 获取主要应用名称
@@ -298,7 +292,7 @@ class StatsCollector:
                 "end": card.end_time.strftime("%H:%M") if card.end_time else "",
                 "date": card.start_time.strftime("%Y-%m-%d") if card.start_time else "",
                 "category": card.category or "其他",
-                "category_color": CATEGORY_COLORS.get(card.category, CATEGORY_COLORS["其他"]),
+                "category_color": CATEGORY_COLORS.get(card.category, DEFAULT_CATEGORY_COLOR),
                 "title": card.title,
                 "summary": card.summary,
                 "score": card.productivity_score,
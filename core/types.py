@@ -24,7 +24,7 @@ class BatchStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """
     观察记录 - 对应视频转录结果
@@ -58,7 +58,7 @@ class Observation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSite:
     """应用/网站信息"""
     name: str
@@ -81,7 +81,7 @@ class AppSite:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityCard:
     """
     时间轴活动卡片 - 展示在时间轴上的主要元素
@@ -135,7 +135,7 @@ class ActivityCard:
         return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoChunk:
     """视频切片"""
     id: Optional[int] = None
@@ -160,7 +160,7 @@ class VideoChunk:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisBatch:
     """分析批次"""
     id: Optional[int] = None
@@ -183,7 +183,7 @@ class AnalysisBatch:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class InspirationCard:
     """
     灵感卡片 - 记录用户的灵感和想法
@@ -13,8 +13,6 @@ from pathlib import Path
 from typing import Optional, Callable, Tuple
 from dataclasses import dataclass
 
-import httpx
-
 import config
 
 logger = logging.getLogger(__name__)
@@ -59,6 +57,9 @@ class UpdateChecker:
         Returns:
             UpdateInfo: 更新信息
         """
+        # httpx 只在真正联网时导入：启动时 check_pending_update 仅检查本地文件，不应为此加载 HTTP 栈
+        import httpx
+        
         info = UpdateInfo(current_version=self.current_version)
         
         try:
@@ -214,6 +215,8 @@ class UpdateDownloader:
     
     def _download_from_url(self, url: str) -> bool:
         """从指定 URL 下载"""
+        import httpx
+        
         temp_path = self.target_path.with_suffix('.tmp')
         
         try:
@@ -19,7 +19,7 @@ except ImportError:
     logger.warning("win32gui/psutil 未安装，窗口追踪功能不可用")
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowInfo:
     """窗口信息"""
     app_name: str  # 进程名，如 "chrome.exe"
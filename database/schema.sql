@@ -46,6 +46,29 @@ CREATE TABLE IF NOT EXISTS timeline_cards (
     FOREIGN KEY (batch_id) REFERENCES analysis_batches(id)
 );
 
+-- 数据修订号表（由触发器维护，界面据此判断数据是否变化，避免重复聚合）
+CREATE TABLE IF NOT EXISTS data_revisions (
+    table_name TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO data_revisions (table_name, revision) VALUES ('timeline_cards', 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_cards_revision_insert AFTER INSERT ON timeline_cards
+BEGIN
+    UPDATE data_revisions SET revision = revision + 1 WHERE table_name = 'timeline_cards';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cards_revision_update AFTER UPDATE ON timeline_cards
+BEGIN
+    UPDATE data_revisions SET revision = revision + 1 WHERE table_name = 'timeline_cards';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cards_revision_delete AFTER DELETE ON timeline_cards
+BEGIN
+    UPDATE data_revisions SET revision = revision + 1 WHERE table_name = 'timeline_cards';
+END;
+
 -- 用户设置表
 CREATE TABLE IF NOT EXISTS settings (
     key TEXT PRIMARY KEY,
@@ -69,6 +92,8 @@ CREATE INDEX IF NOT EXISTS idx_chunks_start_time ON chunks(start_time);
 CREATE INDEX IF NOT EXISTS idx_batches_status ON analysis_batches(status);
 CREATE INDEX IF NOT EXISTS idx_cards_start_time ON timeline_cards(start_time);
 CREATE INDEX IF NOT EXISTS idx_cards_category ON timeline_cards(category);
+CREATE INDEX IF NOT EXISTS idx_cards_start_time_category ON timeline_cards(start_time, category);  -- 统计页按时间范围 + 类别聚合
+CREATE INDEX IF NOT EXISTS idx_cards_end_time ON timeline_cards(end_time);  -- 健康提醒/分析取最近卡片 ORDER BY end_time DESC LIMIT
 CREATE INDEX IF NOT EXISTS idx_daily_summaries_date ON daily_summaries(date);
 
 -- 周总结表
@@ -7,7 +7,7 @@ import logging
 import threading
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from contextlib import contextmanager
 
 import config
@@ -19,12 +19,34 @@ from core.types import (
 )
 from database.connection_pool import ConnectionPool, PoolExhaustedError
 
+# orjson 为可选加速：读取卡片时每行都要解析 app_sites_json，未安装时回退标准库
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 logger = logging.getLogger(__name__)
 
 
 class StorageManager:
     """SQLite 数据库管理器 - 使用连接池"""
     
+    # 会话内缓存的设置项：API 凭据读取频繁（每次生成总结、开始录制都会读），且只在设置页修改
+    SESSION_CACHED_SETTINGS = frozenset({"api_key", "api_url"})
+    
+    # 构造 ActivityCard 所需的列（_row_to_card 只读取这些列，不取 batch_id、created_at 等）
+    CARD_COLUMNS = "id, category, title, summary, start_time, end_time, app_sites_json, productivity_score"
+    
+    # 按时间段取卡片（时间轴切换日期、统计页共用）：SQL 文本固定不变，sqlite3 连接的预编译语句缓存可以直接命中
+    CARDS_IN_RANGE_SQL = (
+        f"SELECT {CARD_COLUMNS} FROM timeline_cards "
+        "WHERE start_time >= ? AND start_time <= ? "
+        "ORDER BY start_time ASC"
+    )
+    
     def __init__(self, db_path: Optional[Path] = None, use_pool: bool = True):
         """
         初始化数据库管理器
@@ -37,6 +59,7 @@ class StorageManager:
         self._use_pool = use_pool
         self._pool: Optional[ConnectionPool] = None
         self._local = threading.local()  # 线程本地存储（兼容模式）
+        self._settings_cache: Dict[str, str] = {}  # SESSION_CACHED_SETTINGS 的内存缓存
         
         logger.info(f"数据库路径: {self.db_path}")
         
@@ -218,6 +241,9 @@ class StorageManager:
     
     def close(self):
         """关闭数据库连接"""
+        # 不让凭据在内存中停留超过必要时间
+        self._settings_cache.clear()
+        
         if self._use_pool and self._pool:
             # 关闭连接池
             self._pool.close_all()
@@ -381,7 +407,7 @@ class StorageManager:
         """将数据库行转换为 AnalysisBatch 对象"""
         return AnalysisBatch(
             id=row["id"],
-            chunk_ids=json.loads(row["chunk_ids"]),
+            chunk_ids=_json_loads(row["chunk_ids"]),
             start_time=datetime.fromisoformat(row["start_time"]) if row["start_time"] else None,
             end_time=datetime.fromisoformat(row["end_time"]) if row["end_time"] else None,
             status=BatchStatus(row["status"]),
@@ -418,24 +444,82 @@ class StorageManager:
         """获取指定日期的时间轴卡片"""
         start = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-        
+        return self.get_cards_in_range(start, end)
+    
+    def get_cards_in_range(self, start: datetime, end: datetime) -> List[ActivityCard]:
+        """
+        获取时间段内的时间轴卡片（单次查询，按开始时间升序）
+
+        Args:
+            start: 开始时间（包含）
+            end: 结束时间（包含）
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(self.CARDS_IN_RANGE_SQL, (start.isoformat(), end.isoformat()))
+            return [self._row_to_card(row) for row in cursor.fetchall()]
+    
+    def get_period_summary(self, start: datetime, end: datetime) -> dict:
+        """
+        在数据库端汇总指定时间段内的卡片统计（单次查询，不构造卡片对象）
+
+        Args:
+            start: 开始时间（包含）
+            end: 结束时间（包含）
+
+        Returns:
+            包含 total_minutes, score_sum, score_count, deep_work_count, activity_count 的字典
+        """
         with self._get_connection() as conn:
             cursor = conn.execute(
                 """
-                SELECT * FROM timeline_cards 
-                WHERE start_time >= ? AND start_time <= ?
-                ORDER BY start_time ASC
+                SELECT
+                    COALESCE(SUM(duration), 0) AS total_minutes,
+                    COALESCE(SUM(CASE WHEN productivity_score > 0 THEN productivity_score ELSE 0 END), 0) AS score_sum,
+                    COALESCE(SUM(CASE WHEN productivity_score > 0 THEN 1 ELSE 0 END), 0) AS score_count,
+                    COALESCE(SUM(CASE WHEN duration >= 60 THEN 1 ELSE 0 END), 0) AS deep_work_count,
+                    COUNT(*) AS activity_count
+                FROM (
+                    SELECT
+                        productivity_score,
+                        COALESCE(ROUND((julianday(end_time) - julianday(start_time)) * 86400.0, 3), 0) / 60.0 AS duration
+                    FROM timeline_cards
+                    WHERE start_time >= ? AND start_time <= ?
+                )
                 """,
                 (start.isoformat(), end.isoformat())
             )
-            return [self._row_to_card(row) for row in cursor.fetchall()]
+            row = cursor.fetchone()
+            return {
+                "total_minutes": row["total_minutes"],
+                "score_sum": row["score_sum"],
+                "score_count": row["score_count"],
+                "deep_work_count": row["deep_work_count"],
+                "activity_count": row["activity_count"],
+            }
+
+    def get_cards_revision(self) -> int:
+        """
+        获取时间轴卡片的数据修订号（插入/更新/删除时由触发器自增）
+        
+        Returns:
+            当前修订号，读取失败时返回 -1
+        """
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    "SELECT revision FROM data_revisions WHERE table_name = 'timeline_cards'"
+                ).fetchone()
+                return row["revision"] if row else -1
+        except Exception as e:
+            logger.warning(f"读取卡片修订号失败: {e}")
+            return -1
     
     def get_cards_before_time(self, time: datetime, limit: int = 10) -> List[ActivityCard]:
         """获取指定时间之前的卡片（用作合并上下文）"""
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                SELECT * FROM timeline_cards 
+                f"""
+                SELECT {self.CARD_COLUMNS} FROM timeline_cards 
                 WHERE start_time < ?
                 ORDER BY start_time DESC
                 LIMIT ?
@@ -451,8 +535,8 @@ class StorageManager:
         """获取指定时间之后的卡片"""
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                SELECT * FROM timeline_cards 
+                f"""
+                SELECT {self.CARD_COLUMNS} FROM timeline_cards 
                 WHERE start_time >= ?
                 ORDER BY start_time ASC
                 LIMIT ?
@@ -465,8 +549,8 @@ class StorageManager:
         """获取最近的卡片（用作上下文）"""
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                SELECT * FROM timeline_cards 
+                f"""
+                SELECT {self.CARD_COLUMNS} FROM timeline_cards 
                 ORDER BY end_time DESC 
                 LIMIT ?
                 """,
@@ -482,7 +566,7 @@ class StorageManager:
             title=row["title"],
             summary=row["summary"],
             start_time=datetime.fromisoformat(row["start_time"]) if row["start_time"] else None,
-            app_sites=[AppSite.from_dict(a) for a in json.loads(row["app_sites_json"] or "[]")],
+            app_sites=[AppSite.from_dict(a) for a in _json_loads(row["app_sites_json"] or "[]")],
             productivity_score=row["productivity_score"]
         )
         
@@ -800,7 +884,7 @@ class StorageManager:
                     content=row["content"],
                     timestamp=datetime.fromisoformat(row["timestamp"]),
                     category=row["category"],
-                    notes=json.loads(row["notes_json"])
+                    notes=_json_loads(row["notes_json"])
                 )
                 cards.append(card)
             
@@ -829,7 +913,7 @@ class StorageManager:
                     content=row["content"],
                     timestamp=datetime.fromisoformat(row["timestamp"]),
                     category=row["category"],
-                    notes=json.loads(row["notes_json"])
+                    notes=_json_loads(row["notes_json"])
                 )
                 cards.append(card)
             
@@ -838,7 +922,11 @@ class StorageManager:
     # ==================== Settings ====================
     
     def get_setting(self, key: str, default: str = "") -> str:
-        """获取设置值 - 使用独立连接确保读取最新数据"""
+        """获取设置值 - 使用独立连接确保读取最新数据（API 凭据走会话缓存）"""
+        cached = self._settings_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             conn = sqlite3.connect(str(self.db_path), timeout=10.0)
             conn.row_factory = sqlite3.Row
@@ -848,29 +936,71 @@ class StorageManager:
             row = cursor.fetchone()
             conn.close()
             value = row["value"] if row else default
-            logger.debug(f"读取设置 {key}: {'已找到' if row else '使用默认值'}")
+            if row and key in self.SESSION_CACHED_SETTINGS:
+                self._settings_cache[key] = value
+            logger.debug("读取设置 %s: %s", key, '已找到' if row else '使用默认值')
             return value
         except Exception as e:
             logger.error(f"读取设置失败 {key}: {e}")
             return default
     
+    def get_settings(self, defaults: Dict[str, str]) -> Dict[str, str]:
+        """批量获取设置值 - 一个连接、一条查询读出多项，缺失的项使用 defaults 中的默认值"""
+        values = dict(defaults)
+        pending = []
+        for key in defaults:
+            cached = self._settings_cache.get(key)
+            if cached is None:
+                pending.append(key)
+            else:
+                values[key] = cached
+        if not pending:
+            return values
+        
+        try:
+            conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+            placeholders = ", ".join("?" * len(pending))
+            cursor = conn.execute(
+                f"SELECT key, value FROM settings WHERE key IN ({placeholders})", pending
+            )
+            rows = cursor.fetchall()
+            conn.close()
+            for key, value in rows:
+                values[key] = value
+                if key in self.SESSION_CACHED_SETTINGS:
+                    self._settings_cache[key] = value
+            logger.debug("批量读取设置 %d 项，命中 %d 项", len(pending), len(rows))
+        except Exception as e:
+            logger.error(f"批量读取设置失败: {e}")
+        return values
+    
     def set_setting(self, key: str, value: str):
         """设置值 - 使用独立连接确保立即写入"""
+        self.set_settings({key: value})
+    
+    def set_settings(self, items: Dict[str, str]):
+        """批量设置值 - 一次事务、一次 checkpoint 写入多项，避免逐项提交"""
+        if not items:
+            return
+        keys = ", ".join(items)
         try:
             conn = sqlite3.connect(str(self.db_path), timeout=10.0)
             conn.execute("PRAGMA synchronous=FULL")
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO settings (key, value, updated_at) 
                 VALUES (?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(key) DO UPDATE SET value = ?, updated_at = CURRENT_TIMESTAMP
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
                 """,
-                (key, value, value)
+                items.items()
             )
             conn.commit()
             # 强制 checkpoint 确保 WAL 数据写入主文件
             conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             conn.close()
-            logger.info(f"已保存设置 {key}")
+            for key, value in items.items():
+                if key in self.SESSION_CACHED_SETTINGS:
+                    self._settings_cache[key] = value
+            logger.info(f"已保存设置 {keys}")
         except Exception as e:
-            logger.error(f"保存设置失败 {key}: {e}")
+            logger.error(f"保存设置失败 {keys}: {e}")
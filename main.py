@@ -148,8 +148,10 @@ def main():
     app.setApplicationVersion(config.VERSION)
     app.setOrganizationName("Dayflow")
     
-    # 设置默认字体
-    font = QFont("Segoe UI", 10)
+    # 设置默认字体（应用级统一设置，样式表中不再逐个控件声明 font-family）
+    font = QFont()
+    font.setFamilies(["Segoe UI", "Microsoft YaHei UI", "Microsoft YaHei"])
+    font.setPointSize(10)
     app.setFont(font)
     
     # 设置应用样式
@@ -170,8 +172,8 @@ def main():
     # 检测自启动路径变化
     check_autostart_path()
     
-    # 创建主窗口
-    window = MainWindow()
+    # 创建主窗口（复用上面的 StorageManager，避免再建一个连接池并重复初始化数据库）
+    window = MainWindow(storage=storage)
     
     # 根据参数决定是否显示窗口
     if args.minimized:
@@ -2,8 +2,10 @@
 Dayflow Windows - 每日事件视图组件
 """
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Tuple
 import sys
 
 logger = logging.getLogger(__name__)
@@ -14,9 +16,10 @@ if sys.platform == 'win32':
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
     QFrame, QSizePolicy, QPushButton, QTextBrowser, QStackedWidget,
-    QSplitter, QCalendarWidget, QDialog, QTableView, QToolButton, QMessageBox
+    QSplitter, QCalendarWidget, QDialog, QTableView, QToolButton, QMessageBox,
+    QButtonGroup
 )
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QDate
+from PySide6.QtCore import Qt, Signal, Slot, QPropertyAnimation, QEasingCurve, QDate, QTimer
 from PySide6.QtGui import QPalette, QColor, QIcon, QFont
 from ui.themes import show_information, show_warning, show_critical, show_question
 
@@ -49,6 +52,149 @@ if sys.platform == 'win32':
             logger.debug(f"设置标题栏颜色失败: {e}")
 
 
+WEEKDAY_NAMES = ("周一", "周二", "周三", "周四", "周五", "周六", "周日")
+
+
+@lru_cache(maxsize=512)
+def _format_header_date(ordinal: int, today_ordinal: int) -> str:
+    """格式化头部日期文字（今天/昨天/明天 或 MM月DD日，加星期），按日期序号缓存"""
+    offset = ordinal - today_ordinal
+    if offset == 0:
+        date_text = "今天"
+    elif offset == -1:
+        date_text = "昨天"
+    elif offset == 1:
+        date_text = "明天"
+    else:
+        date_text = date.fromordinal(ordinal).strftime("%m月%d日")
+    
+    return f"{date_text}，{WEEKDAY_NAMES[date.fromordinal(ordinal).weekday()]}"
+
+
+# 每日/每周总结视图共用的样式模板（按主题格式化一次后缓存）
+_SUMMARY_BUTTON_QSS = """
+            QPushButton {{
+                background-color: {accent};
+                color: white;
+                border: none;
+                border-radius: 8px;
+                font-size: 15px;
+                font-weight: 600;
+            }}
+            QPushButton:hover {{
+                background-color: {accent_hover};
+            }}
+            QPushButton:pressed {{
+                background-color: {accent_hover};
+            }}
+            QPushButton:disabled {{
+                background-color: {border};
+                color: {text_muted};
+            }}
+        """
+
+_SUMMARY_TEXT_QSS = """
+            QTextBrowser {{
+                background-color: {bg_secondary};
+                color: {text_primary};
+                border: 1px solid {border};
+                border-radius: 12px;
+                padding: 24px;
+                font-size: 15px;
+                line-height: 1.8;
+            }}
+            QTextBrowser h1 {{
+                font-size: 24px;
+                font-weight: bold;
+                margin: 16px 0 8px 0;
+                color: {text_primary};
+            }}
+            QTextBrowser h2 {{
+                font-size: 20px;
+                font-weight: bold;
+                margin: 14px 0 6px 0;
+                color: {text_primary};
+            }}
+            QTextBrowser h3 {{
+                font-size: 18px;
+                font-weight: bold;
+                margin: 12px 0 6px 0;
+                color: {text_primary};
+            }}
+            QTextBrowser ul, QTextBrowser ol {{
+                margin: 8px 0 8px 24px;
+            }}
+            QTextBrowser li {{
+                margin: 4px 0;
+            }}
+            QTextBrowser strong {{
+                font-weight: bold;
+                color: {text_primary};
+            }}
+            QTextBrowser code {{
+                background-color: {bg_tertiary};
+                color: {text_secondary};
+                padding: 2px 6px;
+                border-radius: 4px;
+                font-family: "Consolas", "Courier New", monospace;
+                font-size: 14px;
+            }}
+            QTextBrowser pre {{
+                background-color: {bg_tertiary};
+                padding: 12px;
+                border-radius: 8px;
+                margin: 8px 0;
+            }}
+            QTextBrowser pre code {{
+                background-color: transparent;
+                padding: 0;
+            }}
+        """
+
+_summary_style_cache = {}
+
+
+def _summary_styles():
+    """返回当前主题下的 (按钮样式, 总结文本样式)，每个主题只格式化一次"""
+    t = get_theme()
+    styles = _summary_style_cache.get(t.name)
+    if styles is None:
+        fields = vars(t)
+        styles = (_SUMMARY_BUTTON_QSS.format(**fields), _SUMMARY_TEXT_QSS.format(**fields))
+        _summary_style_cache[t.name] = styles
+    return styles
+
+
+# 总结显示的最大字符数，超出部分截断显示（完整内容仍保存在数据库中）
+MAX_SUMMARY_DISPLAY_CHARS = 200_000
+
+
+def _set_summary_markdown(browser: QTextBrowser, text: str):
+    """渲染 Markdown 总结；与当前显示的源文本相同时跳过，避免重建文档和重新排版"""
+    if browser.property("markdownSource") == text:
+        return
+    if not text:
+        browser.clear()
+    elif len(text) > MAX_SUMMARY_DISPLAY_CHARS:
+        # 防止模型输出失控时超长文本导致排版卡死
+        browser.setMarkdown(text[:MAX_SUMMARY_DISPLAY_CHARS] + "\n\n... [总结过长，已截断显示]")
+    else:
+        browser.setMarkdown(text)
+    browser.setProperty("markdownSource", text)
+
+
+def _summary_source_text(browser: QTextBrowser) -> str:
+    """获取总结的完整源文本（未截断的 Markdown），没有时退回显示的纯文本"""
+    source = browser.property("markdownSource")
+    return source if source is not None else browser.toPlainText()
+
+
+def _set_summary_plain_text(browser: QTextBrowser, text: str):
+    """显示纯文本状态信息（生成中/失败提示），并清除 Markdown 源文本记录"""
+    browser.setPlainText(text)
+    browser.setProperty("markdownSource", None)
+
+
 class DailyEventHeader(QWidget):
     """每日事件头部 - 显示日期选择器、导出和统计"""
     
@@ -201,21 +347,9 @@ class DailyEventHeader(QWidget):
     
     def _update_date_display(self):
         """更新日期显示"""
-        today = datetime.now().date()
-        
-        if self._current_date.date() == today:
-            date_text = "今天"
-        elif self._current_date.date() == today - timedelta(days=1):
-            date_text = "昨天"
-        elif self._current_date.date() == today + timedelta(days=1):
-            date_text = "明天"
-        else:
-            date_text = self._current_date.strftime("%m月%d日")
-        
-        weekday_names = ["周一", "周二", "周三", "周四", "周五", "周六", "周日"]
-        weekday = weekday_names[self._current_date.weekday()]
-        
-        self.date_label.setText(f"{date_text}，{weekday}")
+        self.date_label.setText(
+            _format_header_date(self._current_date.toordinal(), date.today().toordinal())
+        )
     
     def _update_stats_display(self):
         """更新统计信息显示"""
@@ -230,32 +364,35 @@ class DailyEventHeader(QWidget):
         self._total_hours = total_hours
         self._update_stats_display()
     
+    def _change_date(self, date: datetime):
+        """切换到指定日期；仍是同一天时不发信号，避免重复加载"""
+        if date.date() == self._current_date.date():
+            return
+        self._current_date = date
+        self._update_date_display()
+        self.date_changed.emit(date)
+    
+    @Slot()
     def _go_previous_day(self):
         """前一天"""
-        self._current_date -= timedelta(days=1)
-        self._update_date_display()
-        self.date_changed.emit(self._current_date)
+        self._change_date(self._current_date - timedelta(days=1))
     
+    @Slot()
     def _go_next_day(self):
         """后一天"""
-        self._current_date += timedelta(days=1)
-        self._update_date_display()
-        self.date_changed.emit(self._current_date)
+        self._change_date(self._current_date + timedelta(days=1))
     
+    @Slot()
     def _go_today(self):
         """跳转到今天"""
-        self._current_date = datetime.now()
-        self._update_date_display()
-        self.date_changed.emit(self._current_date)
+        self._change_date(datetime.now())
     
+    @Slot()
     def _show_calendar(self):
         """显示日历选择器"""
         dialog = ActivityCalendarDialog(self._current_date, self.storage, self)
         if dialog.exec() == QDialog.Accepted:
-            selected_date = dialog.get_selected_date()
-            self._current_date = selected_date
-            self._update_date_display()
-            self.date_changed.emit(selected_date)
+            self._change_date(dialog.get_selected_date())
     
     def set_date(self, date: datetime):
         """设置日期"""
@@ -371,7 +508,8 @@ class ActivityCalendarDialog(QDialog):
     
     def _on_date_selected(self, date):
         """日期选择事件"""
-        self._selected_date = datetime(date.year(), date.month(), date.day())
+        # toPython() 一次跨越绑定拿到 date，取代 year()/month()/day() 三次调用
+        self._selected_date = datetime.combine(date.toPython(), time.min)
         self.accept()
     
     def get_selected_date(self):
@@ -382,6 +520,9 @@ class ActivityCalendarDialog(QDialog):
 class DailySummaryView(QWidget):
     """每日总结视图"""
     
+    # 每日总结缓存的最大日期数
+    SUMMARY_CACHE_SIZE = 64
+    
     def __init__(self, storage=None, parent=None):
         super().__init__(parent)
         self._cards = []
@@ -390,6 +531,9 @@ class DailySummaryView(QWidget):
         self._is_generating = False
         self._event_summary_generated = False
         self._storage = storage
+        self._workers = set()  # 运行中的总结线程，线程真正结束后才释放引用
+        # 按日期缓存已加载的总结，来回切换日期时不再重复查库
+        self._summary_cache: "OrderedDict[date, Tuple[Optional[str], Optional[str]]]" = OrderedDict()
         self._setup_ui()
         self.apply_theme()
         get_theme_manager().theme_changed.connect(self.apply_theme)
@@ -477,12 +621,12 @@ class DailySummaryView(QWidget):
         self._is_generating = True
         self.event_summary_btn.setEnabled(False)
         
-        self.event_summary_text.setPlainText("正在生成每日事件总结，请稍候...")
+        _set_summary_plain_text(self.event_summary_text, "正在生成每日事件总结，请稍候...")
         
         from PySide6.QtCore import QThread, Signal
         
         class EventSummaryWorker(QThread):
-            finished = Signal(str)
+            summary_ready = Signal(str)  # 不覆盖 QThread.finished，后者用于线程结束后的清理
             error = Signal(str)
             
             def __init__(self, cards, date, thinking_mode=None, storage=None):
@@ -520,16 +664,16 @@ class DailySummaryView(QWidget):
                             api_key=api_key,
                             model=summary_model
                         )
-                    self.finished.emit(event_summary)
+                    self.summary_ready.emit(event_summary)
                 except Exception as e:
                     self.error.emit(str(e))
         
         import config
         thinking_mode = config.SUMMARY_THINKING_MODE
-        self.worker = EventSummaryWorker(self._cards, self._date, thinking_mode, self._storage)
-        self.worker.finished.connect(self._on_event_summary_finished)
-        self.worker.error.connect(self._on_summary_error)
-        self.worker.start()
+        worker = EventSummaryWorker(self._cards, self._date, thinking_mode, self._storage)
+        worker.summary_ready.connect(self._on_event_summary_finished)
+        worker.error.connect(self._on_summary_error)
+        self._start_worker(worker)
     
     def _generate_inspiration_summary(self):
         """生成灵感总结（基于事件总结和灵感卡片）"""
@@ -568,12 +712,12 @@ class DailySummaryView(QWidget):
         self._is_generating = True
         self.inspiration_summary_btn.setEnabled(False)
         
-        self.inspiration_summary_text.setPlainText("正在生成每日灵感总结，请稍候...")
+        _set_summary_plain_text(self.inspiration_summary_text, "正在生成每日灵感总结，请稍候...")
         
         from PySide6.QtCore import QThread, Signal
         
         class InspirationSummaryWorker(QThread):
-            finished = Signal(str)
+            summary_ready = Signal(str)  # 不覆盖 QThread.finished，后者用于线程结束后的清理
             error = Signal(str)
             
             def __init__(self, event_summary, inspiration_cards, date, thinking_mode=None, storage=None):
@@ -616,18 +760,24 @@ class DailySummaryView(QWidget):
                             model=summary_model
                         )
                     logger.info("灵感总结生成完成")
-                    self.finished.emit(inspiration_summary)
+                    self.summary_ready.emit(inspiration_summary)
                 except Exception as e:
                     logger.error(f"灵感总结生成失败: {e}")
                     self.error.emit(str(e))
         
         import config
         thinking_mode = config.SUMMARY_THINKING_MODE
-        event_summary = self.event_summary_text.toPlainText() if self._event_summary_generated else ""
-        self.worker = InspirationSummaryWorker(event_summary, self._inspiration_cards, self._date, thinking_mode, self._storage)
-        self.worker.finished.connect(self._on_inspiration_summary_finished)
-        self.worker.error.connect(self._on_summary_error)
-        self.worker.start()
+        event_summary = _summary_source_text(self.event_summary_text) if self._event_summary_generated else ""
+        worker = InspirationSummaryWorker(event_summary, self._inspiration_cards, self._date, thinking_mode, self._storage)
+        worker.summary_ready.connect(self._on_inspiration_summary_finished)
+        worker.error.connect(self._on_summary_error)
+        self._start_worker(worker)
+    
+    def _start_worker(self, worker):
+        """启动总结线程，并在线程结束后释放引用"""
+        self._workers.add(worker)
+        worker.finished.connect(lambda: self._workers.discard(worker))
+        worker.start()
     
     def _on_event_summary_finished(self, event_summary: str):
         """事件总结生成完成"""
@@ -636,9 +786,10 @@ class DailySummaryView(QWidget):
         self.event_summary_btn.setEnabled(True)
         self.inspiration_summary_btn.setEnabled(True)
         
-        self.event_summary_text.setMarkdown(event_summary if event_summary else "暂无事件总结")
+        _set_summary_markdown(self.event_summary_text, event_summary if event_summary else "暂无事件总结")
         
         if self._storage:
+            self._summary_cache.pop(self._date.date(), None)
             try:
                 self._storage.save_daily_summary(self._date, event_summary, None)
                 logger.info(f"已保存 {self._date.strftime('%Y-%m-%d')} 的事件总结")
@@ -653,11 +804,12 @@ class DailySummaryView(QWidget):
         self._is_generating = False
         self.inspiration_summary_btn.setEnabled(True)
         
-        self.inspiration_summary_text.setMarkdown(inspiration_summary if inspiration_summary else "暂无灵感总结")
+        _set_summary_markdown(self.inspiration_summary_text, inspiration_summary if inspiration_summary else "暂无灵感总结")
         
         if self._storage:
+            self._summary_cache.pop(self._date.date(), None)
             try:
-                event_summary = self.event_summary_text.toPlainText()
+                event_summary = _summary_source_text(self.event_summary_text)
                 self._storage.save_daily_summary(self._date, event_summary, inspiration_summary)
                 logger.info(f"已保存 {self._date.strftime('%Y-%m-%d')} 的灵感总结")
             except Exception as e:
@@ -672,8 +824,8 @@ class DailySummaryView(QWidget):
         self.event_summary_btn.setEnabled(True)
         self.inspiration_summary_btn.setEnabled(True)
         
-        self.event_summary_text.setPlainText(f"生成失败: {error_msg}")
-        self.inspiration_summary_text.setPlainText(f"生成失败: {error_msg}")
+        _set_summary_plain_text(self.event_summary_text, f"生成失败: {error_msg}")
+        _set_summary_plain_text(self.inspiration_summary_text, f"生成失败: {error_msg}")
         show_critical(self, "错误", f"总结生成失败:\n{error_msg}")
     
     def set_cards(self, cards: List[ActivityCard]):
@@ -688,125 +840,57 @@ class DailySummaryView(QWidget):
     def set_storage(self, storage):
         """设置存储管理器"""
         self._storage = storage
-        self._load_weekly_summaries_from_database()
+        self._summary_cache.clear()
         self._load_summary()
     
+    def _get_summary(self, target: datetime) -> Tuple[Optional[str], Optional[str]]:
+        """获取指定日期的总结（LRU 缓存，未命中时查库；空结果不缓存，以便看到导入等外部写入）"""
+        key = target.date()
+        if key in self._summary_cache:
+            self._summary_cache.move_to_end(key)
+            return self._summary_cache[key]
+        
+        summary = self._storage.get_daily_summary(target)
+        if not any(summary):
+            return summary
+        self._summary_cache[key] = summary
+        if len(self._summary_cache) > self.SUMMARY_CACHE_SIZE:
+            self._summary_cache.popitem(last=False)
+        return summary
+    
     def _load_summary(self):
         """加载已保存的每日总结"""
         if not self._storage:
             return
         
         try:
-            event_summary, inspiration_summary = self._storage.get_daily_summary(self._date)
+            event_summary, inspiration_summary = self._get_summary(self._date)
             if event_summary:
-                self.event_summary_text.setMarkdown(event_summary)
+                _set_summary_markdown(self.event_summary_text, event_summary)
             else:
-                self.event_summary_text.clear()
+                _set_summary_markdown(self.event_summary_text, "")
             
             if inspiration_summary:
-                self.inspiration_summary_text.setMarkdown(inspiration_summary)
+                _set_summary_markdown(self.inspiration_summary_text, inspiration_summary)
             else:
-                self.inspiration_summary_text.clear()
+                _set_summary_markdown(self.inspiration_summary_text, "")
         except Exception as e:
             logger.error(f"加载每日总结失败: {e}")
     
-    def set_cards(self, cards: List[ActivityCard]):
-        """设置活动卡片"""
-        self._cards = cards
-    
     def set_inspiration_cards(self, inspiration_cards: List):
         """设置灵感卡片"""
-        logger.info(f"设置灵感卡片，日期: {self._date}, 卡片数量: {len(inspiration_cards) if inspiration_cards else 0}")
+        logger.info("设置灵感卡片，日期: %s, 卡片数量: %d", self._date, len(inspiration_cards) if inspiration_cards else 0)
         self._inspiration_cards = inspiration_cards
 
     def apply_theme(self):
         """应用主题"""
-        t = get_theme()
+        button_style, summary_style = _summary_styles()
         
         # 总结按钮样式
-        button_style = f"""
-            QPushButton {{
-                background-color: {t.accent};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 15px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {t.accent_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {t.accent_hover};
-            }}
-            QPushButton:disabled {{
-                background-color: {t.border};
-                color: {t.text_muted};
-            }}
-        """
         self.event_summary_btn.setStyleSheet(button_style)
         self.inspiration_summary_btn.setStyleSheet(button_style)
         
         # 文本浏览器样式（Markdown 渲染）
-        summary_style = f"""
-            QTextBrowser {{
-                background-color: {t.bg_secondary};
-                color: {t.text_primary};
-                border: 1px solid {t.border};
-                border-radius: 12px;
-                padding: 24px;
-                font-size: 15px;
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
-                line-height: 1.8;
-            }}
-            QTextBrowser h1 {{
-                font-size: 24px;
-                font-weight: bold;
-                margin: 16px 0 8px 0;
-                color: {t.text_primary};
-            }}
-            QTextBrowser h2 {{
-                font-size: 20px;
-                font-weight: bold;
-                margin: 14px 0 6px 0;
-                color: {t.text_primary};
-            }}
-            QTextBrowser h3 {{
-                font-size: 18px;
-                font-weight: bold;
-                margin: 12px 0 6px 0;
-                color: {t.text_primary};
-            }}
-            QTextBrowser ul, QTextBrowser ol {{
-                margin: 8px 0 8px 24px;
-            }}
-            QTextBrowser li {{
-                margin: 4px 0;
-            }}
-            QTextBrowser strong {{
-                font-weight: bold;
-                color: {t.text_primary};
-            }}
-            QTextBrowser code {{
-                background-color: {t.bg_tertiary};
-                color: {t.text_secondary};
-                padding: 2px 6px;
-                border-radius: 4px;
-                font-family: "Consolas", "Courier New", monospace;
-                font-size: 14px;
-            }}
-            QTextBrowser pre {{
-                background-color: {t.bg_tertiary};
-                padding: 12px;
-                border-radius: 8px;
-                margin: 8px 0;
-            }}
-            QTextBrowser pre code {{
-                background-color: transparent;
-                padding: 0;
-            }}
-        """
-        
         self.event_summary_text.setStyleSheet(summary_style)
         self.inspiration_summary_text.setStyleSheet(summary_style)
 
@@ -823,10 +907,22 @@ class WeeklySummaryView(QWidget):
         self._event_summary_generated = False
         self._storage = storage
         self._workers = {}
+        self._needs_load = True  # 页面隐藏期间日期变化时只做标记，切换到该页时再查库
         self._setup_ui()
         self.apply_theme()
         get_theme_manager().theme_changed.connect(self.apply_theme)
-        self._load_weekly_summaries_from_database()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._needs_load:
+            self._load_weekly_summaries_from_database()
+    
+    def _load_when_visible(self):
+        """页面可见时立即加载，否则推迟到下次显示"""
+        if self.isVisible():
+            self._load_weekly_summaries_from_database()
+        else:
+            self._needs_load = True
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -896,7 +992,7 @@ class WeeklySummaryView(QWidget):
         self.event_summary_btn.setEnabled(False)
         
         if not self._storage:
-            self.event_summary_text.setPlainText("错误：未设置存储管理器")
+            _set_summary_plain_text(self.event_summary_text, "错误：未设置存储管理器")
             self._is_generating = False
             self.event_summary_btn.setEnabled(True)
             return
@@ -926,7 +1022,7 @@ class WeeklySummaryView(QWidget):
             self._generate_weekly_event_summary(daily_summaries, missing_days)
         except Exception as e:
             logger.error(f"生成本周事件总结失败: {e}")
-            self.event_summary_text.setPlainText(f"生成失败: {e}")
+            _set_summary_plain_text(self.event_summary_text, f"生成失败: {e}")
             self._is_generating = False
             self.event_summary_btn.setEnabled(True)
     
@@ -935,7 +1031,7 @@ class WeeklySummaryView(QWidget):
         from PySide6.QtCore import QThread, Signal
         
         class WeeklyEventSummaryWorker(QThread):
-            finished = Signal(str)
+            summary_ready = Signal(str)  # 不覆盖 QThread.finished，后者用于线程结束后的清理
             error = Signal(str)
             
             def __init__(self, daily_summaries, missing_days, end_date, storage=None):
@@ -969,37 +1065,35 @@ class WeeklySummaryView(QWidget):
                         api_key=api_key
                     )
                     
-                    self.finished.emit(event_summary)
+                    self.summary_ready.emit(event_summary)
                 except Exception as e:
                     logger.error(f"生成每周事件总结失败: {e}")
                     self.error.emit(str(e))
         
-        self.event_summary_text.setPlainText("正在生成每周事件总结，请稍候...")
+        _set_summary_plain_text(self.event_summary_text, "正在生成每周事件总结，请稍候...")
         
         worker = WeeklyEventSummaryWorker(daily_summaries, missing_days, self._date, self._storage)
         worker_id = f"weekly_event_{datetime.now().timestamp()}"
         self._workers[worker_id] = worker
         
-        def cleanup():
-            self._workers.pop(worker_id, None)
-        
-        worker.finished.connect(lambda summary: self._on_weekly_event_summary_finished(summary, cleanup))
-        worker.error.connect(lambda error: self._on_weekly_event_summary_error(error, cleanup))
+        worker.summary_ready.connect(self._on_weekly_event_summary_finished)
+        worker.error.connect(self._on_weekly_event_summary_error)
+        # 线程真正结束后再释放引用，避免 QThread 运行中被回收
+        worker.finished.connect(lambda: self._workers.pop(worker_id, None))
         worker.start()
     
-    def _on_weekly_event_summary_finished(self, event_summary, cleanup):
+    def _on_weekly_event_summary_finished(self, event_summary):
         """每周事件总结生成完成"""
-        cleanup()
         self._is_generating = False
         self.event_summary_btn.setEnabled(True)
         
-        self.event_summary_text.setMarkdown(event_summary if event_summary else "暂无事件总结")
+        _set_summary_markdown(self.event_summary_text, event_summary if event_summary else "暂无事件总结")
         
         if self._storage:
             try:
                 week_start = self._date - timedelta(days=6)
                 week_end = self._date
-                inspiration_summary = self.inspiration_summary_text.toPlainText()
+                inspiration_summary = _summary_source_text(self.inspiration_summary_text)
                 self._storage.save_weekly_summary(week_start, week_end, event_summary, inspiration_summary)
                 logger.info(f"已保存本周事件总结 {week_start.strftime('%Y-%m-%d')} 至 {week_end.strftime('%Y-%m-%d')}")
             except Exception as e:
@@ -1008,13 +1102,12 @@ class WeeklySummaryView(QWidget):
         
         show_information(self, "成功", "每周事件总结生成完成！")
     
-    def _on_weekly_event_summary_error(self, error_msg, cleanup):
+    def _on_weekly_event_summary_error(self, error_msg):
         """每周事件总结生成失败"""
-        cleanup()
         self._is_generating = False
         self.event_summary_btn.setEnabled(True)
         
-        self.event_summary_text.setPlainText(f"生成失败: {error_msg}")
+        _set_summary_plain_text(self.event_summary_text, f"生成失败: {error_msg}")
         show_critical(self, "错误", f"每周事件总结生成失败:\n{error_msg}")
     
     def _generate_inspiration_summary(self):
@@ -1026,7 +1119,7 @@ class WeeklySummaryView(QWidget):
         self.inspiration_summary_btn.setEnabled(False)
         
         if not self._storage:
-            self.inspiration_summary_text.setPlainText("错误：未设置存储管理器")
+            _set_summary_plain_text(self.inspiration_summary_text, "错误：未设置存储管理器")
             self._is_generating = False
             self.inspiration_summary_btn.setEnabled(True)
             return
@@ -1056,7 +1149,7 @@ class WeeklySummaryView(QWidget):
             self._generate_weekly_inspiration_summary(daily_summaries, missing_days)
         except Exception as e:
             logger.error(f"生成本周灵感总结失败: {e}")
-            self.inspiration_summary_text.setPlainText(f"生成失败: {e}")
+            _set_summary_plain_text(self.inspiration_summary_text, f"生成失败: {e}")
             self._is_generating = False
             self.inspiration_summary_btn.setEnabled(True)
     
@@ -1065,7 +1158,7 @@ class WeeklySummaryView(QWidget):
         from PySide6.QtCore import QThread, Signal
         
         class WeeklyInspirationSummaryWorker(QThread):
-            finished = Signal(str)
+            summary_ready = Signal(str)  # 不覆盖 QThread.finished，后者用于线程结束后的清理
             error = Signal(str)
             
             def __init__(self, daily_summaries, missing_days, end_date, storage=None):
@@ -1099,31 +1192,29 @@ class WeeklySummaryView(QWidget):
                         api_key=api_key
                     )
                     
-                    self.finished.emit(inspiration_summary)
+                    self.summary_ready.emit(inspiration_summary)
                 except Exception as e:
                     logger.error(f"生成每周灵感总结失败: {e}")
                     self.error.emit(str(e))
         
-        self.inspiration_summary_text.setPlainText("正在生成每周灵感总结，请稍候...")
+        _set_summary_plain_text(self.inspiration_summary_text, "正在生成每周灵感总结，请稍候...")
         
         worker = WeeklyInspirationSummaryWorker(daily_summaries, missing_days, self._date, self._storage)
         worker_id = f"weekly_inspiration_{datetime.now().timestamp()}"
         self._workers[worker_id] = worker
         
-        def cleanup():
-            self._workers.pop(worker_id, None)
-        
-        worker.finished.connect(lambda summary: self._on_weekly_inspiration_summary_finished(summary, cleanup))
-        worker.error.connect(lambda error: self._on_weekly_inspiration_summary_error(error, cleanup))
+        worker.summary_ready.connect(self._on_weekly_inspiration_summary_finished)
+        worker.error.connect(self._on_weekly_inspiration_summary_error)
+        # 线程真正结束后再释放引用，避免 QThread 运行中被回收
+        worker.finished.connect(lambda: self._workers.pop(worker_id, None))
         worker.start()
     
-    def _on_weekly_inspiration_summary_finished(self, inspiration_summary, cleanup):
+    def _on_weekly_inspiration_summary_finished(self, inspiration_summary):
         """每周灵感总结生成完成"""
-        cleanup()
         self._is_generating = False
         self.inspiration_summary_btn.setEnabled(True)
         
-        self.inspiration_summary_text.setMarkdown(inspiration_summary if inspiration_summary else "暂无灵感总结")
+        _set_summary_markdown(self.inspiration_summary_text, inspiration_summary if inspiration_summary else "暂无灵感总结")
         
         if self._storage:
             try:
@@ -1146,13 +1237,12 @@ class WeeklySummaryView(QWidget):
         
         show_information(self, "成功", "每周灵感总结生成完成！")
     
-    def _on_weekly_inspiration_summary_error(self, error_msg, cleanup):
+    def _on_weekly_inspiration_summary_error(self, error_msg):
         """每周灵感总结生成失败"""
-        cleanup()
         self._is_generating = False
         self.inspiration_summary_btn.setEnabled(True)
         
-        self.inspiration_summary_text.setPlainText(f"生成失败: {error_msg}")
+        _set_summary_plain_text(self.inspiration_summary_text, f"生成失败: {error_msg}")
         show_critical(self, "错误", f"每周灵感总结生成失败:\n{error_msg}")
     
     def _get_past_7_days_event_summaries(self):
@@ -1202,17 +1292,18 @@ class WeeklySummaryView(QWidget):
     def set_date(self, date):
         """设置日期"""
         self._date = date
-        self._load_weekly_summaries_from_database()
+        self._load_when_visible()
     
     def set_storage(self, storage):
         """设置存储管理器"""
         self._storage = storage
-        self._load_weekly_summaries_from_database()
+        self._load_when_visible()
     
     def _load_weekly_summaries_from_database(self):
         """从数据库加载每周总结"""
         if not self._storage:
             return
+        self._needs_load = False
         
         try:
             if self._date is None:
@@ -1224,115 +1315,36 @@ class WeeklySummaryView(QWidget):
             event_summary, inspiration_summary = self._storage.get_weekly_summary(week_start, week_end)
             
             if event_summary:
-                self.event_summary_text.setMarkdown(event_summary)
-                logger.info(f"已加载本周事件总结 {week_start.strftime('%Y-%m-%d')} 至 {week_end.strftime('%Y-%m-%d')}")
+                _set_summary_markdown(self.event_summary_text, event_summary)
+                logger.info("已加载本周事件总结 %s 至 %s", week_start.date(), week_end.date())
             else:
-                self.event_summary_text.setMarkdown("")
-                logger.info(f"本周暂无事件总结 {week_start.strftime('%Y-%m-%d')} 至 {week_end.strftime('%Y-%m-%d')}")
+                _set_summary_markdown(self.event_summary_text, "")
+                logger.info("本周暂无事件总结 %s 至 %s", week_start.date(), week_end.date())
             
             if inspiration_summary:
-                self.inspiration_summary_text.setMarkdown(inspiration_summary)
-                logger.info(f"已加载本周灵感总结 {week_start.strftime('%Y-%m-%d')} 至 {week_end.strftime('%Y-%m-%d')}")
+                _set_summary_markdown(self.inspiration_summary_text, inspiration_summary)
+                logger.info("已加载本周灵感总结 %s 至 %s", week_start.date(), week_end.date())
             else:
-                self.inspiration_summary_text.setMarkdown("")
-                logger.info(f"本周暂无灵感总结 {week_start.strftime('%Y-%m-%d')} 至 {week_end.strftime('%Y-%m-%d')}")
+                _set_summary_markdown(self.inspiration_summary_text, "")
+                logger.info("本周暂无灵感总结 %s 至 %s", week_start.date(), week_end.date())
                 
         except Exception as e:
             logger.error(f"加载每周总结失败: {e}")
     
     def set_inspiration_cards(self, inspiration_cards):
         """设置灵感卡片"""
-        logger.info(f"设置灵感卡片，卡片数量: {len(inspiration_cards) if inspiration_cards else 0}")
+        logger.info("设置灵感卡片，卡片数量: %d", len(inspiration_cards) if inspiration_cards else 0)
         self._inspiration_cards = inspiration_cards
 
     def apply_theme(self):
         """应用主题"""
-        t = get_theme()
+        button_style, summary_style = _summary_styles()
         
         # 总结按钮样式
-        button_style = f"""
-            QPushButton {{
-                background-color: {t.accent};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 15px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {t.accent_hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {t.accent_hover};
-            }}
-            QPushButton:disabled {{
-                background-color: {t.border};
-                color: {t.text_muted};
-            }}
-        """
         self.event_summary_btn.setStyleSheet(button_style)
         self.inspiration_summary_btn.setStyleSheet(button_style)
         
         # 文本浏览器样式（Markdown 渲染）
-        summary_style = f"""
-            QTextBrowser {{
-                background-color: {t.bg_secondary};
-                color: {t.text_primary};
-                border: 1px solid {t.border};
-                border-radius: 12px;
-                padding: 24px;
-                font-size: 15px;
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
-                line-height: 1.8;
-            }}
-            QTextBrowser h1 {{
-                font-size: 24px;
-                font-weight: bold;
-                margin: 16px 0 8px 0;
-                color: {t.text_primary};
-            }}
-            QTextBrowser h2 {{
-                font-size: 20px;
-                font-weight: bold;
-                margin: 14px 0 6px 0;
-                color: {t.text_primary};
-            }}
-            QTextBrowser h3 {{
-                font-size: 18px;
-                font-weight: bold;
-                margin: 12px 0 6px 0;
-                color: {t.text_primary};
-            }}
-            QTextBrowser ul, QTextBrowser ol {{
-                margin: 8px 0 8px 24px;
-            }}
-            QTextBrowser li {{
-                margin: 4px 0;
-            }}
-            QTextBrowser strong {{
-                font-weight: bold;
-                color: {t.text_primary};
-            }}
-            QTextBrowser code {{
-                background-color: {t.bg_tertiary};
-                color: {t.text_secondary};
-                padding: 2px 6px;
-                border-radius: 4px;
-                font-family: "Consolas", "Courier New", monospace;
-                font-size: 14px;
-            }}
-            QTextBrowser pre {{
-                background-color: {t.bg_tertiary};
-                padding: 12px;
-                border-radius: 8px;
-                margin: 8px 0;
-            }}
-            QTextBrowser pre code {{
-                background-color: transparent;
-                padding: 0;
-            }}
-        """
-        
         self.event_summary_text.setStyleSheet(summary_style)
         self.inspiration_summary_text.setStyleSheet(summary_style)
 
@@ -1345,6 +1357,8 @@ class SubTabButton(QPushButton):
         self.setCheckable(True)
         self.setFixedHeight(36)
         self.setCursor(Qt.PointingHandCursor)
+        # 只有选中状态真正变化的按钮才重新应用样式
+        self.toggled.connect(self.apply_theme)
     
     def apply_theme(self, checked: bool = False):
         """应用主题"""
@@ -1388,10 +1402,18 @@ class DailyEventView(QWidget):
     card_updated = Signal(ActivityCard)
     card_deleted = Signal(int)
     
+    # 日期切换防抖间隔（毫秒）：连续点击前一天/后一天时只加载最终日期
+    DATE_CHANGE_DEBOUNCE_MS = 150
+    
     def __init__(self, storage=None, parent=None):
         super().__init__(parent)
         self._storage = storage
         self._current_date = datetime.now()
+        self._pending_date: Optional[datetime] = None
+        self._date_change_timer = QTimer(self)
+        self._date_change_timer.setSingleShot(True)
+        self._date_change_timer.setInterval(self.DATE_CHANGE_DEBOUNCE_MS)
+        self._date_change_timer.timeout.connect(self._apply_pending_date)
         self._setup_ui()
         self.apply_theme()
         get_theme_manager().theme_changed.connect(self.apply_theme)
@@ -1406,7 +1428,7 @@ class DailyEventView(QWidget):
         
         # 头部 - 日期选择器、导出和统计
         self.header = DailyEventHeader(storage=self._storage)
-        self.header.date_changed.connect(self._on_date_changed)
+        self.header.date_changed.connect(self._schedule_date_change)
         self.header.export_clicked.connect(self._on_export_clicked)
         main_layout.addWidget(self.header)
         
@@ -1414,23 +1436,29 @@ class DailyEventView(QWidget):
         tabs_layout = QHBoxLayout()
         tabs_layout.setContentsMargins(24, 8, 24, 8)
         
+        # 子选项卡使用互斥按钮组，按钮 ID 即堆栈页索引
+        self.tab_group = QButtonGroup(self)
+        self.tab_group.setExclusive(True)
+        
         self.timeline_tab = SubTabButton("时间轴")
         self.timeline_tab.setChecked(True)
-        self.timeline_tab.clicked.connect(lambda: self._switch_tab(0))
+        self.tab_group.addButton(self.timeline_tab, 0)
         tabs_layout.addWidget(self.timeline_tab)
         
         self.inspiration_tab = SubTabButton("快速记录")
-        self.inspiration_tab.clicked.connect(lambda: self._switch_tab(1))
+        self.tab_group.addButton(self.inspiration_tab, 1)
         tabs_layout.addWidget(self.inspiration_tab)
         
         self.summary_tab = SubTabButton("每日总结")
-        self.summary_tab.clicked.connect(lambda: self._switch_tab(2))
+        self.tab_group.addButton(self.summary_tab, 2)
         tabs_layout.addWidget(self.summary_tab)
         
         self.weekly_summary_tab = SubTabButton("近7日总结")
-        self.weekly_summary_tab.clicked.connect(lambda: self._switch_tab(3))
+        self.tab_group.addButton(self.weekly_summary_tab, 3)
         tabs_layout.addWidget(self.weekly_summary_tab)
         
+        self.tab_group.idClicked.connect(self._switch_tab)
+        
         tabs_layout.addStretch()
         main_layout.addLayout(tabs_layout)
         
@@ -1462,61 +1490,52 @@ class DailyEventView(QWidget):
     
     def apply_theme(self):
         """应用主题"""
-        self.timeline_tab.apply_theme(True)
-        self.inspiration_tab.apply_theme(False)
-        self.summary_tab.apply_theme(False)
-        self.weekly_summary_tab.apply_theme(False)
+        for button in self.tab_group.buttons():
+            button.apply_theme(button.isChecked())
     
     def _switch_tab(self, index: int):
-        """切换子选项卡"""
+        """切换子选项卡（按钮的选中态与样式由按钮组和 toggled 信号维护）"""
         self.stack.setCurrentIndex(index)
+        self.tab_group.button(index).setChecked(True)
         
-        if index == 0:
-            self.timeline_tab.setChecked(True)
-            self.timeline_tab.apply_theme(True)
-            self.inspiration_tab.setChecked(False)
-            self.inspiration_tab.apply_theme(False)
-            self.summary_tab.setChecked(False)
-            self.summary_tab.apply_theme(False)
-            self.weekly_summary_tab.setChecked(False)
-            self.weekly_summary_tab.apply_theme(False)
-        elif index == 1:
-            self.timeline_tab.setChecked(False)
-            self.timeline_tab.apply_theme(False)
-            self.inspiration_tab.setChecked(True)
-            self.inspiration_tab.apply_theme(True)
-            self.summary_tab.setChecked(False)
-            self.summary_tab.apply_theme(False)
-            self.weekly_summary_tab.setChecked(False)
-            self.weekly_summary_tab.apply_theme(False)
-        elif index == 2:
-            self.timeline_tab.setChecked(False)
-            self.timeline_tab.apply_theme(False)
-            self.inspiration_tab.setChecked(False)
-            self.inspiration_tab.apply_theme(False)
-            self.summary_tab.setChecked(True)
-            self.summary_tab.apply_theme(True)
-            self.weekly_summary_tab.setChecked(False)
-            self.weekly_summary_tab.apply_theme(False)
+        if index == 2:
             self.summary_view._load_summary()
-        else:
-            self.timeline_tab.setChecked(False)
-            self.timeline_tab.apply_theme(False)
-            self.inspiration_tab.setChecked(False)
-            self.inspiration_tab.apply_theme(False)
-            self.summary_tab.setChecked(False)
-            self.summary_tab.apply_theme(False)
-            self.weekly_summary_tab.setChecked(True)
-            self.weekly_summary_tab.apply_theme(True)
+    
+    def _schedule_date_change(self, date: datetime):
+        """头部日期改变：记录目标日期并重新计时，停止操作后才真正加载"""
+        self._pending_date = date
+        self._date_change_timer.start()
+    
+    @Slot()
+    def _apply_pending_date(self):
+        """防抖结束，加载最终选中的日期"""
+        if self._pending_date is None:
+            return
+        date = self._pending_date
+        self._pending_date = None
+        if date.date() == self._current_date.date():
+            return  # 防抖期间来回切换后又回到当前日期，无需重新加载
+        self._on_date_changed(date)
+    
+    def _flush_pending_date(self):
+        """立即应用尚未生效的日期切换"""
+        if self._date_change_timer.isActive():
+            self._date_change_timer.stop()
+            self._apply_pending_date()
     
     def _on_date_changed(self, date: datetime):
         """日期改变"""
         self._current_date = date
-        self.timeline_view.set_date(date)
-        self.inspiration_view.set_date(date)
-        self.summary_view.set_date(date)
-        self.weekly_summary_view.set_date(date)
-        self.date_changed.emit(date)
+        # 暂停重绘：各子视图（以及主窗口随后加载的卡片）更新完成后统一重绘一次
+        self.setUpdatesEnabled(False)
+        try:
+            self.timeline_view.set_date(date)
+            self.inspiration_view.set_date(date)
+            self.summary_view.set_date(date)
+            self.weekly_summary_view.set_date(date)
+            self.date_changed.emit(date)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _on_inspiration_updated(self):
         """灵感更新"""
@@ -1524,6 +1543,7 @@ class DailyEventView(QWidget):
     
     def _on_export_clicked(self):
         """导出按钮点击"""
+        self._flush_pending_date()
         cards = self.timeline_view._cards
         self.export_requested.emit(self._current_date, cards)
     
@@ -1537,13 +1557,19 @@ class DailyEventView(QWidget):
     
     def set_date(self, date: datetime):
         """设置日期"""
+        self._date_change_timer.stop()
+        self._pending_date = None
         self._current_date = date
-        self.header.set_date(date)
-        self.timeline_view.set_date(date)
-        self.inspiration_view.set_date(date)
-        self.summary_view.set_date(date)
-        self.summary_view.set_inspiration_cards(self.inspiration_view.get_cards())
-        self.weekly_summary_view.set_date(date)
+        self.setUpdatesEnabled(False)
+        try:
+            self.header.set_date(date)
+            self.timeline_view.set_date(date)
+            self.inspiration_view.set_date(date)
+            self.summary_view.set_date(date)
+            self.summary_view.set_inspiration_cards(self.inspiration_view.get_cards())
+            self.weekly_summary_view.set_date(date)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def get_current_date(self) -> datetime:
         """获取当前查看的日期"""
@@ -12,16 +12,90 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont, QAction, QColor, QPalette
-from ui.themes import show_information, show_warning, show_critical, show_question
+from ui.themes import show_information, show_warning, show_critical, show_question, elide_preview_text
 
 from core.types import InspirationCard
-from ui.themes import get_theme_manager, get_theme, get_category_color
+from ui.themes import get_theme_manager, get_theme, get_category_color, get_category_rgb, get_context_menu_stylesheet, clear_layout
 import sys
 import ctypes
 
 logger = logging.getLogger(__name__)
 
 
+# 灵感卡片样式模板（导入时构造一次，按 主题 + 类别 格式化后缓存复用）
+_CARD_CATEGORY_QSS = """
+    background-color: rgba({r}, {g}, {b}, 0.4);
+    color: {text_primary};
+    padding: 5px 12px;
+    border-radius: 6px;
+    font-size: 12px;
+    font-weight: 600;
+"""
+
+_CARD_TIME_QSS = """
+    QLabel#timeLabel {{
+        color: {text_muted};
+        font-size: 12px;
+    }}
+"""
+
+_CARD_CONTENT_QSS = """
+    QLabel#contentLabel {{
+        color: {text_primary};
+        font-size: 15px;
+        line-height: 1.6;
+        padding: 4px 0;
+    }}
+"""
+
+_CARD_NOTE_QSS = """
+    background-color: {bg_tertiary};
+    color: {text_secondary};
+    padding: 3px 8px;
+    border-radius: 3px;
+    font-size: 11px;
+"""
+
+_CARD_MORE_QSS = """
+    color: {text_muted};
+    font-size: 11px;
+"""
+
+_CARD_FRAME_QSS = """
+    QFrame#inspirationCard {{
+        background-color: {bg_secondary};
+        border: 1px solid {border};
+        border-left: 4px solid {category_color};
+        border-radius: 0px 16px 16px 0px;
+    }}
+    QFrame#inspirationCard:hover {{
+        background-color: {bg_hover};
+        border-color: {accent};
+    }}
+"""
+
+_card_style_cache = {}
+
+
+def _inspiration_card_styles(category: str) -> tuple:
+    """返回当前主题下指定类别卡片的 (类别, 时间, 内容, 备注, +N, 外框) 样式，每个组合只格式化一次"""
+    t = get_theme()
+    key = (t.name, category)
+    styles = _card_style_cache.get(key)
+    if styles is None:
+        r, g, b = get_category_rgb(category)
+        fields = dict(vars(t), r=r, g=g, b=b, category_color=get_category_color(category))
+        styles = tuple(
+            template.format(**fields)
+            for template in (
+                _CARD_CATEGORY_QSS, _CARD_TIME_QSS, _CARD_CONTENT_QSS,
+                _CARD_NOTE_QSS, _CARD_MORE_QSS, _CARD_FRAME_QSS,
+            )
+        )
+        _card_style_cache[key] = styles
+    return styles
+
+
 class InspirationEditDialog(QDialog):
     """灵感编辑对话框"""
     
@@ -348,13 +422,11 @@ class InspirationCardWidget(QFrame):
         super().mousePressEvent(event)
     
     def _setup_ui(self):
-        t = get_theme()
+        # 各标签的样式统一由 apply_theme 设置（构造后立即调用）
         self.setObjectName("inspirationCard")
         self.setFrameShape(QFrame.StyledPanel)
         
-        # 获取类别颜色
         category_text = self.card.category or "灵感"
-        category_color = get_category_color(category_text)
         
         # 主布局
         layout = QVBoxLayout(self)
@@ -367,33 +439,12 @@ class InspirationCardWidget(QFrame):
         
         # 类别标签 - 使用用户定义的类别
         self.category_label = QLabel(category_text)
-        
-        # 解析颜色并转换为 rgba 格式
-        color = QColor(category_color)
-        self.category_color_rgb = (color.red(), color.green(), color.blue())
-        
-        # 使用 rgba() 格式设置带透明度的背景颜色
-        r, g, b = self.category_color_rgb
-        self.category_label.setStyleSheet(f"""
-            background-color: rgba({r}, {g}, {b}, 0.4);
-            color: {t.text_primary};
-            padding: 5px 12px;
-            border-radius: 6px;
-            font-size: 12px;
-            font-weight: 600;
-        """)
         top_layout.addWidget(self.category_label)
         
         # 时间点
         time_str = self.card.timestamp.strftime("%H:%M") if self.card.timestamp else ""
         self.time_label = QLabel(time_str)
         self.time_label.setObjectName("timeLabel")
-        self.time_label.setStyleSheet(f"""
-            QLabel#timeLabel {{
-                color: {t.text_muted};
-                font-size: 12px;
-            }}
-        """)
         top_layout.addWidget(self.time_label)
         top_layout.addStretch()
         
@@ -403,109 +454,41 @@ class InspirationCardWidget(QFrame):
         self.content_label = QLabel(self.card.content)
         self.content_label.setObjectName("contentLabel")
         self.content_label.setWordWrap(True)
-        self.content_label.setStyleSheet(f"""
-            QLabel#contentLabel {{
-                color: {t.text_primary};
-                font-size: 15px;
-                line-height: 1.6;
-                padding: 4px 0;
-            }}
-        """)
         layout.addWidget(self.content_label)
         
         # 备注
         self.note_labels = []
+        self.more_label = None
         if self.card.notes:
             self.notes_layout = QHBoxLayout()
             self.notes_layout.setSpacing(6)
             
             for note in self.card.notes[:4]:
                 note_label = QLabel(f"#{note}")
-                note_label.setStyleSheet(f"""
-                    background-color: {t.bg_tertiary};
-                    color: {t.text_secondary};
-                    padding: 3px 8px;
-                    border-radius: 3px;
-                    font-size: 11px;
-                """)
                 self.notes_layout.addWidget(note_label)
                 self.note_labels.append(note_label)
             
             if len(self.card.notes) > 4:
                 self.more_label = QLabel(f"+{len(self.card.notes) - 4}")
-                self.more_label.setStyleSheet(f"""
-                    color: {t.text_muted};
-                    font-size: 11px;
-                """)
                 self.notes_layout.addWidget(self.more_label)
-                self.note_labels.append(self.more_label)
             
             self.notes_layout.addStretch()
             layout.addLayout(self.notes_layout)
     
     def apply_theme(self):
-        t = get_theme()
-        category_text = self.card.category or "灵感"
-        category_color = get_category_color(category_text)
-        r, g, b = self.category_color_rgb
-        
-        # 更新类别标签颜色
-        self.category_label.setStyleSheet(f"""
-            background-color: rgba({r}, {g}, {b}, 0.4);
-            color: {t.text_primary};
-            padding: 5px 12px;
-            border-radius: 6px;
-            font-size: 12px;
-            font-weight: 600;
-        """)
+        category_qss, time_qss, content_qss, note_qss, more_qss, frame_qss = \
+            _inspiration_card_styles(self.card.category or "灵感")
         
-        # 更新时间标签颜色
-        self.time_label.setStyleSheet(f"""
-            QLabel#timeLabel {{
-                color: {t.text_muted};
-                font-size: 12px;
-            }}
-        """)
-        
-        # 更新内容标签颜色
-        self.content_label.setStyleSheet(f"""
-            QLabel#contentLabel {{
-                color: {t.text_primary};
-                font-size: 15px;
-                line-height: 1.6;
-                padding: 4px 0;
-            }}
-        """)
-        
-        # 更新备注标签颜色
+        self.category_label.setStyleSheet(category_qss)
+        self.time_label.setStyleSheet(time_qss)
+        self.content_label.setStyleSheet(content_qss)
         for note_label in self.note_labels:
-            if hasattr(note_label, 'text') and note_label.text().startswith('#'):
-                note_label.setStyleSheet(f"""
-                    background-color: {t.bg_tertiary};
-                    color: {t.text_secondary};
-                    padding: 3px 8px;
-                    border-radius: 3px;
-                    font-size: 11px;
-                """)
-            else:
-                note_label.setStyleSheet(f"""
-                    color: {t.text_muted};
-                    font-size: 11px;
-                """)
-        
-        # 更新卡片边框和背景
-        self.setStyleSheet(f"""
-            QFrame#inspirationCard {{
-                background-color: {t.bg_secondary};
-                border: 1px solid {t.border};
-                border-left: 4px solid {category_color};
-                border-radius: 0px 16px 16px 0px;
-            }}
-            QFrame#inspirationCard:hover {{
-                background-color: {t.bg_hover};
-                border-color: {t.accent};
-            }}
-        """)
+            note_label.setStyleSheet(note_qss)
+        if self.more_label is not None:
+            self.more_label.setStyleSheet(more_qss)
+        
+        # 卡片边框和背景
+        self.setStyleSheet(frame_qss)
     
     def _set_dark_title_bar(self, is_dark: bool = True):
         """设置 Windows 原生标题栏颜色为暗色"""
@@ -530,24 +513,8 @@ class InspirationCardWidget(QFrame):
     
     def _show_context_menu(self, pos):
         """显示右键菜单"""
-        t = get_theme()
         menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {t.bg_secondary};
-                border: 1px solid {t.border};
-                border-radius: 8px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 8px 24px;
-                border-radius: 4px;
-                color: {t.text_primary};
-            }}
-            QMenu::item:selected {{
-                background-color: {t.bg_hover};
-            }}
-        """)
+        menu.setStyleSheet(get_context_menu_stylesheet())
         
         edit_action = QAction("✏️ 编辑", self)
         edit_action.triggered.connect(lambda: self.edit_requested.emit(self.card))
@@ -566,7 +533,7 @@ class InspirationCardWidget(QFrame):
         reply = show_question(
             self,
             "确认删除",
-            f"确定要删除这条灵感吗？\n\n「{self.card.content[:30]}...」"
+            f"确定要删除这条灵感吗？\n\n「{elide_preview_text(self, self.card.content)}」"
         )
         if reply == QMessageBox.Yes:
             self.delete_requested.emit(self.card.id)
@@ -633,6 +600,12 @@ class InspirationView(QWidget):
         self.cards_layout = QVBoxLayout(self.cards_container)
         self.cards_layout.setContentsMargins(24, 8, 24, 24)
         self.cards_layout.setSpacing(12)
+        
+        # 空状态提示只创建一次，常驻在 stretch 之前，按需显示/隐藏
+        self.empty_label = QLabel("还没有记录任何灵感\n点击上方的按钮开始记录你的想法")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        self.empty_label.hide()
+        self.cards_layout.addWidget(self.empty_label)
         self.cards_layout.addStretch()
         
         scroll.setWidget(self.cards_container)
@@ -706,6 +679,13 @@ class InspirationView(QWidget):
         self.cards_container.setStyleSheet(f"""
             background-color: {t.bg_primary};
         """)
+        
+        self.empty_label.setStyleSheet(f"""
+            color: {t.text_muted};
+            font-size: 14px;
+            line-height: 1.8;
+            padding: 40px;
+        """)
     
     def _on_add_inspiration(self, category: str = "灵感"):
         """添加新灵感"""
@@ -768,24 +748,11 @@ class InspirationView(QWidget):
     
     def _update_cards_display(self):
         """更新卡片显示"""
-        # 清除现有卡片（保留最后的stretch）
-        while self.cards_layout.count() > 1:
-            item = self.cards_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # 清除现有卡片（保留末尾的空状态提示和 stretch）
+        clear_layout(self.cards_layout, keep=2)
         
+        self.empty_label.setVisible(not self._cards)
         if not self._cards:
-            # 显示空状态
-            t = get_theme()
-            empty_label = QLabel("还没有记录任何灵感\n点击上方的按钮开始记录你的想法")
-            empty_label.setAlignment(Qt.AlignCenter)
-            empty_label.setStyleSheet(f"""
-                color: {t.text_muted};
-                font-size: 14px;
-                line-height: 1.8;
-                padding: 40px;
-            """)
-            self.cards_layout.insertWidget(0, empty_label)
             return
         
         # 添加卡片（倒序插入）
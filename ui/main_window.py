@@ -3,6 +3,7 @@ Dayflow Windows - 主窗口
 现代化 Windows 11 风格界面
 """
 import logging
+from collections import deque
 from datetime import datetime
 from typing import Optional
 import sys
@@ -16,7 +17,7 @@ from PySide6.QtWidgets import (
     QLineEdit, QMessageBox, QSystemTrayIcon, QMenu,
     QApplication, QSizePolicy, QSpacerItem, QFileDialog,
     QScrollArea, QProgressBar, QComboBox, QDialog,
-    QRadioButton, QCheckBox
+    QRadioButton, QCheckBox, QButtonGroup
 )
 from PySide6.QtCore import QEvent
 from PySide6.QtGui import QDesktopServices
@@ -32,7 +33,6 @@ if sys.platform == 'win32':
 import config
 from ui.timeline_view import TimelineView
 from ui.daily_event_view import DailyEventView
-from ui.stats_view import StatsPanel
 from ui.themes import (
     get_theme_manager, get_theme, 
     show_information, show_warning, show_critical, show_question,
@@ -167,7 +167,6 @@ class CustomTitleBar(QWidget):
         self.title_label.setStyleSheet(f"""
             color: {t.text_secondary};
             font-size: 12px;
-            font-family: "Segoe UI", "Microsoft YaHei", sans-serif;
             padding-left: 4px;
         """)
         # 更新按钮主题
@@ -248,6 +247,7 @@ class RecordingIndicator(QWidget):
         self._paused = False
         self._start_time = None
         self._elapsed_seconds = 0
+        self._shown_resting = None  # 状态文字当前样式对应的休息状态，变化时才重设样式
         self.recording_manager = None
         self._setup_ui()
         get_theme_manager().theme_changed.connect(self._apply_idle_theme)
@@ -280,43 +280,49 @@ class RecordingIndicator(QWidget):
     
     def _format_duration(self, seconds: int) -> str:
         """格式化时长为 HH:MM:SS"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
+        minutes, secs = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     
     def _update_duration(self):
         """更新录制时长显示"""
         if self._recording and self._start_time:
-            from datetime import datetime
-            elapsed = (datetime.now() - self._start_time).total_seconds()
-            self._elapsed_seconds = int(elapsed)
-            duration_str = self._format_duration(self._elapsed_seconds)
+            elapsed_seconds = int((datetime.now() - self._start_time).total_seconds())
             
             # 检查是否处于休息状态
-            is_resting = self.recording_manager and self.recording_manager.is_auto_paused()
-            t = get_theme()
+            is_resting = bool(self.recording_manager and self.recording_manager.is_auto_paused())
             
-            if is_resting:
-                # 休息状态：显示灰色"休息中"
-                self.status_label.setText(f"休息中 {duration_str}")
-                self.status_label.setStyleSheet(f"color: {t.text_muted}; font-size: 12px;")
-            else:
-                # 录制状态：显示红色"录制中"
-                self.status_label.setText(f"录制中 {duration_str}")
-                self.status_label.setStyleSheet(f"color: {t.error}; font-size: 12px; font-weight: 600;")
+            # 定时器抖动可能在同一秒内触发两次：秒数与状态都没变时不必重新格式化
+            if elapsed_seconds == self._elapsed_seconds and is_resting == self._shown_resting:
+                return
+            self._elapsed_seconds = elapsed_seconds
+            duration_str = self._format_duration(elapsed_seconds)
+            
+            # 每秒只更新文字；样式表仅在录制/休息状态切换时重设，避免每秒重新解析样式
+            if is_resting != self._shown_resting:
+                t = get_theme()
+                if is_resting:
+                    # 休息状态：灰色
+                    self.status_label.setStyleSheet(f"color: {t.text_muted}; font-size: 12px;")
+                else:
+                    # 录制状态：红色
+                    self.status_label.setStyleSheet(f"color: {t.error}; font-size: 12px; font-weight: 600;")
+                self._shown_resting = is_resting
+            
+            self.status_label.setText(f"{'休息中' if is_resting else '录制中'} {duration_str}")
     
     def _apply_idle_theme(self):
         if not self._recording:
             t = get_theme()
             self.dot.setStyleSheet(f"color: {t.text_muted}; font-size: 10px;")
             self.status_label.setStyleSheet(f"color: {t.text_muted}; font-size: 12px;")
+        else:
+            self._shown_resting = None  # 录制中切换主题：下次计时刷新时按新主题重设样式
     
     def set_recording(self, recording: bool, paused: bool = False):
-        from datetime import datetime
-        
         self._recording = recording
         self._paused = paused
+        self._shown_resting = None
         t = get_theme()
         
         if recording and not paused:
@@ -350,6 +356,20 @@ class RecordingIndicator(QWidget):
             self._blink_timer.stop()
             self._duration_timer.stop()
     
+    def hideEvent(self, event):
+        """不可见时（如窗口最小化到托盘）停掉闪烁与计时，不在看不见的控件上耗 CPU"""
+        super().hideEvent(event)
+        self._blink_timer.stop()
+        self._duration_timer.stop()
+    
+    def showEvent(self, event):
+        """重新可见时恢复定时器；时长由开始时间推算，先立即刷新一次"""
+        super().showEvent(event)
+        if self._recording and not self._paused:
+            self._update_duration()
+            self._blink_timer.start(800)
+            self._duration_timer.start(1000)
+    
     def _blink(self):
         """脉冲动画"""
         t = get_theme()
@@ -478,9 +498,50 @@ class SettingsPanel(QWidget):
     
     api_key_saved = Signal(str)
     
+    # GLM 视觉模型：(模型 ID, 显示名称, 是否支持思考模式)
+    GLM_VISION_MODELS = (
+        ("glm-4.6v", "GLM-4.6V (推荐)", True),
+        ("glm-4.6v-flash", "GLM-4.6V-Flash (快速)", True),
+        ("glm-4.6v-flashx", "GLM-4.6V-FlashX (极速)", True),
+        ("glm-4v-flash", "GLM-4V-Flash (免费)", False),
+        ("glm-4.1v-thinking-flashx", "GLM-4.1V-Thinking-FlashX (推理)", False),
+        ("glm-4.1v-thinking-flash", "GLM-4.1V-Thinking-Flash (免费)", False),
+    )
+    # 视觉模型 ID -> 是否支持思考模式
+    GLM_VISION_THINKING = {model_id: thinking for model_id, _, thinking in GLM_VISION_MODELS}
+    
+    # GLM 每日总结模型：(模型 ID, 显示名称)
+    GLM_SUMMARY_MODELS = (
+        ("glm-4-flash-250414", "GLM-4-Flash (免费，推荐)"),
+        ("glm-4-flashx-250414", "GLM-4-FlashX (极速免费)"),
+        ("glm-4.5-flash", "GLM-4.5-Flash (快速)"),
+        ("glm-4.5-air", "GLM-4.5-Air (轻量)"),
+        ("glm-4.5-airx", "GLM-4.5-AirX (极速)"),
+        ("glm-4.6", "GLM-4.6 (标准)"),
+        ("glm-4.7", "GLM-4.7 (高级)"),
+        ("glm-4.7-flash", "GLM-4.7-Flash (快速高级)"),
+        ("glm-4.7-flashx", "GLM-4.7-FlashX (极速高级)"),
+        ("glm-5", "GLM-5 (旗舰)"),
+        ("glm-5-turbo", "GLM-5-Turbo (旗舰快速)"),
+    )
+    
+    # 非 GLM 模式下未填写模型名称时使用的默认模型
+    CUSTOM_DEFAULT_API_MODEL = "gpt-4o"
+    CUSTOM_DEFAULT_SUMMARY_MODEL = "gpt-4"
+    
+    # 健康提醒阈值输入停止编辑后自动保存的延迟（毫秒）
+    HEALTH_AUTOSAVE_DELAY_MS = 2000
+    
+    # 日志查看器最多显示的行数
+    LOG_VIEW_MAX_LINES = 500
+    
+    # 首屏以下分区构建前占位容器的预估高度（保持滚动条范围稳定）
+    LOWER_SECTIONS_PLACEHOLDER_HEIGHT = 420
+    
     def __init__(self, storage: StorageManager, parent=None):
         super().__init__(parent)
         self.storage = storage
+        self._use_glm = True  # 当前模型模式（由 _update_model_switch_button 维护）
         self._frames = []  # 存储需要主题化的 frame
         self._titles = []  # 存储标题
         self._descs = []   # 存储描述文字
@@ -490,7 +551,6 @@ class SettingsPanel(QWidget):
         
         self._setup_ui()
         self._load_settings()
-        self._update_data_path_display()
         self.apply_theme()
         get_theme_manager().theme_changed.connect(self.apply_theme)
         
@@ -615,15 +675,7 @@ class SettingsPanel(QWidget):
         
         self.api_model_combo = NoScrollComboBox()
         self.api_model_combo.setMinimumHeight(40)
-        self.glm_models = [
-            ("glm-4.6v", "GLM-4.6V (推荐)", True),
-            ("glm-4.6v-flash", "GLM-4.6V-Flash (快速)", True),
-            ("glm-4.6v-flashx", "GLM-4.6V-FlashX (极速)", True),
-            ("glm-4v-flash", "GLM-4V-Flash (免费)", False),
-            ("glm-4.1v-thinking-flashx", "GLM-4.1V-Thinking-FlashX (推理)", False),
-            ("glm-4.1v-thinking-flash", "GLM-4.1V-Thinking-Flash (免费)", False),
-        ]
-        for model_id, model_name, _ in self.glm_models:
+        for model_id, model_name, _ in self.GLM_VISION_MODELS:
             self.api_model_combo.addItem(model_name, model_id)
         self.api_model_combo.currentIndexChanged.connect(self._on_model_changed)
         api_layout.addWidget(self.api_model_combo)
@@ -654,20 +706,7 @@ class SettingsPanel(QWidget):
         
         self.summary_model_combo = NoScrollComboBox()
         self.summary_model_combo.setMinimumHeight(40)
-        self.summary_models = [
-            ("glm-4-flash-250414", "GLM-4-Flash (免费，推荐)"),
-            ("glm-4-flashx-250414", "GLM-4-FlashX (极速免费)"),
-            ("glm-4.5-flash", "GLM-4.5-Flash (快速)"),
-            ("glm-4.5-air", "GLM-4.5-Air (轻量)"),
-            ("glm-4.5-airx", "GLM-4.5-AirX (极速)"),
-            ("glm-4.6", "GLM-4.6 (标准)"),
-            ("glm-4.7", "GLM-4.7 (高级)"),
-            ("glm-4.7-flash", "GLM-4.7-Flash (快速高级)"),
-            ("glm-4.7-flashx", "GLM-4.7-FlashX (极速高级)"),
-            ("glm-5", "GLM-5 (旗舰)"),
-            ("glm-5-turbo", "GLM-5-Turbo (旗舰快速)"),
-        ]
-        for model_id, model_name in self.summary_models:
+        for model_id, model_name in self.GLM_SUMMARY_MODELS:
             self.summary_model_combo.addItem(model_name, model_id)
         api_layout.addWidget(self.summary_model_combo)
         
@@ -974,6 +1013,14 @@ class SettingsPanel(QWidget):
         cooldown_row.addStretch()
         health_layout.addLayout(cooldown_row)
         
+        # 输入停止 HEALTH_AUTOSAVE_DELAY_MS 后静默自动保存（每次编辑都会重新计时，避免逐键写库）
+        self._health_save_timer = QTimer(self)
+        self._health_save_timer.setSingleShot(True)
+        self._health_save_timer.setInterval(self.HEALTH_AUTOSAVE_DELAY_MS)
+        self._health_save_timer.timeout.connect(lambda: self._save_health_reminder_config(silent=True))
+        for health_input in (self.work_threshold_input, self.entertainment_threshold_input, self.cooldown_input):
+            health_input.textEdited.connect(self._health_save_timer.start)
+        
         # 测试和保存按钮
         health_btn_row = QHBoxLayout()
         health_btn_row.addStretch()
@@ -987,13 +1034,65 @@ class SettingsPanel(QWidget):
         self.health_save_btn = QPushButton("保存健康提醒设置")
         self.health_save_btn.setCursor(Qt.PointingHandCursor)
         self.health_save_btn.setFixedHeight(38)
-        self.health_save_btn.clicked.connect(self._save_health_reminder_config)
+        self.health_save_btn.clicked.connect(lambda: self._save_health_reminder_config())
         health_btn_row.addWidget(self.health_save_btn)
         
         health_layout.addLayout(health_btn_row)
         
         layout.addLayout(analysis_health_row)
         
+        # === 首屏以下的分区（数据迁移/运行日志/自动删除/关于）===
+        # 先放一个占位容器撑开滚动范围，滚动到附近时再构建真实控件
+        self._lower_sections_built = False
+        self._lower_sections = QWidget()
+        self._lower_sections.setMinimumHeight(self.LOWER_SECTIONS_PLACEHOLDER_HEIGHT)
+        self._lower_sections_layout = QVBoxLayout(self._lower_sections)
+        self._lower_sections_layout.setContentsMargins(0, 0, 0, 0)
+        self._lower_sections_layout.setSpacing(layout.spacing())
+        layout.addWidget(self._lower_sections)
+        
+        # 底部留白
+        layout.addSpacing(20)
+        
+        # 设置滚动区域
+        self.scroll.setWidget(scroll_content)
+        main_layout.addWidget(self.scroll)
+        self.scroll.verticalScrollBar().valueChanged.connect(self._maybe_build_lower_sections)
+    
+    def _maybe_build_lower_sections(self, *_):
+        """占位容器进入可视区域时构建首屏以下的分区"""
+        if self._lower_sections_built:
+            return
+        if self._lower_sections.visibleRegion().isEmpty():
+            return
+        self._ensure_lower_sections()
+    
+    def showEvent(self, event):
+        """显示时检查占位容器（页面无需滚动时也要构建），等布局完成后再判断可见区域"""
+        super().showEvent(event)
+        if not self._lower_sections_built:
+            QTimer.singleShot(0, self._maybe_build_lower_sections)
+    
+    def resizeEvent(self, event):
+        """窗口放大后占位容器可能进入可视区域"""
+        super().resizeEvent(event)
+        if not self._lower_sections_built:
+            self._maybe_build_lower_sections()
+    
+    def _ensure_lower_sections(self):
+        """确保首屏以下的分区已构建"""
+        if self._lower_sections_built:
+            return
+        self._lower_sections_built = True
+        self._build_lower_sections()
+        self._lower_sections.setMinimumHeight(0)
+        self._update_data_path_display()
+        self.apply_theme()
+    
+    def _build_lower_sections(self):
+        """构建数据存储位置迁移、运行日志、自动删除录屏、关于 Dayflow 分区"""
+        layout = self._lower_sections_layout
+        
         # === 数据存储位置迁移 + 运行日志（一行两列）===
         data_log_row = QHBoxLayout()
         data_log_row.setSpacing(16)
@@ -1098,10 +1197,14 @@ class SettingsPanel(QWidget):
         log_btn_row.addStretch()
         log_layout.addLayout(log_btn_row)
         
-        # 日志显示区域（初始隐藏）
-        from PySide6.QtWidgets import QTextEdit
-        self.log_text = QTextEdit()
+        # 日志显示区域（初始隐藏）- 纯文本只读，用 QPlainTextEdit 避免富文本排版开销
+        from PySide6.QtWidgets import QPlainTextEdit
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        # 只读展示：限制行数、不自动换行（调整窗口大小时无需重新排版全部行），且不启用编辑光标
+        self.log_text.setMaximumBlockCount(self.LOG_VIEW_MAX_LINES)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.log_text.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
         self.log_text.setFixedHeight(300)
         self.log_text.hide()
         self.log_text.setPlaceholderText("点击「查看日志」加载日志内容...")
@@ -1174,13 +1277,6 @@ class SettingsPanel(QWidget):
         
         auto_delete_about_row.addWidget(about_frame)
         layout.addLayout(auto_delete_about_row)
-        
-        # 底部留白
-        layout.addSpacing(20)
-        
-        # 设置滚动区域
-        self.scroll.setWidget(scroll_content)
-        main_layout.addWidget(self.scroll)
     
     def apply_theme(self):
         """应用主题"""
@@ -1199,7 +1295,6 @@ class SettingsPanel(QWidget):
             font-size: 28px;
             font-weight: 700;
             color: {t.text_primary};
-            font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
             padding: 4px 0;
         """)
         
@@ -1219,7 +1314,6 @@ class SettingsPanel(QWidget):
                 font-size: 15px;
                 font-weight: 600;
                 color: {t.text_primary};
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
                 padding: 2px 0;
             """)
         
@@ -1228,7 +1322,6 @@ class SettingsPanel(QWidget):
             desc.setStyleSheet(f"""
                 font-size: 13px;
                 color: {t.text_secondary};
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
                 padding: 2px 0;
             """)
         
@@ -1241,7 +1334,6 @@ class SettingsPanel(QWidget):
                 padding: 10px 14px;
                 font-size: 14px;
                 color: {t.text_primary};
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
             }}
             QLineEdit:focus {{
                 border-color: {t.accent};
@@ -1267,7 +1359,6 @@ class SettingsPanel(QWidget):
                 border-radius: 6px;
                 padding: 6px 12px;
                 font-size: 12px;
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
             }}
             QPushButton:hover {{
                 background-color: {t.accent};
@@ -1281,7 +1372,6 @@ class SettingsPanel(QWidget):
             QRadioButton {{
                 color: {t.text_primary};
                 font-size: 14px;
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
                 spacing: 8px;
             }}
             QRadioButton::indicator {{
@@ -1308,7 +1398,6 @@ class SettingsPanel(QWidget):
             QCheckBox {{
                 color: {t.text_primary};
                 font-size: 14px;
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
                 spacing: 8px;
             }}
             QCheckBox::indicator {{
@@ -1341,7 +1430,6 @@ class SettingsPanel(QWidget):
                 padding: 10px 14px;
                 font-size: 14px;
                 color: {t.text_primary};
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
             }}
             QComboBox:focus {{
                 border-color: {t.accent};
@@ -1447,7 +1535,6 @@ class SettingsPanel(QWidget):
                 padding: 10px 14px;
                 font-size: 14px;
                 color: {t.text_primary};
-                font-family: "Microsoft YaHei", "Segoe UI", sans-serif;
             }}
             QLineEdit:focus {{
                 border-color: {t.accent};
@@ -1572,22 +1659,23 @@ class SettingsPanel(QWidget):
                 border-color: {t.accent};
             }}
         """
-        self.view_log_btn.setStyleSheet(log_btn_style)
-        self.refresh_log_btn.setStyleSheet(log_btn_style)
-        
-        # 日志文本框样式
-        self.log_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {t.bg_tertiary};
-                color: {t.text_primary};
-                border: 1px solid {t.border};
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 12px;
-                font-family: "Consolas", "Monaco", "Microsoft YaHei", monospace;
-                line-height: 1.5;
-            }}
-        """)
+        if self._lower_sections_built:
+            self.view_log_btn.setStyleSheet(log_btn_style)
+            self.refresh_log_btn.setStyleSheet(log_btn_style)
+            
+            # 日志文本框样式
+            self.log_text.setStyleSheet(f"""
+                QPlainTextEdit {{
+                    background-color: {t.bg_tertiary};
+                    color: {t.text_primary};
+                    border: 1px solid {t.border};
+                    border-radius: 8px;
+                    padding: 12px;
+                    font-size: 12px;
+                    font-family: "Consolas", "Monaco", "Microsoft YaHei", monospace;
+                    line-height: 1.5;
+                }}
+            """)
     
     def _populate_monitor_options(self):
         """填充显示器选项。"""
@@ -1611,45 +1699,67 @@ class SettingsPanel(QWidget):
         show_information(self, "成功", "录制显示器设置已保存，下次开始录制时生效")
 
     def _load_settings(self):
+        # 一次查询读出设置页需要的全部项，避免每项单独开连接
+        settings = self.storage.get_settings({
+            "use_glm_model": "true",
+            "api_url": config.API_BASE_URL,
+            "api_key": "",
+            "api_model": config.API_MODEL,
+            "custom_api_model": "",
+            "daily_summary_model": config.DAILY_SUMMARY_MODEL,
+            "custom_summary_model": "",
+            "visual_thinking_mode": config.VISUAL_THINKING_MODE,
+            "summary_thinking_mode": config.SUMMARY_THINKING_MODE,
+            "theme": "dark",
+            "record_output_idx": "0",
+            "batch_chunk_count": str(config.BATCH_CHUNK_COUNT),
+            "health_reminder_enabled": "true",
+            "health_work_threshold": str(config.HEALTH_REMINDER_WORK_THRESHOLD),
+            "health_entertainment_threshold": str(config.HEALTH_REMINDER_ENTERTAINMENT_THRESHOLD),
+            "health_cooldown": str(config.HEALTH_REMINDER_COOLDOWN),
+        })
+        
         # 加载 GLM 模式设置
-        use_glm = self.storage.get_setting("use_glm_model", "true") == "true"
+        use_glm = settings["use_glm_model"] == "true"
         self._update_model_switch_button(use_glm)
         
         # 加载 API 设置
-        api_url = self.storage.get_setting("api_url", config.API_BASE_URL)
-        api_key = self.storage.get_setting("api_key", "")
-        api_model = self.storage.get_setting("api_model", config.API_MODEL)
+        api_url = settings["api_url"]
+        api_key = settings["api_key"]
+        api_model = settings["api_model"]
         
         self.api_url_input.setText(api_url)
         self.api_key_input.setText(api_key)
         
-        # 设置模型下拉框选中项
+        # 设置模型下拉框选中项（屏蔽信号，下方统一更新一次思考模式状态）
         model_index = self.api_model_combo.findData(api_model)
         if model_index >= 0:
+            self.api_model_combo.blockSignals(True)
             self.api_model_combo.setCurrentIndex(model_index)
+            self.api_model_combo.blockSignals(False)
         
         # 加载自定义模型名称（非GLM模式）
-        custom_api_model = self.storage.get_setting("custom_api_model", "")
+        custom_api_model = settings["custom_api_model"]
         self.api_model_input.setText(custom_api_model)
         
         # 加载每日总结模型设置
-        summary_model = self.storage.get_setting("daily_summary_model", config.DAILY_SUMMARY_MODEL)
+        summary_model = settings["daily_summary_model"]
         summary_model_index = self.summary_model_combo.findData(summary_model)
         if summary_model_index >= 0:
             self.summary_model_combo.setCurrentIndex(summary_model_index)
         
         # 加载自定义每日总结模型名称（非GLM模式）
-        custom_summary_model = self.storage.get_setting("custom_summary_model", "")
+        custom_summary_model = settings["custom_summary_model"]
         self.summary_model_input.setText(custom_summary_model)
         
         # 加载视觉模型思考模式设置
-        visual_thinking = self.storage.get_setting("visual_thinking_mode", config.VISUAL_THINKING_MODE)
+        visual_thinking = settings["visual_thinking_mode"]
         visual_thinking_index = self.visual_thinking_combo.findData(visual_thinking)
         if visual_thinking_index >= 0:
             self.visual_thinking_combo.setCurrentIndex(visual_thinking_index)
         
         # 加载每日总结思考模式设置
-        summary_thinking = self.storage.get_setting("summary_thinking_mode", config.SUMMARY_THINKING_MODE)
+        summary_thinking = settings["summary_thinking_mode"]
         summary_thinking_index = self.summary_thinking_combo.findData(summary_thinking)
         if summary_thinking_index >= 0:
             self.summary_thinking_combo.setCurrentIndex(summary_thinking_index)
@@ -1661,11 +1771,11 @@ class SettingsPanel(QWidget):
             self._on_model_changed(model_index)
         
         # 加载主题设置
-        theme = self.storage.get_setting("theme", "dark")
+        theme = settings["theme"]
         self._update_theme_button(theme == "dark")
 
         # 加载录制显示器设置
-        saved_output_idx = self.storage.get_setting("record_output_idx", "0")
+        saved_output_idx = settings["record_output_idx"]
         try:
             saved_output_idx = int(saved_output_idx)
         except ValueError:
@@ -1675,24 +1785,24 @@ class SettingsPanel(QWidget):
             self.monitor_combo.setCurrentIndex(combo_index)
         
         # 加载分析设置
-        batch_chunk = self.storage.get_setting("batch_chunk_count", str(config.BATCH_CHUNK_COUNT))
+        batch_chunk = settings["batch_chunk_count"]
         self.batch_chunk_input.setText(batch_chunk)
         
         # 断开健康提醒按钮信号，避免在加载设置时触发切换
         self.health_enable_btn.clicked.disconnect()
         
         # 加载健康提醒设置
-        health_enabled = self.storage.get_setting("health_reminder_enabled", "true") == "true"
+        health_enabled = settings["health_reminder_enabled"] == "true"
         self.health_enable_btn.setChecked(health_enabled)
         self._update_health_reminder_button()
         
-        work_threshold = self.storage.get_setting("health_work_threshold", str(config.HEALTH_REMINDER_WORK_THRESHOLD))
+        work_threshold = settings["health_work_threshold"]
         self.work_threshold_input.setText(work_threshold)
         
-        entertainment_threshold = self.storage.get_setting("health_entertainment_threshold", str(config.HEALTH_REMINDER_ENTERTAINMENT_THRESHOLD))
+        entertainment_threshold = settings["health_entertainment_threshold"]
         self.entertainment_threshold_input.setText(entertainment_threshold)
         
-        cooldown = self.storage.get_setting("health_cooldown", str(config.HEALTH_REMINDER_COOLDOWN))
+        cooldown = settings["health_cooldown"]
         self.cooldown_input.setText(cooldown)
         
         # 重新连接健康提醒按钮信号
@@ -1707,6 +1817,7 @@ class SettingsPanel(QWidget):
     
     def _update_model_switch_button(self, use_glm: bool):
         """更新模型切换按钮的文本和UI状态"""
+        self._use_glm = use_glm
         if use_glm:
             self.model_switch_btn.setText("使用其他模型")
             # 使用GLM模型
@@ -1732,12 +1843,8 @@ class SettingsPanel(QWidget):
     
     def _toggle_model_mode(self):
         """切换模型模式"""
-        # 获取当前模式（根据按钮文本判断）
-        current_text = self.model_switch_btn.text()
-        use_glm = (current_text == "使用其他模型")  # 如果显示"使用其他模型"，说明当前是GLM模式
-        
         # 切换到另一种模式
-        use_glm = not use_glm
+        use_glm = not self._use_glm
         
         # 更新按钮文本和UI
         self._update_model_switch_button(use_glm)
@@ -1749,61 +1856,71 @@ class SettingsPanel(QWidget):
     
     def _on_model_changed(self, index: int):
         """模型选择变化时，更新思考模式的可用状态"""
-        if 0 <= index < len(self.glm_models):
-            supports_thinking = self.glm_models[index][2]
-            self.visual_thinking_combo.setEnabled(supports_thinking)
-            if not supports_thinking:
-                self.visual_thinking_combo.setCurrentIndex(0)
+        supports_thinking = self.GLM_VISION_THINKING.get(self.api_model_combo.itemData(index))
+        if supports_thinking is None:
+            return
+        self.visual_thinking_combo.setEnabled(supports_thinking)
+        if not supports_thinking:
+            self.visual_thinking_combo.setCurrentIndex(0)
+    
+    def _current_model_selection(self) -> tuple:
+        """获取当前模式下选中的模型配置
+        
+        Returns:
+            (api_model, visual_thinking_mode, summary_model, summary_thinking_mode)
+        """
+        if self._use_glm:
+            # GLM模式：使用下拉框选择的模型
+            return (
+                self.api_model_combo.currentData() or config.API_MODEL,
+                self.visual_thinking_combo.currentData() or "disabled",
+                self.summary_model_combo.currentData() or config.DAILY_SUMMARY_MODEL,
+                self.summary_thinking_combo.currentData() or "disabled",
+            )
+        # 非GLM模式：使用自定义输入的模型名称（不传递思考模式）
+        return (
+            self.api_model_input.text().strip() or self.CUSTOM_DEFAULT_API_MODEL,
+            "disabled",
+            self.summary_model_input.text().strip() or self.CUSTOM_DEFAULT_SUMMARY_MODEL,
+            "disabled",
+        )
     
     def _save_api_config(self):
         """保存 API 配置"""
         try:
-            # 根据按钮文本判断当前模式
-            use_glm = self.model_switch_btn.text() == "使用其他模型"
+            use_glm = self._use_glm
             api_url = self.api_url_input.text().strip() or config.API_BASE_URL
             api_key = self.api_key_input.text().strip()
             
-            # 保存GLM模式设置
-            self.storage.set_setting("use_glm_model", "true" if use_glm else "false")
-            
-            # 保存通用设置
-            self.storage.set_setting("api_url", api_url)
-            self.storage.set_setting("api_key", api_key)
+            # GLM 模式 + 通用设置 + 模型设置，一次事务批量写入
+            settings = {
+                "use_glm_model": "true" if use_glm else "false",
+                "api_url": api_url,
+                "api_key": api_key,
+            }
             
+            api_model, visual_thinking_mode, summary_model, summary_thinking_mode = self._current_model_selection()
             if use_glm:
-                # GLM模式：使用下拉框选择的模型
-                api_model = self.api_model_combo.currentData() or config.API_MODEL
-                summary_model = self.summary_model_combo.currentData() or config.DAILY_SUMMARY_MODEL
-                visual_thinking_mode = self.visual_thinking_combo.currentData() or "disabled"
-                summary_thinking_mode = self.summary_thinking_combo.currentData() or "disabled"
-                
-                self.storage.set_setting("api_model", api_model)
-                self.storage.set_setting("daily_summary_model", summary_model)
-                self.storage.set_setting("visual_thinking_mode", visual_thinking_mode)
-                self.storage.set_setting("summary_thinking_mode", summary_thinking_mode)
-                
-                # 更新运行时配置
-                config.API_BASE_URL = api_url
-                config.API_KEY = api_key
-                config.API_MODEL = api_model
-                config.DAILY_SUMMARY_MODEL = summary_model
-                config.VISUAL_THINKING_MODE = visual_thinking_mode
-                config.SUMMARY_THINKING_MODE = summary_thinking_mode
+                settings.update({
+                    "api_model": api_model,
+                    "daily_summary_model": summary_model,
+                    "visual_thinking_mode": visual_thinking_mode,
+                    "summary_thinking_mode": summary_thinking_mode,
+                })
             else:
-                # 非GLM模式：使用自定义输入的模型名称
-                custom_api_model = self.api_model_input.text().strip() or "gpt-4o"
-                custom_summary_model = self.summary_model_input.text().strip() or "gpt-4"
-                
-                self.storage.set_setting("custom_api_model", custom_api_model)
-                self.storage.set_setting("custom_summary_model", custom_summary_model)
-                
-                # 更新运行时配置（不传递思考模式等参数）
-                config.API_BASE_URL = api_url
-                config.API_KEY = api_key
-                config.API_MODEL = custom_api_model
-                config.DAILY_SUMMARY_MODEL = custom_summary_model
-                config.VISUAL_THINKING_MODE = "disabled"
-                config.SUMMARY_THINKING_MODE = "disabled"
+                settings.update({
+                    "custom_api_model": api_model,
+                    "custom_summary_model": summary_model,
+                })
+            self.storage.set_settings(settings)
+            
+            # 更新运行时配置
+            config.API_BASE_URL = api_url
+            config.API_KEY = api_key
+            config.API_MODEL = api_model
+            config.DAILY_SUMMARY_MODEL = summary_model
+            config.VISUAL_THINKING_MODE = visual_thinking_mode
+            config.SUMMARY_THINKING_MODE = summary_thinking_mode
             
             self.api_key_saved.emit(api_key)
             
@@ -1829,8 +1946,6 @@ class SettingsPanel(QWidget):
         import asyncio
         from core.llm_provider import DayflowBackendProvider
         
-        # 根据按钮文本判断当前模式
-        use_glm = self.model_switch_btn.text() == "使用其他模型"
         api_url = self.api_url_input.text().strip() or config.API_BASE_URL
         api_key = self.api_key_input.text().strip()
         
@@ -1838,18 +1953,7 @@ class SettingsPanel(QWidget):
             self._show_test_result(False, "请先输入 API Key")
             return
         
-        if use_glm:
-            # GLM模式：使用下拉框选择的模型
-            api_model = self.api_model_combo.currentData() or config.API_MODEL
-            visual_thinking_mode = self.visual_thinking_combo.currentData() or "disabled"
-            summary_model = self.summary_model_combo.currentData() or config.DAILY_SUMMARY_MODEL
-            summary_thinking_mode = self.summary_thinking_combo.currentData() or "disabled"
-        else:
-            # 非GLM模式：使用自定义输入的模型名称
-            api_model = self.api_model_input.text().strip() or "gpt-4o"
-            visual_thinking_mode = "disabled"
-            summary_model = self.summary_model_input.text().strip() or "gpt-4"
-            summary_thinking_mode = "disabled"
+        api_model, visual_thinking_mode, summary_model, summary_thinking_mode = self._current_model_selection()
         
         # 禁用按钮，显示加载状态
         t = get_theme()
@@ -2015,47 +2119,28 @@ class SettingsPanel(QWidget):
             }
             
             # 导出所有卡片（获取最近一年的数据）
+            # 只查询需要导出的列，每行直接 dict(row) 生成记录，不再逐字段手工拼字典
             with self.storage._get_connection() as conn:
-                cursor = conn.execute("SELECT * FROM timeline_cards ORDER BY start_time DESC")
-                for row in cursor.fetchall():
-                    card_data = {
-                        "id": row["id"],
-                        "category": row["category"],
-                        "title": row["title"],
-                        "summary": row["summary"],
-                        "start_time": row["start_time"],
-                        "end_time": row["end_time"],
-                        "app_sites_json": row["app_sites_json"],
-                        "productivity_score": row["productivity_score"]
-                    }
-                    data["cards"].append(card_data)
+                cursor = conn.execute("""
+                    SELECT id, category, title, summary, start_time, end_time,
+                           app_sites_json, productivity_score
+                    FROM timeline_cards ORDER BY start_time DESC
+                """)
+                data["cards"] = [dict(row) for row in cursor.fetchall()]
                 
                 # 导出灵感卡片（快速记录的灵感、想法、待办）
-                cursor = conn.execute("SELECT * FROM inspirations ORDER BY timestamp DESC")
-                for row in cursor.fetchall():
-                    inspiration_data = {
-                        "id": row["id"],
-                        "content": row["content"],
-                        "timestamp": row["timestamp"],
-                        "category": row["category"],
-                        "notes_json": row["notes_json"],
-                        "created_at": row["created_at"],
-                        "updated_at": row["updated_at"]
-                    }
-                    data["inspirations"].append(inspiration_data)
+                cursor = conn.execute("""
+                    SELECT id, content, timestamp, category, notes_json, created_at, updated_at
+                    FROM inspirations ORDER BY timestamp DESC
+                """)
+                data["inspirations"] = [dict(row) for row in cursor.fetchall()]
                 
                 # 导出每日总结（事件总结和灵感总结）
-                cursor = conn.execute("SELECT * FROM daily_summaries ORDER BY date DESC")
-                for row in cursor.fetchall():
-                    summary_data = {
-                        "id": row["id"],
-                        "date": row["date"],
-                        "event_summary": row["event_summary"],
-                        "inspiration_summary": row["inspiration_summary"],
-                        "created_at": row["created_at"],
-                        "updated_at": row["updated_at"]
-                    }
-                    data["daily_summaries"].append(summary_data)
+                cursor = conn.execute("""
+                    SELECT id, date, event_summary, inspiration_summary, created_at, updated_at
+                    FROM daily_summaries ORDER BY date DESC
+                """)
+                data["daily_summaries"] = [dict(row) for row in cursor.fetchall()]
                 
                 # 导出设置
                 cursor = conn.execute("SELECT key, value FROM settings")
@@ -2189,14 +2274,13 @@ class SettingsPanel(QWidget):
                         summary.get("updated_at")
                     ))
                     imported_summaries += 1
-                
-                # 导入设置（可选）
-                for key, value in data.get("settings", {}).items():
-                    if key not in ["api_key", "theme"]:  # 保留用户当前设置
-                        conn.execute(
-                            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-                            (key, value)
-                        )
+            
+            # 导入设置（可选）：经 set_settings 写入，同步更新会话内的设置缓存
+            self.storage.set_settings({
+                key: value
+                for key, value in data.get("settings", {}).items()
+                if key not in ["api_key", "theme"]  # 保留用户当前设置
+            })
             
             # 构建导入结果消息
             result_messages = []
@@ -2244,10 +2328,8 @@ class SettingsPanel(QWidget):
         
         try:
             with open(log_file, 'r', encoding='utf-8') as f:
-                # 读取最后 500 行
-                lines = f.readlines()
-                last_lines = lines[-500:] if len(lines) > 500 else lines
-                content = ''.join(last_lines)
+                # 只保留最后 LOG_VIEW_MAX_LINES 行，不把整个文件读入列表
+                content = ''.join(deque(f, maxlen=self.LOG_VIEW_MAX_LINES))
             
             self.log_text.setPlainText(content)
             # 滚动到底部
@@ -2553,7 +2635,7 @@ class SettingsPanel(QWidget):
                 try:
                     file_path.unlink()
                     deleted_count += 1
-                    logger.debug(f"已删除: {file_path.name}")
+                    logger.debug("已删除: %s", file_path.name)
                 except Exception as e:
                     logger.warning(f"删除文件失败 {file_path.name}: {e}")
                     failed_files.append(file_path.name)
@@ -2751,8 +2833,20 @@ class SettingsPanel(QWidget):
             logger.error(f"保存分析配置失败: {e}", exc_info=True)
             show_critical(self, "保存失败", f"保存分析配置时出错：{str(e)}")
     
-    def _save_health_reminder_config(self):
-        """保存健康提醒配置"""
+    def _save_health_reminder_config(self, silent: bool = False):
+        """保存健康提醒配置
+        
+        Args:
+            silent: 自动保存时为 True，输入不完整或无效时直接跳过，不弹出任何提示框
+        """
+        self._health_save_timer.stop()
+        
+        def warn(message: str):
+            if silent:
+                logger.debug(f"健康提醒配置未自动保存: {message}")
+            else:
+                show_warning(self, "错误", message)
+        
         try:
             # 验证输入
             work_threshold = self.work_threshold_input.text().strip()
@@ -2760,13 +2854,13 @@ class SettingsPanel(QWidget):
             cooldown = self.cooldown_input.text().strip()
             
             if not work_threshold:
-                show_warning(self, "错误", "请输入工作阈值")
+                warn("请输入工作阈值")
                 return
             if not entertainment_threshold:
-                show_warning(self, "错误", "请输入娱乐阈值")
+                warn("请输入娱乐阈值")
                 return
             if not cooldown:
-                show_warning(self, "错误", "请输入冷却时间")
+                warn("请输入冷却时间")
                 return
             
             # 验证数值范围
@@ -2776,22 +2870,24 @@ class SettingsPanel(QWidget):
                 cooldown_int = int(cooldown)
                 
                 if work_threshold_int < 10 or work_threshold_int > 300:
-                    show_warning(self, "错误", "工作阈值必须在 10-300 分钟之间")
+                    warn("工作阈值必须在 10-300 分钟之间")
                     return
                 if entertainment_threshold_int < 10 or entertainment_threshold_int > 300:
-                    show_warning(self, "错误", "娱乐阈值必须在 10-300 分钟之间")
+                    warn("娱乐阈值必须在 10-300 分钟之间")
                     return
                 if cooldown_int < 1 or cooldown_int > 60:
-                    show_warning(self, "错误", "冷却时间必须在 1-60 分钟之间")
+                    warn("冷却时间必须在 1-60 分钟之间")
                     return
             except ValueError:
-                show_warning(self, "错误", "请输入有效的数字")
+                warn("请输入有效的数字")
                 return
             
             # 保存设置
-            self.storage.set_setting("health_work_threshold", work_threshold)
-            self.storage.set_setting("health_entertainment_threshold", entertainment_threshold)
-            self.storage.set_setting("health_cooldown", cooldown)
+            self.storage.set_settings({
+                "health_work_threshold": work_threshold,
+                "health_entertainment_threshold": entertainment_threshold,
+                "health_cooldown": cooldown,
+            })
             
             # 更新运行时配置
             config.HEALTH_REMINDER_WORK_THRESHOLD = work_threshold_int
@@ -2807,11 +2903,13 @@ class SettingsPanel(QWidget):
                 )
             
             logger.info(f"健康提醒配置已更新: 工作={work_threshold_int}分钟, 娱乐={entertainment_threshold_int}分钟, 冷却={cooldown_int}分钟")
-            show_information(self, "成功", "健康提醒配置已保存")
+            if not silent:
+                show_information(self, "成功", "健康提醒配置已保存")
             
         except Exception as e:
             logger.error(f"保存健康提醒配置失败: {e}")
-            show_critical(self, "错误", f"保存配置时出错: {e}")
+            if not silent:
+                show_critical(self, "错误", f"保存配置时出错: {e}")
     
     def _test_health_reminder(self):
         """测试健康提醒功能"""
@@ -2902,17 +3000,22 @@ class SettingsPanel(QWidget):
 class MainWindow(QMainWindow):
     """Dayflow 主窗口"""
     
-    def __init__(self):
+    def __init__(self, storage: Optional[StorageManager] = None):
+        """
+        Args:
+            storage: 共享的数据库管理器；为空时自行创建（各页面及后台管理器共用同一实例与连接池）
+        """
         super().__init__()
         
         logger.info("MainWindow 初始化开始")
         
         # 初始化组件
-        self.storage = StorageManager()
+        self.storage = storage or StorageManager()
         self.recording_manager = None
         self.analysis_manager = None
         self._stopping = False  # 防止重复点击停止按钮
         self._quitting = False  # 标记是否正在退出应用
+        self._timeline_loaded_key = None  # (日期, 卡片修订号)，用于跳过无变化的时间轴刷新
         
         self._setup_window()
         self._setup_ui()
@@ -2977,20 +3080,25 @@ class MainWindow(QMainWindow):
         self.logo = QLabel("🌊 Dayflow")
         sidebar_layout.addWidget(self.logo)
         
-        # 导航按钮
+        # 导航按钮（互斥按钮组，选中状态由按钮组维护，按钮 ID 即页面索引）
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        
         self.nav_timeline = SidebarButton("每日事件", "📊")
         self.nav_timeline.setChecked(True)
-        self.nav_timeline.clicked.connect(lambda: self._switch_page(0))
+        self.nav_group.addButton(self.nav_timeline, 0)
         sidebar_layout.addWidget(self.nav_timeline)
         
         self.nav_stats = SidebarButton("统计", "📈")
-        self.nav_stats.clicked.connect(lambda: self._switch_page(1))
+        self.nav_group.addButton(self.nav_stats, 1)
         sidebar_layout.addWidget(self.nav_stats)
         
         self.nav_settings = SidebarButton("设置", "⚙️")
-        self.nav_settings.clicked.connect(lambda: self._switch_page(2))
+        self.nav_group.addButton(self.nav_settings, 2)
         sidebar_layout.addWidget(self.nav_settings)
         
+        self.nav_group.idClicked.connect(self._switch_page)
+        
         sidebar_layout.addStretch()
         
         # 录制状态指示器
@@ -3018,16 +3126,41 @@ class MainWindow(QMainWindow):
         self.daily_event_view.card_deleted.connect(self._on_card_deleted)
         self.stack.addWidget(self.daily_event_view)
         
-        # 统计页面
-        self.stats_panel = StatsPanel(self.storage)
-        self.stack.addWidget(self.stats_panel)
+        # 统计页面、设置页面：首次切换到时才构建，启动时先放占位页保持索引不变
+        self.stats_panel: Optional[QWidget] = None
+        self.settings_panel: Optional[SettingsPanel] = None
+        self._page_factories = {
+            1: self._create_stats_panel,
+            2: self._create_settings_panel,
+        }
+        for _ in self._page_factories:
+            self.stack.addWidget(QWidget())
         
-        # 设置页面
+        content_layout.addWidget(self.stack)
+    
+    def _create_stats_panel(self) -> QWidget:
+        """构建统计页面（统计模块连同其绘图组件在此时才导入，不计入启动耗时）"""
+        from ui.stats_view import StatsPanel
+        self.stats_panel = StatsPanel(self.storage)
+        return self.stats_panel
+    
+    def _create_settings_panel(self) -> QWidget:
+        """构建设置页面"""
         self.settings_panel = SettingsPanel(self.storage, self)
         self.settings_panel.api_key_saved.connect(self._on_api_key_saved)
-        self.stack.addWidget(self.settings_panel)
+        return self.settings_panel
+    
+    def _ensure_page(self, index: int):
+        """按需构建页面，用真实页面替换占位页"""
+        factory = self._page_factories.pop(index, None)
+        if factory is None:
+            return
         
-        content_layout.addWidget(self.stack)
+        placeholder = self.stack.widget(index)
+        page = factory()
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
     
     def _create_tray_icon(self) -> QIcon:
         """创建托盘图标"""
@@ -3180,7 +3313,16 @@ class MainWindow(QMainWindow):
         if current_date_normalized != today_date:
             return
         
-        cards = self.storage.get_cards_for_date(today)
+        self._load_cards_for_date(today)
+    
+    def _load_cards_for_date(self, date: datetime):
+        """加载指定日期的卡片到时间轴；日期与卡片修订号都未变化时跳过查询和重建"""
+        revision = self.storage.get_cards_revision()
+        key = (date.date(), revision)
+        if revision >= 0 and key == self._timeline_loaded_key:
+            return
+        cards = self.storage.get_cards_for_date(date)
+        self._timeline_loaded_key = key
         self.daily_event_view.set_cards(cards)
     
     def _check_health_reminder(self):
@@ -3249,12 +3391,11 @@ class MainWindow(QMainWindow):
     
     def _switch_page(self, index: int):
         """切换页面"""
+        self._ensure_page(index)
         self.stack.setCurrentIndex(index)
-        self.nav_timeline.setChecked(index == 0)
-        self.nav_stats.setChecked(index == 1)
-        self.nav_settings.setChecked(index == 2)
+        self.nav_group.button(index).setChecked(True)
         
-        # 切换到统计页面时刷新数据
+        # 切换到统计页面时刷新数据（数据未变化时 refresh 内部会直接跳过）
         if index == 1:
             self.stats_panel.refresh()
     
@@ -3589,9 +3730,8 @@ class MainWindow(QMainWindow):
     
     def _on_date_changed(self, date: datetime):
         """日期切换时加载对应数据"""
-        logger.info(f"切换到日期: {date.strftime('%Y-%m-%d')}")
-        cards = self.storage.get_cards_for_date(date)
-        self.daily_event_view.set_cards(cards)
+        logger.info("切换到日期: %s", date.date())
+        self._load_cards_for_date(date)
     
     def _on_export_requested(self, date: datetime, cards: list):
         """导出数据到 CSV"""
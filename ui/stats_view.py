@@ -3,26 +3,34 @@ Dayflow Windows - 数据统计与分析视图
 仪表盘风格设计
 """
 import logging
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QScrollArea, QGridLayout, QSpinBox, QComboBox,
-    QProgressBar, QSizePolicy, QSpacerItem, QGraphicsDropShadowEffect
+    QProgressBar, QSizePolicy, QSpacerItem, QGraphicsDropShadowEffect, QToolTip
 )
-from PySide6.QtCore import Qt, Signal, QRect, QRectF, QPointF
+from PySide6.QtCore import Qt, Signal, QRect, QRectF, QPointF, QEvent
 from PySide6.QtGui import (
     QPainter, QColor, QPen, QBrush, QFont, QPainterPath,
-    QLinearGradient, QRadialGradient, QPaintEvent
+    QLinearGradient, QRadialGradient, QPaintEvent, QPixmap
 )
 
-from ui.themes import get_theme, get_theme_manager, get_category_color
+from ui.themes import get_theme, get_theme_manager, get_category_color, get_category_swatch_style, clear_layout
 from database.storage import StorageManager
 from core.types import ActivityCard
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _chart_font(point_size: int, weight: QFont.Weight = QFont.Normal) -> QFont:
+    """图表绘制用字体（按字号/字重缓存；QFont 隐式共享，painter.setFont 只增加引用计数）"""
+    return QFont("Microsoft YaHei", point_size, weight)
+
+
 # 指标卡片渐变色
 METRIC_GRADIENTS = {
     "time": ("#3B82F6", "#1D4ED8"),      # 蓝色
@@ -31,6 +39,20 @@ METRIC_GRADIENTS = {
     "activities": ("#F59E0B", "#D97706"), # 橙色
 }
 
+# 对比行差异标签的样式（按主题名缓存，所有行共用同一组字符串）
+_diff_style_cache: Dict[str, Dict[str, str]] = {}
+
+
+def _diff_label_styles(t) -> Dict[str, str]:
+    """返回 {颜色: 样式表}，覆盖增加/减少/持平三种差异颜色"""
+    styles = _diff_style_cache.get(t.name)
+    if styles is None:
+        styles = _diff_style_cache[t.name] = {
+            color: f"color: {color}; font-size: 12px; font-weight: bold;"
+            for color in (t.success, t.error, t.text_muted)
+        }
+    return styles
+
 
 def normalize_app_name(name: str) -> str:
     """归一化应用名称"""
@@ -247,6 +269,9 @@ class DonutChart(QWidget):
         self.setMinimumSize(200, 200)
         self.setMouseTracking(True)
         self._hovered_index = -1
+        # 静态环形图缓存：悬停时只叠加绘制高亮段，不重绘整张图
+        self._cache: Optional[QPixmap] = None
+        self._cache_key = None
     
     def set_data(self, data: List[Tuple[str, float, str]], center_text: str = "", center_subtext: str = ""):
         """设置数据 [(标签, 数值, 颜色)]"""
@@ -254,31 +279,64 @@ class DonutChart(QWidget):
         self._total = sum(v for _, v, _ in data) if data else 0
         self._center_text = center_text
         self._center_subtext = center_subtext
+        self._cache = None
         self.update()
     
-    def paintEvent(self, event: QPaintEvent):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        t = get_theme()
-        
-        # 计算尺寸
+    def _geometry(self) -> Tuple[QPointF, float, float]:
+        """返回 (圆心, 外半径, 内半径)"""
         size = min(self.width(), self.height())
         outer_radius = size / 2 - 15
         inner_radius = outer_radius * 0.62
         center = QPointF(self.width() / 2, self.height() / 2)
+        return center, outer_radius, inner_radius
+    
+    def _segments(self):
+        """依次产出 (索引, 颜色, 起始角, 跨度角)，角度单位为 1/16 度"""
+        start_angle = 90 * 16  # 从顶部开始
+        gap_angle = 2 * 16  # 段之间的间隙
         
-        if not self._data or self._total <= 0:
-            # 无数据时画空环
-            painter.setPen(QPen(QColor(t.border), 3))
-            painter.setBrush(Qt.NoBrush)
-            painter.drawEllipse(center, outer_radius, outer_radius)
+        for idx, (label, value, color) in enumerate(self._data):
+            if value <= 0:
+                continue
             
-            painter.setPen(QPen(QColor(t.text_muted)))
-            painter.setFont(QFont("Microsoft YaHei", 12))
-            painter.drawText(self.rect(), Qt.AlignCenter, "暂无数据")
-            painter.end()
-            return
+            span_angle = int((value / self._total) * 360 * 16) - gap_angle
+            if span_angle <= 0:
+                continue
+            
+            yield idx, color, start_angle, span_angle
+            start_angle += span_angle + gap_angle
+    
+    def _draw_segment(self, painter: QPainter, center: QPointF, color: str,
+                      start_angle: int, span_angle: int, r_outer: float, r_inner: float):
+        """绘制单个扇形段"""
+        path = QPainterPath()
+        
+        rect = QRectF(center.x() - r_outer, center.y() - r_outer,
+                     r_outer * 2, r_outer * 2)
+        inner_rect = QRectF(center.x() - r_inner, center.y() - r_inner,
+                           r_inner * 2, r_inner * 2)
+        
+        path.arcMoveTo(rect, start_angle / 16)
+        path.arcTo(rect, start_angle / 16, span_angle / 16)
+        path.arcTo(inner_rect, (start_angle + span_angle) / 16, -span_angle / 16)
+        path.closeSubpath()
+        
+        # 渐变填充
+        base_color = QColor(color)
+        gradient = QRadialGradient(center, r_outer)
+        lighter = QColor(base_color)
+        lighter.setAlpha(255)
+        gradient.setColorAt(0.5, lighter)
+        gradient.setColorAt(1.0, base_color)
+        
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(gradient))
+        painter.drawPath(path)
+    
+    def _render_static(self, painter: QPainter):
+        """绘制不随悬停变化的部分（阴影、各段、内圈、中心文字）"""
+        t = get_theme()
+        center, outer_radius, inner_radius = self._geometry()
         
         # 绘制内圈阴影效果
         shadow_gradient = QRadialGradient(center, inner_radius * 1.1)
@@ -290,48 +348,9 @@ class DonutChart(QWidget):
         painter.drawEllipse(center, inner_radius * 1.1, inner_radius * 1.1)
         
         # 绘制各段
-        start_angle = 90 * 16  # 从顶部开始
-        gap_angle = 2 * 16  # 段之间的间隙
-        
-        for idx, (label, value, color) in enumerate(self._data):
-            if value <= 0:
-                continue
-            
-            span_angle = int((value / self._total) * 360 * 16) - gap_angle
-            if span_angle <= 0:
-                continue
-            
-            # 创建扇形路径
-            path = QPainterPath()
-            
-            # 悬停时稍微放大
-            hover_offset = 3 if idx == self._hovered_index else 0
-            r_outer = outer_radius + hover_offset
-            r_inner = inner_radius
-            
-            rect = QRectF(center.x() - r_outer, center.y() - r_outer,
-                         r_outer * 2, r_outer * 2)
-            inner_rect = QRectF(center.x() - r_inner, center.y() - r_inner,
-                               r_inner * 2, r_inner * 2)
-            
-            path.arcMoveTo(rect, start_angle / 16)
-            path.arcTo(rect, start_angle / 16, span_angle / 16)
-            path.arcTo(inner_rect, (start_angle + span_angle) / 16, -span_angle / 16)
-            path.closeSubpath()
-            
-            # 渐变填充
-            base_color = QColor(color)
-            gradient = QRadialGradient(center, r_outer)
-            lighter = QColor(base_color)
-            lighter.setAlpha(255)
-            gradient.setColorAt(0.5, lighter)
-            gradient.setColorAt(1.0, base_color)
-            
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(gradient))
-            painter.drawPath(path)
-            
-            start_angle += span_angle + gap_angle
+        for _, color, start_angle, span_angle in self._segments():
+            self._draw_segment(painter, center, color, start_angle, span_angle,
+                               outer_radius, inner_radius)
         
         # 绘制内圈背景
         painter.setBrush(QBrush(QColor(t.bg_secondary)))
@@ -340,18 +359,63 @@ class DonutChart(QWidget):
         
         # 绘制中心文字
         painter.setPen(QPen(QColor(t.text_primary)))
-        painter.setFont(QFont("Microsoft YaHei", 22, QFont.Bold))
+        painter.setFont(_chart_font(22, QFont.Bold))
         
         text_rect = QRectF(center.x() - inner_radius, center.y() - 18,
                           inner_radius * 2, 30)
         painter.drawText(text_rect, Qt.AlignCenter, self._center_text)
         
         # 副标题
-        painter.setFont(QFont("Microsoft YaHei", 10))
+        painter.setFont(_chart_font(10))
         painter.setPen(QPen(QColor(t.text_muted)))
         subtext_rect = QRectF(center.x() - inner_radius, center.y() + 12,
                              inner_radius * 2, 20)
         painter.drawText(subtext_rect, Qt.AlignCenter, self._center_subtext)
+    
+    def _static_pixmap(self) -> QPixmap:
+        """获取静态图层缓存，尺寸、缩放或主题变化时重建"""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, get_theme().name)
+        if self._cache is None or self._cache_key != key:
+            pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            cache_painter = QPainter(pixmap)
+            cache_painter.setRenderHint(QPainter.Antialiasing)
+            self._render_static(cache_painter)
+            cache_painter.end()
+            self._cache = pixmap
+            self._cache_key = key
+        return self._cache
+    
+    def paintEvent(self, event: QPaintEvent):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        t = get_theme()
+        center, outer_radius, inner_radius = self._geometry()
+        
+        if not self._data or self._total <= 0:
+            # 无数据时画空环
+            painter.setPen(QPen(QColor(t.border), 3))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawEllipse(center, outer_radius, outer_radius)
+            
+            painter.setPen(QPen(QColor(t.text_muted)))
+            painter.setFont(_chart_font(12))
+            painter.drawText(self.rect(), Qt.AlignCenter, "暂无数据")
+            painter.end()
+            return
+        
+        painter.drawPixmap(0, 0, self._static_pixmap())
+        
+        # 悬停段稍微放大，叠加在缓存之上
+        if self._hovered_index >= 0:
+            for idx, color, start_angle, span_angle in self._segments():
+                if idx == self._hovered_index:
+                    self._draw_segment(painter, center, color, start_angle, span_angle,
+                                       outer_radius + 3, inner_radius)
+                    break
         
         painter.end()
     
@@ -433,8 +497,8 @@ class BarChartWidget(QWidget):
     
     def paintEvent(self, event):
         """绘制柱状图"""
+        # 网格线都是水平直线，先不开抗锯齿绘制，到画圆角/曲线时再开启
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
         t = get_theme()
         width = self.width()
@@ -467,31 +531,37 @@ class BarChartWidget(QWidget):
         tick_count = int(y_max / y_step) + 1
         
         # 绘制 Y 轴刻度和网格线
-        painter.setFont(QFont("Microsoft YaHei", 9))
+        painter.setFont(_chart_font(9))
+        
+        # 画笔在循环外构造一次
+        grid_color = QColor(t.border)
+        grid_color.setAlpha(80)
+        grid_pen = QPen(grid_color, 1, Qt.DotLine)
+        label_pen = QPen(QColor(t.text_muted), 1)
         
         for i in range(tick_count):
             hours = i * y_step
             y = margin_top + chart_height - (chart_height * hours / y_max)
             
             # 网格线（更淡）
-            grid_color = QColor(t.border)
-            grid_color.setAlpha(80)
-            painter.setPen(QPen(grid_color, 1, Qt.DotLine))
+            painter.setPen(grid_pen)
             painter.drawLine(margin_left, int(y), width - margin_right, int(y))
             
             # Y 轴标签
-            painter.setPen(QPen(QColor(t.text_muted), 1))
+            painter.setPen(label_pen)
             label = f"{hours:.0f}h" if hours == int(hours) else f"{hours:.1f}h"
             painter.drawText(0, int(y) - 8, margin_left - 5, 16, Qt.AlignRight | Qt.AlignVCenter, label)
         
         if not self._data:
             # 无数据提示
             painter.setPen(QPen(QColor(t.text_muted)))
-            painter.setFont(QFont("Microsoft YaHei", 11))
+            painter.setFont(_chart_font(11))
             painter.drawText(self.rect(), Qt.AlignCenter, "暂无数据")
             painter.end()
             return
         
+        painter.setRenderHint(QPainter.Antialiasing)
+        
         # 计算柱宽
         bar_count = len(self._data)
         total_gap = chart_width * 0.3  # 30% 用于间隔
@@ -503,18 +573,21 @@ class BarChartWidget(QWidget):
         total_bars_width = bar_count * bar_width + (bar_count - 1) * gap
         start_x = margin_left + (chart_width - total_bars_width) / 2
         
+        # 循环内复用的画刷/画笔/字体
+        bg_color = QColor(t.bg_tertiary)
+        bg_color.setAlpha(60)
+        bg_brush = QBrush(bg_color)
+        x_label_pen = QPen(QColor(t.text_secondary), 1)
+        x_label_font = _chart_font(8)
+        color_cache: Dict[str, Tuple[QColor, QColor]] = {}
+        
         # 绘制柱状图
         for i, day_data in enumerate(self._data):
             x = start_x + i * (bar_width + gap)
             categories = day_data.get("categories", {})
             
-            # 计算总高度用于绘制背景
-            total_minutes = sum(categories.values())
-            
             # 绘制柱子背景（淡色）
-            bg_color = QColor(t.bg_tertiary)
-            bg_color.setAlpha(60)
-            painter.setBrush(QBrush(bg_color))
+            painter.setBrush(bg_brush)
             painter.setPen(Qt.NoPen)
             bg_rect = QRectF(x, margin_top, bar_width, chart_height)
             painter.drawRoundedRect(bg_rect, 6, 6)
@@ -526,12 +599,16 @@ class BarChartWidget(QWidget):
                 if bar_height < 2:
                     continue
                 
-                color = QColor(get_category_color(cat))
+                colors = color_cache.get(cat)
+                if colors is None:
+                    color = QColor(get_category_color(cat))
+                    lighter = QColor(color)
+                    lighter.setAlpha(220)
+                    colors = color_cache[cat] = (color, lighter)
+                color, lighter = colors
                 
                 # 创建渐变
                 gradient = QLinearGradient(x, current_y - bar_height, x, current_y)
-                lighter = QColor(color)
-                lighter.setAlpha(220)
                 gradient.setColorAt(0, lighter)
                 gradient.setColorAt(1, color)
                 
@@ -550,8 +627,8 @@ class BarChartWidget(QWidget):
             else:
                 label = date_str
             
-            painter.setPen(QPen(QColor(t.text_secondary), 1))
-            painter.setFont(QFont("Microsoft YaHei", 8))
+            painter.setPen(x_label_pen)
+            painter.setFont(x_label_font)
             text_rect = QRectF(x - 5, height - margin_bottom + 5, bar_width + 10, 20)
             painter.drawText(text_rect, Qt.AlignCenter, label)
         
@@ -594,8 +671,8 @@ class LineChartWidget(QWidget):
     
     def paintEvent(self, event):
         """绘制折线图"""
+        # 网格线都是水平直线，先不开抗锯齿绘制，到画圆角/曲线时再开启
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
         t = get_theme()
         width = self.width()
@@ -614,28 +691,33 @@ class LineChartWidget(QWidget):
             return
         
         # 绘制 Y 轴刻度 (0-100)
-        painter.setFont(QFont("Microsoft YaHei", 9))
+        painter.setFont(_chart_font(9))
+        
+        grid_pen = QPen(QColor(t.border), 1, Qt.DotLine)
+        label_pen = QPen(QColor(t.text_muted), 1)
         
         for i in range(5):
             y = margin_top + chart_height - (chart_height * i / 4)
             score = 25 * i
             
             # 网格线
-            painter.setPen(QPen(QColor(t.border), 1, Qt.DotLine))
+            painter.setPen(grid_pen)
             painter.drawLine(margin_left, int(y), width - margin_right, int(y))
             
             # Y 轴标签
-            painter.setPen(QPen(QColor(t.text_muted), 1))
+            painter.setPen(label_pen)
             painter.drawText(0, int(y) - 8, margin_left - 5, 16, Qt.AlignRight | Qt.AlignVCenter, f"{score}")
         
         if len(self._data) < 2:
             # 数据不足，显示提示
             painter.setPen(QPen(QColor(t.text_muted)))
-            painter.setFont(QFont("Microsoft YaHei", 11))
+            painter.setFont(_chart_font(11))
             painter.drawText(self.rect(), Qt.AlignCenter, "数据不足，需要至少2天记录")
             painter.end()
             return
         
+        painter.setRenderHint(QPainter.Antialiasing)
+        
         # 计算点位置
         points = []
         point_count = len(self._data)
@@ -673,27 +755,32 @@ class LineChartWidget(QWidget):
             painter.drawPath(curve_path)
         
         # 绘制数据点和 X 轴标签
-        painter.setFont(QFont("Microsoft YaHei", 8))
+        painter.setFont(_chart_font(8))
         show_label_interval = max(1, len(points) // 7)  # 最多显示 7 个标签
         
+        glow_color = QColor(t.accent)
+        glow_color.setAlpha(50)
+        glow_brush = QBrush(glow_color)
+        dot_brush = QBrush(QColor(t.bg_primary))
+        dot_pen = QPen(QColor(t.accent), 2.5)
+        x_label_pen = QPen(QColor(t.text_secondary), 1)
+        
         for i, (x, y, date, score) in enumerate(points):
             # 数据点 - 带光晕效果
             # 外圈光晕
-            glow_color = QColor(t.accent)
-            glow_color.setAlpha(50)
-            painter.setBrush(QBrush(glow_color))
+            painter.setBrush(glow_brush)
             painter.setPen(Qt.NoPen)
             painter.drawEllipse(int(x) - 8, int(y) - 8, 16, 16)
             
             # 内圈
-            painter.setBrush(QBrush(QColor(t.bg_primary)))
-            painter.setPen(QPen(QColor(t.accent), 2.5))
+            painter.setBrush(dot_brush)
+            painter.setPen(dot_pen)
             painter.drawEllipse(int(x) - 5, int(y) - 5, 10, 10)
             
             # X 轴标签
             if i % show_label_interval == 0 or i == len(points) - 1:
                 label = date[-5:] if len(date) >= 5 else date
-                painter.setPen(QPen(QColor(t.text_secondary), 1))
+                painter.setPen(x_label_pen)
                 text_rect = QRect(int(x) - 25, height - margin_bottom + 5, 50, 20)
                 painter.drawText(text_rect, Qt.AlignCenter, label)
         
@@ -859,7 +946,7 @@ class CategoryLegend(QWidget):
             # 颜色块
             color_box = QLabel()
             color_box.setFixedSize(10, 10)
-            color_box.setStyleSheet(f"background-color: {get_category_color(cat)}; border-radius: 2px;")
+            color_box.setStyleSheet(get_category_swatch_style(cat))
             item_layout.addWidget(color_box)
             
             # 文字
@@ -881,133 +968,164 @@ class CategoryLegend(QWidget):
                     color_box = widget.layout().itemAt(0).widget()
                     if color_box:
                         cat = widget.layout().itemAt(1).widget().text()
-                        color_box.setStyleSheet(f"background-color: {get_category_color(cat)}; border-radius: 2px;")
+                        color_box.setStyleSheet(get_category_swatch_style(cat))
                         widget.layout().itemAt(1).widget().setStyleSheet(f"font-size: 11px; color: {t.text_primary};")
 
 
+# 热力图效率档位：分数经 bisect 落到 HEATMAP_SCORE_THRESHOLDS 的区间，对应下标取颜色（颜色只解析一次）
+HEATMAP_SCORE_THRESHOLDS = (30, 50, 70)
+HEATMAP_SCORE_COLORS = (
+    QColor("#EF4444"),  # 红色 - 低效
+    QColor("#F59E0B"),  # 黄色 - 一般
+    QColor("#3B82F6"),  # 蓝色 - 中等
+    QColor("#10B981"),  # 绿色 - 高效
+)
+
+# 热力图 X 轴标签（每隔 4 小时），模块加载时格式化一次
+HEATMAP_AXIS_LABELS = tuple((hour, f"{hour:02d}:00") for hour in range(0, 24, 4))
+
+
 class HourlyHeatmapWidget(QWidget):
     """每小时效率热力图 - 显示一天中各时段的效率分布（精致版）"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self._data: Dict[int, Tuple[float, float]] = {}  # hour -> (avg_score, total_minutes)
+        self._cell_colors: List[Optional[QColor]] = [None] * 24  # 每个小时格子的颜色，无数据为 None
         self.setMinimumHeight(100)
         self.setMinimumWidth(400)
         self.setMouseTracking(True)
         self._hovered_hour = -1
+        self._background: Optional[QPixmap] = None  # 格子与坐标轴的静态底图，悬停重绘时直接贴图
+        get_theme_manager().theme_changed.connect(self._invalidate_background)
     
     def set_data(self, data: Dict[int, Tuple[float, float]]):
         """设置数据 {hour: (avg_score, total_minutes)}"""
         self._data = data
+        
+        # 数据变化时一次性算好各格子颜色，paintEvent（悬停时频繁触发）只取用
+        cell_colors: List[Optional[QColor]] = [None] * 24
+        for hour, (score, minutes) in data.items():
+            if minutes > 0 and 0 <= hour < 24:
+                # 根据效率分数选颜色，根据时长调整透明度（更细腻的渐变）
+                color = QColor(HEATMAP_SCORE_COLORS[bisect_right(HEATMAP_SCORE_THRESHOLDS, score)])
+                color.setAlpha(min(255, int(120 + minutes * 1.5)))
+                cell_colors[hour] = color
+        self._cell_colors = cell_colors
+        self._invalidate_background()
+    
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+    
+    def _invalidate_background(self, *args):
+        """数据、尺寸或主题变化后丢弃缓存的静态底图"""
+        self._background = None
         self.update()
     
-    def paintEvent(self, event):
-        """绘制热力图"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        t = get_theme()
-        width = self.width()
-        height = self.height()
-        
-        margin_left = 10
-        margin_right = 10
-        margin_top = 10
-        margin_bottom = 25
-        
-        chart_width = width - margin_left - margin_right
-        chart_height = height - margin_top - margin_bottom
-        
+    def _cell_rect(self, hour: int) -> Optional[QRectF]:
+        """第 hour 个小时格子的矩形，控件过小无法绘制时返回 None"""
+        margin_left, margin_right, margin_top, margin_bottom = 10, 10, 10, 25
+        chart_width = self.width() - margin_left - margin_right
+        chart_height = self.height() - margin_top - margin_bottom
         if chart_width <= 0 or chart_height <= 0:
-            return
-        
+            return None
         cell_width = chart_width / 24
         cell_height = min(chart_height, 40)
         cell_y = margin_top + (chart_height - cell_height) / 2
+        return QRectF(margin_left + hour * cell_width + 2, cell_y, cell_width - 4, cell_height)
+    
+    def _render_background(self) -> QPixmap:
+        """把格子和坐标轴标签（不随悬停变化的部分）绘制到底图上"""
+        t = get_theme()
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
         
-        # 绘制每个小时的格子
-        for hour in range(24):
-            x = margin_left + hour * cell_width
-            
-            # 获取该小时的数据
-            score, minutes = self._data.get(hour, (0, 0))
-            
-            # 根据效率分数计算颜色
-            if minutes > 0:
-                # 有数据：根据分数显示颜色（渐变效果）
-                if score >= 70:
-                    base_color = QColor("#10B981")  # 绿色 - 高效
-                elif score >= 50:
-                    base_color = QColor("#3B82F6")  # 蓝色 - 中等
-                elif score >= 30:
-                    base_color = QColor("#F59E0B")  # 黄色 - 一般
-                else:
-                    base_color = QColor("#EF4444")  # 红色 - 低效
-                
-                # 根据时长调整透明度（更细腻的渐变）
-                alpha = min(255, int(120 + minutes * 1.5))
-                base_color.setAlpha(alpha)
-            else:
-                # 无数据：淡灰色
-                base_color = QColor(t.bg_tertiary)
-                base_color.setAlpha(100)
-            
-            # 绘制圆角格子
-            rect = QRectF(x + 2, cell_y, cell_width - 4, cell_height)
-            
-            # 悬停效果
-            if hour == self._hovered_hour:
-                # 高亮边框
-                painter.setPen(QPen(QColor(t.accent), 2))
-                painter.setBrush(QBrush(base_color))
-                painter.drawRoundedRect(rect, 6, 6)
-            else:
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QBrush(base_color))
-                painter.drawRoundedRect(rect, 6, 6)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        empty_color = QColor(t.bg_tertiary)
+        empty_color.setAlpha(100)
+        empty_brush = QBrush(empty_color)
+        
+        # 绘制每个小时的格子：有数据用预先算好的颜色，无数据：淡灰色
+        painter.setPen(Qt.NoPen)
+        for hour, color in enumerate(self._cell_colors):
+            painter.setBrush(QBrush(color) if color is not None else empty_brush)
+            painter.drawRoundedRect(self._cell_rect(hour), 6, 6)
         
         # 绘制 X 轴标签（每隔 4 小时）
         painter.setPen(QPen(QColor(t.text_muted)))
-        painter.setFont(QFont("Microsoft YaHei", 9))
-        for hour in [0, 4, 8, 12, 16, 20, 24]:
-            if hour == 24:
-                x = margin_left + 23 * cell_width + cell_width
-            else:
-                x = margin_left + hour * cell_width
-            label = f"{hour:02d}:00" if hour < 24 else ""
-            if hour < 24:
-                painter.drawText(int(x) - 15, height - 5, label)
+        painter.setFont(_chart_font(9))
+        cell_width = (self.width() - 20) / 24
+        for hour, label in HEATMAP_AXIS_LABELS:
+            x = 10 + hour * cell_width
+            painter.drawText(int(x) - 15, self.height() - 5, label)
         
         painter.end()
+        return pixmap
     
-    def mouseMoveEvent(self, event):
-        """鼠标移动显示 tooltip"""
-        margin_left = 10
-        chart_width = self.width() - margin_left - 10
-        cell_width = chart_width / 24
+    def paintEvent(self, event):
+        """绘制热力图：静态底图缓存复用，每次只叠加悬停高亮"""
+        if self._cell_rect(0) is None:
+            return
+        if self._background is None:
+            self._background = self._render_background()
         
-        x = event.position().x() - margin_left
-        if 0 <= x < chart_width:
-            hour = int(x / cell_width)
-            if 0 <= hour < 24:
-                self._hovered_hour = hour
-                score, minutes = self._data.get(hour, (0, 0))
-                
-                if minutes > 0:
-                    self.setToolTip(f"{hour:02d}:00 - {hour+1:02d}:00\n效率: {score:.0f}%\n时长: {minutes:.0f}分钟")
-                else:
-                    self.setToolTip(f"{hour:02d}:00 - {hour+1:02d}:00\n无数据")
-                
-                self.update()
-                return
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background)
         
-        self._hovered_hour = -1
-        self.setToolTip("")
+        # 悬停效果：高亮边框
+        if 0 <= self._hovered_hour < 24:
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(QColor(get_theme().accent), 2))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRoundedRect(self._cell_rect(self._hovered_hour), 6, 6)
+        
+        painter.end()
+    
+    def _hour_at(self, x: float) -> int:
+        """横坐标对应的小时格子，不在格子范围内返回 -1"""
+        margin_left = 10
+        chart_width = self.width() - margin_left - 10
+        x -= margin_left
+        if chart_width <= 0 or not 0 <= x < chart_width:
+            return -1
+        hour = int(x / (chart_width / 24))
+        return hour if 0 <= hour < 24 else -1
+    
+    def mouseMoveEvent(self, event):
+        """鼠标移动只更新悬停高亮（悬停的小时变化时才重绘）"""
+        hour = self._hour_at(event.position().x())
+        if hour == self._hovered_hour:
+            return
+        self._hovered_hour = hour
+        QToolTip.hideText()
         self.update()
     
+    def event(self, event):
+        """tooltip 在 Qt 真正请求显示时才生成文本，鼠标划过时不逐格构造字符串"""
+        if event.type() == QEvent.ToolTip:
+            hour = self._hour_at(event.pos().x())
+            if hour < 0:
+                QToolTip.hideText()
+                event.ignore()
+                return True
+            score, minutes = self._data.get(hour, (0, 0))
+            if minutes > 0:
+                text = f"{hour:02d}:00 - {hour+1:02d}:00\n效率: {score:.0f}%\n时长: {minutes:.0f}分钟"
+            else:
+                text = f"{hour:02d}:00 - {hour+1:02d}:00\n无数据"
+            QToolTip.showText(event.globalPos(), text, self)
+            return True
+        return super().event(event)
+    
     def leaveEvent(self, event):
-        self._hovered_hour = -1
-        self.update()
+        if self._hovered_hour != -1:
+            self._hovered_hour = -1
+            self.update()
 
 
 class WeekCompareWidget(QWidget):
@@ -1086,15 +1204,9 @@ class WeekCompareWidget(QWidget):
         t = get_theme()
         
         # 清除旧内容
-        while self.summary_layout.count():
-            item = self.summary_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        clear_layout(self.summary_layout)
         
-        while self.detail_container.count():
-            item = self.detail_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        clear_layout(self.detail_container)
         
         # 计算总时长
         this_total = sum(v for k, v in self._this_week_data.items() if not k.startswith("_"))
@@ -1113,6 +1225,12 @@ class WeekCompareWidget(QWidget):
         all_cats = set(self._this_week_data.keys()) | set(self._last_week_data.keys())
         all_cats = {c for c in all_cats if not c.startswith("_")}
         
+        # 各行共用的样式字符串在循环外构造一次
+        cat_style = f"color: {t.text_primary}; font-size: 12px;"
+        value_style = f"color: {t.text_secondary}; font-size: 12px;"
+        last_style = f"color: {t.text_muted}; font-size: 12px;"
+        diff_styles = _diff_label_styles(t)
+        
         for cat in sorted(all_cats):
             this_val = self._this_week_data.get(cat, 0)
             last_val = self._last_week_data.get(cat, 0)
@@ -1123,20 +1241,20 @@ class WeekCompareWidget(QWidget):
             # 类别颜色
             color_box = QLabel()
             color_box.setFixedSize(10, 10)
-            color_box.setStyleSheet(f"background-color: {get_category_color(cat)}; border-radius: 2px;")
+            color_box.setStyleSheet(get_category_swatch_style(cat))
             row.addWidget(color_box)
             
             # 类别名
             cat_label = QLabel(cat)
             cat_label.setFixedWidth(50)
-            cat_label.setStyleSheet(f"color: {t.text_primary}; font-size: 12px;")
+            cat_label.setStyleSheet(cat_style)
             row.addWidget(cat_label)
             
             # 本周
             this_label = QLabel(f"{this_val:.0f}m")
             this_label.setFixedWidth(60)
             this_label.setAlignment(Qt.AlignRight)
-            this_label.setStyleSheet(f"color: {t.text_secondary}; font-size: 12px;")
+            this_label.setStyleSheet(value_style)
             row.addWidget(this_label)
             
             # 变化
@@ -1154,13 +1272,13 @@ class WeekCompareWidget(QWidget):
             diff_label = QLabel(diff_text)
             diff_label.setFixedWidth(80)
             diff_label.setAlignment(Qt.AlignCenter)
-            diff_label.setStyleSheet(f"color: {diff_color}; font-size: 12px; font-weight: bold;")
+            diff_label.setStyleSheet(diff_styles[diff_color])
             row.addWidget(diff_label)
             
             # 上周
             last_label = QLabel(f"{last_val:.0f}m")
             last_label.setFixedWidth(60)
-            last_label.setStyleSheet(f"color: {t.text_muted}; font-size: 12px;")
+            last_label.setStyleSheet(last_style)
             row.addWidget(last_label)
             
             row.addStretch()
@@ -1237,6 +1355,7 @@ class DateCompareWidget(QWidget):
         self.storage = storage
         self._date1_data: Dict[str, float] = {}
         self._date2_data: Dict[str, float] = {}
+        self._loaded_key: Optional[Tuple[str, str, int]] = None  # (日期1, 日期2, 卡片修订号)
         self._setup_ui()
         self.apply_theme()
         get_theme_manager().theme_changed.connect(self.apply_theme)
@@ -1302,9 +1421,18 @@ class DateCompareWidget(QWidget):
         # 获取数据
         self._date1_data = self._get_date_stats(date1_str)
         self._date2_data = self._get_date_stats(date2_str)
+        self._loaded_key = (date1_str, date2_str, self.storage.get_cards_revision())
         
         self._update_comparison()
     
+    def refresh(self):
+        """外部刷新入口：所选日期与卡片数据都未变化时不重新查询"""
+        revision = self.storage.get_cards_revision()
+        key = (self.combo1.currentText(), self.combo2.currentText(), revision)
+        if revision >= 0 and key == self._loaded_key:
+            return
+        self._on_date_changed()
+    
     def _get_date_stats(self, date_str: str) -> Dict[str, float]:
         """获取某天的统计数据"""
         try:
@@ -1325,10 +1453,7 @@ class DateCompareWidget(QWidget):
     def _update_comparison(self):
         """更新对比显示"""
         # 清除旧内容
-        while self.compare_container.count():
-            item = self.compare_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        clear_layout(self.compare_container)
         
         t = get_theme()
         
@@ -1341,6 +1466,11 @@ class DateCompareWidget(QWidget):
             self.compare_container.addWidget(empty)
             return
         
+        # 各行共用的样式字符串在循环外构造一次
+        cat_style = f"color: {t.text_primary}; font-size: 12px;"
+        value_style = f"color: {t.text_secondary}; font-size: 12px;"
+        diff_styles = _diff_label_styles(t)
+        
         for cat in sorted(all_cats):
             min1 = self._date1_data.get(cat, 0)
             min2 = self._date2_data.get(cat, 0)
@@ -1352,22 +1482,20 @@ class DateCompareWidget(QWidget):
             # 类别颜色
             color_box = QLabel()
             color_box.setFixedSize(10, 10)
-            color_box.setStyleSheet(
-                f"background-color: {get_category_color(cat)}; border-radius: 2px;"
-            )
+            color_box.setStyleSheet(get_category_swatch_style(cat))
             row.addWidget(color_box)
             
             # 类别名
             cat_label = QLabel(cat)
             cat_label.setFixedWidth(50)
-            cat_label.setStyleSheet(f"color: {t.text_primary}; font-size: 12px;")
+            cat_label.setStyleSheet(cat_style)
             row.addWidget(cat_label)
             
             # 日期1时间
             time1 = QLabel(f"{min1:.0f}m")
             time1.setFixedWidth(50)
             time1.setAlignment(Qt.AlignRight)
-            time1.setStyleSheet(f"color: {t.text_secondary}; font-size: 12px;")
+            time1.setStyleSheet(value_style)
             row.addWidget(time1)
             
             # 差异
@@ -1384,13 +1512,13 @@ class DateCompareWidget(QWidget):
             diff_label = QLabel(diff_text)
             diff_label.setFixedWidth(70)
             diff_label.setAlignment(Qt.AlignCenter)
-            diff_label.setStyleSheet(f"color: {diff_color}; font-size: 12px; font-weight: bold;")
+            diff_label.setStyleSheet(diff_styles[diff_color])
             row.addWidget(diff_label)
             
             # 日期2时间
             time2 = QLabel(f"{min2:.0f}m")
             time2.setFixedWidth(50)
-            time2.setStyleSheet(f"color: {t.text_secondary}; font-size: 12px;")
+            time2.setStyleSheet(value_style)
             row.addWidget(time2)
             
             row.addStretch()
@@ -1445,10 +1573,7 @@ class AppUsageListWidget(QWidget):
     
     def _refresh(self):
         # 清空旧行
-        while self.rows_container.count():
-            item = self.rows_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        clear_layout(self.rows_container)
         
         if not self._data:
             self.empty_label.show()
@@ -1460,15 +1585,31 @@ class AppUsageListWidget(QWidget):
         total_minutes = sum(m for _, m in self._data) or 1
         top_items = self._data[:10]  # 只展示前 10 个
         
+        # 各行共用的样式字符串在循环外构造一次
+        name_style = f"color: {t.text_primary}; font-size: 12px;"
+        time_style = f"color: {t.text_secondary}; font-size: 12px;"
+        bar_style = f"""
+            QProgressBar {{
+                background-color: {t.bg_tertiary};
+                border: none;
+                border-radius: 6px;
+            }}
+            QProgressBar::chunk {{
+                background-color: {t.accent};
+                border-radius: 6px;
+            }}
+        """
+        
         for name, minutes in top_items:
-            row = QWidget()
-            row_layout = QHBoxLayout(row)
+            # 行布局直接建在最终加入列表的容器上，不再先挂到临时控件再被 setLayout 转移
+            container = QWidget()
+            row_layout = QHBoxLayout(container)
             row_layout.setContentsMargins(0, 0, 0, 0)
             row_layout.setSpacing(10)
             
             name_label = QLabel(name or "未命名")
             name_label.setFixedWidth(160)
-            name_label.setStyleSheet(f"color: {t.text_primary}; font-size: 12px;")
+            name_label.setStyleSheet(name_style)
             row_layout.addWidget(name_label)
             
             bar = QProgressBar()
@@ -1477,27 +1618,15 @@ class AppUsageListWidget(QWidget):
             bar.setValue(int(percent))
             bar.setTextVisible(False)
             bar.setFixedHeight(12)
-            bar.setStyleSheet(f"""
-                QProgressBar {{
-                    background-color: {t.bg_tertiary};
-                    border: none;
-                    border-radius: 6px;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {t.accent};
-                    border-radius: 6px;
-                }}
-            """)
+            bar.setStyleSheet(bar_style)
             row_layout.addWidget(bar, 1)
             
             time_label = QLabel(self._format_minutes(minutes))
             time_label.setFixedWidth(70)
             time_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            time_label.setStyleSheet(f"color: {t.text_secondary}; font-size: 12px;")
+            time_label.setStyleSheet(time_style)
             row_layout.addWidget(time_label)
             
-            container = QWidget()
-            container.setLayout(row_layout)
             self.rows_container.addWidget(container)
     
     def _format_minutes(self, minutes: float) -> str:
@@ -1522,6 +1651,7 @@ class StatsPanel(QWidget):
         super().__init__(parent)
         self.storage = storage
         self._current_range = "week"  # week / month
+        self._loaded_key: Optional[Tuple[str, str, int]] = None  # (范围, 日期, 卡片修订号)
         self._setup_ui()
         self._load_data()
         
@@ -1701,11 +1831,17 @@ class StatsPanel(QWidget):
         # 防止重复加载
         if hasattr(self, '_loading') and self._loading:
             return
+        
+        # 范围、日期与卡片数据都未变化时，聚合结果相同，直接跳过
+        today = datetime.now()
+        revision = self.storage.get_cards_revision()
+        load_key = (self._current_range, today.strftime("%Y-%m-%d"), revision)
+        if revision >= 0 and load_key == self._loaded_key:
+            return
+        
         self._loading = True
         
         try:
-            today = datetime.now()
-            
             if self._current_range == "week":
                 days = 7
             else:
@@ -1720,7 +1856,10 @@ class StatsPanel(QWidget):
             trend_data: List[Tuple[str, float]] = []
             total_today_minutes = 0
             app_usage_by_range: Dict[str, float] = {}
-            hourly_data: Dict[int, List[Tuple[float, float]]] = {h: [] for h in range(24)}  # 热力图数据
+            # 热力图数据：按小时预分配的累加数组，收集时原地累加，避免逐小时建列表再二次求和
+            hour_score_sum = [0.0] * 24
+            hour_minutes = [0.0] * 24
+            hour_count = [0] * 24
             
             # 汇总数据（用于指标卡片和环形图）
             total_minutes_range = 0
@@ -1730,32 +1869,34 @@ class StatsPanel(QWidget):
             activity_count = 0
             category_minutes: Dict[str, float] = {}
             
-            # 上周数据（用于对比）
-            prev_total_minutes = 0
-            prev_total_score = 0
-            prev_score_count = 0
-            prev_deep_work = 0
-            prev_activities = 0
-            
-            # 加载上周数据
-            for i in range(days + days - 1, days - 1, -1):
-                date = today - timedelta(days=i)
-                cards = self.storage.get_cards_for_date(date)
-                
-                for card in cards:
-                    prev_total_minutes += card.duration_minutes
-                    prev_activities += 1
-                    if card.productivity_score > 0:
-                        prev_total_score += card.productivity_score
-                        prev_score_count += 1
-                    if card.duration_minutes >= 60:
-                        prev_deep_work += 1
-            
+            # 上周数据（用于对比）- 只需要汇总值，直接由数据库聚合
+            prev_start = (today - timedelta(days=days + days - 1)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            prev_end = (today - timedelta(days=days)).replace(
+                hour=23, minute=59, second=59, microsecond=999999
+            )
+            prev_summary = self.storage.get_period_summary(prev_start, prev_end)
+            prev_total_minutes = prev_summary["total_minutes"]
+            prev_total_score = prev_summary["score_sum"]
+            prev_score_count = prev_summary["score_count"]
+            prev_deep_work = prev_summary["deep_work_count"]
+            prev_activities = prev_summary["activity_count"]
+
+            # 一次查询取出整个范围的卡片，再按日期分组（替代逐日查询）
+            range_start = (today - timedelta(days=days - 1)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            range_end = today.replace(hour=23, minute=59, second=59, microsecond=999999)
+            cards_by_date: Dict[str, List] = {}
+            for card in self.storage.get_cards_in_range(range_start, range_end):
+                cards_by_date.setdefault(card.start_time.strftime("%Y-%m-%d"), []).append(card)
+
             for i in range(days - 1, -1, -1):
                 date = today - timedelta(days=i)
                 date_str = date.strftime("%Y-%m-%d")
                 
-                cards = self.storage.get_cards_for_date(date)
+                cards = cards_by_date.get(date_str, [])
                 
                 # 分类统计
                 categories = {}
@@ -1785,12 +1926,14 @@ class StatsPanel(QWidget):
                     # 收集热力图数据（按小时）
                     if card.start_time:
                         hour = card.start_time.hour
-                        hourly_data[hour].append((card.productivity_score, card.duration_minutes))
+                        hour_score_sum[hour] += card.productivity_score
+                        hour_minutes[hour] += minutes
+                        hour_count[hour] += 1
                     
                     # 统计当前时间范围内的应用/网站使用（周/月）
                     if card.app_sites:
                         # 先做 duration_seconds 的兜底与归一化，避免与卡片总时长严重不符
-                        card_total_seconds = max(card.duration_minutes, 0) * 60
+                        card_total_seconds = max(minutes, 0) * 60
                         raw_seconds = [max(getattr(app, "duration_seconds", 0) or 0, 0) for app in card.app_sites]
                         sum_app_seconds = sum(raw_seconds)
                         
@@ -1865,12 +2008,11 @@ class StatsPanel(QWidget):
             self.app_usage_widget.set_data(sorted_usage)
             
             # 更新热力图
-            heatmap_data = {}
-            for hour, items in hourly_data.items():
-                if items:
-                    avg_score = sum(s for s, m in items) / len(items)
-                    total_minutes = sum(m for s, m in items)
-                    heatmap_data[hour] = (avg_score, total_minutes)
+            heatmap_data = {
+                hour: (hour_score_sum[hour] / count, hour_minutes[hour])
+                for hour, count in enumerate(hour_count)
+                if count
+            }
             self.heatmap_widget.set_data(heatmap_data)
             
             # 更新周对比
@@ -1882,6 +2024,8 @@ class StatsPanel(QWidget):
                 self.goal_widget.set_goal(int(goal))
             except ValueError:
                 pass
+            
+            self._loaded_key = load_key
         finally:
             # 恢复更新
             self.bar_chart.setUpdatesEnabled(True)
@@ -1895,7 +2039,7 @@ class StatsPanel(QWidget):
     def refresh(self):
         """刷新数据"""
         self._load_data()
-        self.compare_widget._on_date_changed()
+        self.compare_widget.refresh()
     
     def apply_theme(self):
         """应用主题"""
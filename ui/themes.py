@@ -2,14 +2,18 @@
 Dayflow Windows - 主题管理
 IDE 风格的亮色/暗色主题
 """
+import logging
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 import sys
 import time
 from PySide6.QtWidgets import QApplication, QMessageBox, QDialog, QWidget
-from PySide6.QtCore import Signal, QObject
+from PySide6.QtCore import Qt, Signal, QObject
 from PySide6.QtGui import QPalette, QColor
 
+logger = logging.getLogger(__name__)
+
 if sys.platform == 'win32':
     import ctypes
     from ctypes import wintypes
@@ -38,10 +42,13 @@ CATEGORY_COLORS = {
     "待办": "#EF4444",      # Red
 }
 
+# 未知类别使用的颜色
+DEFAULT_CATEGORY_COLOR = CATEGORY_COLORS["其他"]
+
 
-@dataclass
+@dataclass(eq=False)
 class Theme:
-    """主题颜色定义"""
+    """主题颜色定义（只有 DARK_THEME / LIGHT_THEME 两个常量实例，按身份比较即可，不逐字段比较）"""
     name: str
     
     # 背景色
@@ -146,6 +153,7 @@ class ThemeManager(QObject):
             return
         super().__init__()
         self._current_theme = LIGHT_THEME
+        self._stylesheet_cache: Dict[str, str] = {}  # 主题名 -> 全局样式表
         self._initialized = True
     
     @property
@@ -163,20 +171,18 @@ class ThemeManager(QObject):
             theme: 主题对象
             emit_signal: 是否立即发出主题变化信号
         """
-        if self._current_theme == theme:
+        if self._current_theme is theme:
             return  # 避免重复切换
         self._current_theme = theme
         
         start_time = time.time()
         self._apply_global_theme()
-        global_theme_time = time.time() - start_time
-        print(f"[主题切换] _apply_global_theme 耗时: {global_theme_time*1000:.2f}ms")
+        logger.debug("[主题切换] _apply_global_theme 耗时: %.2fms", (time.time() - start_time) * 1000)
         
         if emit_signal:
             start_time = time.time()
             self.theme_changed.emit(theme)
-            signal_time = time.time() - start_time
-            print(f"[主题切换] theme_changed 信号发出耗时: {signal_time*1000:.2f}ms")
+            logger.debug("[主题切换] theme_changed 信号发出耗时: %.2fms", (time.time() - start_time) * 1000)
     
     def toggle_theme(self):
         """切换主题"""
@@ -199,13 +205,11 @@ class ThemeManager(QObject):
         if app:
             start_time = time.time()
             app.setStyleSheet(self.get_global_stylesheet())
-            stylesheet_time = time.time() - start_time
-            print(f"[主题切换] setStyleSheet 耗时: {stylesheet_time*1000:.2f}ms")
+            logger.debug("[主题切换] setStyleSheet 耗时: %.2fms", (time.time() - start_time) * 1000)
             
             start_time = time.time()
             self._apply_palette(app)
-            palette_time = time.time() - start_time
-            print(f"[主题切换] _apply_palette 耗时: {palette_time*1000:.2f}ms")
+            logger.debug("[主题切换] _apply_palette 耗时: %.2fms", (time.time() - start_time) * 1000)
     
     def _apply_palette(self, app):
         """应用调色板以控制对话框标题栏颜色"""
@@ -233,8 +237,16 @@ class ThemeManager(QObject):
         app.setPalette(palette)
     
     def get_global_stylesheet(self) -> str:
+        """获取当前主题的全局样式表（每个主题只生成一次）"""
+        name = self._current_theme.name
+        stylesheet = self._stylesheet_cache.get(name)
+        if stylesheet is None:
+            stylesheet = self._build_global_stylesheet(self._current_theme)
+            self._stylesheet_cache[name] = stylesheet
+        return stylesheet
+    
+    def _build_global_stylesheet(self, t: Theme) -> str:
         """生成全局样式表"""
-        t = self._current_theme
         return f"""
             /* ===== 全局基础 ===== */
             QMainWindow {{
@@ -243,7 +255,6 @@ class ThemeManager(QObject):
             
             QWidget {{
                 color: {t.text_primary};
-                font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
             }}
             
             /* ===== 滚动条 ===== */
@@ -329,6 +340,120 @@ class ThemeManager(QObject):
         """
 
 
+def _build_activity_card_stylesheet(t: Theme) -> str:
+    """时间轴活动卡片样式
+    
+    卡片通过动态属性选择样式（efficiency: 效率档位，categoryColor: 类别色，pressed: 按下状态），
+    每个主题生成一份，设置在卡片自身上（祖先控件的样式表优先于应用级样式表，不能放进全局样式表）。
+    """
+    rules = [f"""
+            /* ===== 活动卡片 ===== */
+            QFrame#activityCard {{
+                background-color: {t.bg_secondary};
+                border: 1px solid {t.border};
+                border-left: 4px solid {t.text_muted};
+                border-radius: 0px 16px 16px 0px;
+            }}
+            QFrame#activityCard:hover {{
+                background-color: {t.bg_hover};
+                border-color: {t.accent};
+            }}
+            QFrame#activityCard[pressed="true"] {{
+                background-color: {t.bg_hover};
+                border: 2px solid {t.accent};
+                border-left: 4px solid {t.text_muted};
+            }}
+            QFrame#activityCard QLabel#titleLabel {{
+                color: {t.text_primary};
+                font-size: 16px;
+                font-weight: 600;
+            }}
+            QFrame#activityCard QLabel#summaryLabel {{
+                color: {t.text_secondary};
+                font-size: 13px;
+                line-height: 1.5;
+            }}
+            QFrame#activityCard QLabel#timeLabel {{
+                color: {t.text_muted};
+                font-size: 12px;
+            }}
+            QFrame#activityCard QLabel#appLabel {{
+                background-color: {t.bg_tertiary};
+                color: {t.text_secondary};
+                padding: 3px 8px;
+                border-radius: 3px;
+                font-size: 11px;
+            }}
+            QFrame#activityCard QLabel#moreLabel {{
+                color: {t.text_muted};
+                font-size: 11px;
+            }}
+            QFrame#activityCard QLabel#deepWorkBadge {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #FF6B6B, stop:1 #FF8E53);
+                color: white;
+                padding: 4px 10px;
+                border-radius: 10px;
+                font-size: 11px;
+                font-weight: 600;
+            }}
+            QFrame#activityCard QLabel#scoreLabel {{
+                font-size: 12px;
+                font-weight: 600;
+            }}
+            QFrame#activityCard QLabel#categoryLabel {{
+                color: {t.text_primary};
+                padding: 5px 12px;
+                border-radius: 6px;
+                font-size: 12px;
+                font-weight: 600;
+            }}
+        """]
+    
+    # 效率档位：左侧指示条与评分文字颜色
+    for level in EFFICIENCY_LEVELS:
+        color = get_efficiency_color(EFFICIENCY_LEVEL_SCORES[level], t)
+        rules.append(f"""
+            QFrame#activityCard[efficiency="{level}"],
+            QFrame#activityCard[efficiency="{level}"]:hover,
+            QFrame#activityCard[efficiency="{level}"][pressed="true"] {{
+                border-left-color: {color};
+            }}
+            QFrame#activityCard QLabel#scoreLabel[efficiency="{level}"] {{
+                color: {color};
+            }}
+        """)
+    
+    # 类别标签：类别色 40% 透明度背景
+    for color in sorted(set(CATEGORY_COLORS.values())):
+        r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+        rules.append(f"""
+            QFrame#activityCard QLabel#categoryLabel[categoryColor="{category_color_key(color)}"] {{
+                background-color: rgba({r}, {g}, {b}, 0.4);
+            }}
+        """)
+    
+    return "".join(rules)
+
+
+# 效率档位（与 get_efficiency_color 的阈值一致）及每档的代表分数
+EFFICIENCY_LEVELS = ("high", "medium", "low")
+EFFICIENCY_LEVEL_SCORES = {"high": 70, "medium": 40, "low": 0}
+
+
+def get_efficiency_level(score: float) -> str:
+    """根据效率分数获取档位（high / medium / low）"""
+    if score >= 70:
+        return "high"
+    elif score >= 40:
+        return "medium"
+    return "low"
+
+
+def category_color_key(color: str) -> str:
+    """将类别色转换为可用于样式表属性选择器的键（去掉 # 的大写十六进制）"""
+    return color.lstrip("#").upper()
+
+
 # 全局函数
 def get_theme_manager() -> ThemeManager:
     """获取主题管理器实例"""
@@ -468,4 +593,90 @@ def show_question(parent: Optional[QWidget], title: str, message: str, buttons=Q
 
 def get_category_color(category: str) -> str:
     """获取类别对应的颜色"""
-    return CATEGORY_COLORS.get(category, "#78716C")
+    return CATEGORY_COLORS.get(category, DEFAULT_CATEGORY_COLOR)
+
+
+@lru_cache(maxsize=64)
+def get_category_rgb(category: str) -> Tuple[int, int, int]:
+    """获取类别颜色的 (r, g, b) 分量（每个类别只解析一次）"""
+    color = QColor(get_category_color(category))
+    return color.red(), color.green(), color.blue()
+
+
+@lru_cache(maxsize=64)
+def get_category_color_key(category: str) -> str:
+    """类别对应的样式表属性选择器键（每个类别只计算一次，卡片绑定时直接复用）"""
+    return category_color_key(get_category_color(category))
+
+
+@lru_cache(maxsize=64)
+def get_category_swatch_style(category: str) -> str:
+    """类别色块（图例、对比列表中的小方块）的样式表，与主题无关，每个类别只格式化一次"""
+    return f"background-color: {get_category_color(category)}; border-radius: 2px;"
+
+
+_activity_card_style_cache: Dict[str, str] = {}
+
+
+def get_activity_card_stylesheet() -> str:
+    """活动卡片的样式表（按主题名缓存，所有卡片共用同一份字符串）"""
+    t = get_theme()
+    style = _activity_card_style_cache.get(t.name)
+    if style is None:
+        style = _activity_card_style_cache[t.name] = _build_activity_card_stylesheet(t)
+    return style
+
+
+_context_menu_style_cache: Dict[str, str] = {}
+
+
+def get_context_menu_stylesheet() -> str:
+    """卡片右键菜单的样式表（按主题名缓存，每次弹出菜单时直接复用）"""
+    t = get_theme()
+    style = _context_menu_style_cache.get(t.name)
+    if style is None:
+        style = _context_menu_style_cache[t.name] = f"""
+            QMenu {{
+                background-color: {t.bg_secondary};
+                border: 1px solid {t.border};
+                border-radius: 8px;
+                padding: 4px;
+            }}
+            QMenu::item {{
+                padding: 8px 24px;
+                border-radius: 4px;
+                color: {t.text_primary};
+            }}
+            QMenu::item:selected {{
+                background-color: {t.bg_hover};
+            }}
+        """
+    return style
+
+
+# 确认弹窗中引用内容预览的最大显示宽度（像素）
+PREVIEW_TEXT_WIDTH = 280
+
+
+def elide_preview_text(widget: QWidget, text: str, width: int = PREVIEW_TEXT_WIDTH) -> str:
+    """按控件字体的实际显示宽度截断文本（超出时末尾加省略号，中英文宽度都正确）"""
+    return widget.fontMetrics().elidedText(text.replace("\n", " "), Qt.ElideRight, width)
+
+
+def clear_layout(layout, keep: int = 0) -> None:
+    """清空布局中的条目，保留末尾 keep 个（如 stretch）
+    
+    从末尾倒序 takeAt，避免每次取头部时后续条目整体前移；控件先隐藏脱离显示，
+    再统一 deleteLater 交给事件循环销毁。嵌套的子布局会被递归清空。
+    """
+    widgets = []
+    for index in reversed(range(layout.count() - keep)):
+        item = layout.takeAt(index)
+        widget = item.widget()
+        if widget is not None:
+            widget.hide()
+            widgets.append(widget)
+        elif item.layout() is not None:
+            clear_layout(item.layout())
+    for widget in widgets:
+        widget.deleteLater()
@@ -1,6 +1,7 @@
 """
 Dayflow Windows - 时间轴视图组件
 """
+import logging
 from datetime import datetime, timedelta
 from typing import List, Optional
 import time
@@ -11,14 +12,20 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
     QFrame, QSizePolicy, QProgressBar, QGraphicsDropShadowEffect,
     QPushButton, QFileDialog, QLineEdit, QDialog, QComboBox,
-    QSpinBox, QMenu, QMessageBox, QTextEdit
+    QSpinBox, QMenu, QMessageBox, QTextEdit, QGridLayout
 )
-from PySide6.QtCore import Qt, Signal, QSize, QPropertyAnimation, QEasingCurve, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QPropertyAnimation, QEasingCurve, QTimer
 from PySide6.QtGui import QColor, QFont, QPalette, QLinearGradient, QPainter, QBrush, QAction
-from ui.themes import show_question
+from ui.themes import show_question, elide_preview_text
 
 from core.types import ActivityCard
-from ui.themes import get_theme_manager, get_theme, get_efficiency_color, get_category_color
+from ui.themes import (
+    get_theme_manager, get_theme, get_efficiency_level,
+    get_category_color, get_category_color_key, get_context_menu_stylesheet,
+    get_activity_card_stylesheet,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class CardEditDialog(QDialog):
@@ -254,7 +261,6 @@ class CardEditDialog(QDialog):
                 color: {"#000000" if t.name == "light" else "#FFFFFF"};
                 font-size: 14px;
                 font-weight: 500;
-                font-family: "Segoe UI", "Microsoft YaHei", sans-serif;
                 min-width: 80px;
             }}
             QSpinBox:focus {{
@@ -325,6 +331,12 @@ class StatsSummaryWidget(QFrame):
         self._data = {}  # category -> minutes
         self._total_minutes = 0
         self._collapsed = False
+        # 统计条行复用池：(row, cat_label, bar, time_label)；数据变化时只更新内容，不重建控件
+        self._bar_rows: List[tuple] = []
+        # 每行进度条当前样式对应的类别（None 表示需要重新设置样式）
+        self._bar_styled_categories: List[Optional[str]] = []
+        # 折叠期间数据变化时只记标记，展开时再刷新统计条
+        self._bars_stale = False
         self._setup_ui()
         self.apply_theme()
         get_theme_manager().theme_changed.connect(self.apply_theme)
@@ -360,11 +372,18 @@ class StatsSummaryWidget(QFrame):
         self.chart_container = QVBoxLayout(self.chart_widget)
         self.chart_container.setContentsMargins(0, 0, 0, 0)
         self.chart_container.setSpacing(8)
+        
+        self.empty_label = QLabel("暂无数据")
+        self.empty_label.hide()
+        self.chart_container.addWidget(self.empty_label)
         layout.addWidget(self.chart_widget)
     
     def _toggle_collapse(self):
         """切换折叠状态"""
         self._collapsed = not self._collapsed
+        if not self._collapsed and self._bars_stale:
+            # 展开前先刷新统计条，显示时只需一次布局
+            self._regenerate_bars()
         self.chart_widget.setVisible(not self._collapsed)
         self.collapse_btn.setText("▶" if self._collapsed else "▼")
         
@@ -410,25 +429,25 @@ class StatsSummaryWidget(QFrame):
             }}
         """)
         
-        # 重新生成图表以应用新主题
+        self.empty_label.setStyleSheet(f"color: {t.text_muted}; font-size: 13px;")
+        
+        # 已创建的统计条按新主题重新设置样式
+        label_style, time_style = self._bar_label_styles()
+        for _, cat_label, _, time_label in self._bar_rows:
+            cat_label.setStyleSheet(label_style)
+            time_label.setStyleSheet(time_style)
+        self._bar_styled_categories = [None] * len(self._bar_rows)
         if self._data:
-            self._regenerate_bars()
+            self._refresh_bars()
     
     def _regenerate_bars(self):
-        """重新生成所有柱状图"""
-        # 清除现有柱状图
-        while self.chart_container.count():
-            item = self.chart_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        if not self._data:
-            return
-        
-        # 按时间排序并重新创建
+        """按当前数据刷新统计条（复用已有行，多余的行隐藏备用）"""
         sorted_data = sorted(self._data.items(), key=lambda x: x[1], reverse=True)
-        for category, minutes in sorted_data:
-            self._add_bar(category, minutes)
+        for index, (category, minutes) in enumerate(sorted_data):
+            self._bind_bar(index, category, minutes)
+        for row, _, _, _ in self._bar_rows[len(sorted_data):]:
+            row.hide()
+        self._bars_stale = False
     
     def set_data(self, cards: list):
         """根据卡片数据设置统计 - 优化版本"""
@@ -451,85 +470,111 @@ class StatsSummaryWidget(QFrame):
         mins = int(self._total_minutes % 60)
         self.total_label.setText(f"共 {hours}h {mins}m")
         
+        self.empty_label.setVisible(not self._data)
+        self._refresh_bars()
+    
+    def _refresh_bars(self):
+        """刷新统计条；折叠时图表不可见，推迟到展开时再刷新"""
+        if self._collapsed:
+            self._bars_stale = True
+            return
+        
         # 暂停更新以减少重绘
         self.chart_widget.setUpdatesEnabled(False)
         
         try:
-            # 清除旧数据
-            while self.chart_container.count():
-                item = self.chart_container.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            
-            if not self._data:
-                t = get_theme()
-                empty = QLabel("暂无数据")
-                empty.setStyleSheet(f"color: {t.text_muted}; font-size: 13px;")
-                self.chart_container.addWidget(empty)
-                return
-            
-            # 按时间排序
-            sorted_data = sorted(self._data.items(), key=lambda x: x[1], reverse=True)
-            
-            # 创建柱状图
-            for category, minutes in sorted_data:
-                self._add_bar(category, minutes)
+            self._regenerate_bars()
         finally:
             self.chart_widget.setUpdatesEnabled(True)
     
-    def _add_bar(self, category: str, minutes: float):
-        """添加一个统计条"""
+    @staticmethod
+    def _bar_label_styles() -> tuple:
+        """统计条类别名、时间标签的样式"""
         t = get_theme()
-        row = QWidget()
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-        row_layout.setSpacing(8)
-        
-        # 类别名 - 使用主题文字颜色
-        cat_label = QLabel(category)
-        cat_label.setFixedWidth(60)
-        cat_label.setStyleSheet(f"""
+        label_style = f"""
             font-size: 12px;
             color: {t.text_primary};
-        """)
-        row_layout.addWidget(cat_label)
+        """
+        time_style = f"""
+            font-size: 12px;
+            color: {t.text_muted};
+        """
+        return label_style, time_style
+    
+    def _bind_bar(self, index: int, category: str, minutes: float):
+        """让第 index 行统计条显示指定类别，行不足时新建"""
+        if index < len(self._bar_rows):
+            row, cat_label, bar, time_label = self._bar_rows[index]
+        else:
+            row = QWidget()
+            row_layout = QHBoxLayout(row)
+            row_layout.setContentsMargins(0, 0, 0, 0)
+            row_layout.setSpacing(8)
+            label_style, time_style = self._bar_label_styles()
+            
+            # 类别名 - 使用主题文字颜色
+            cat_label = QLabel()
+            cat_label.setFixedWidth(60)
+            cat_label.setStyleSheet(label_style)
+            row_layout.addWidget(cat_label)
+            
+            # 进度条
+            bar = QProgressBar()
+            bar.setRange(0, 100)
+            bar.setTextVisible(False)
+            bar.setFixedHeight(12)
+            row_layout.addWidget(bar, 1)
+            
+            # 时间
+            time_label = QLabel()
+            time_label.setFixedWidth(50)
+            time_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            time_label.setStyleSheet(time_style)
+            row_layout.addWidget(time_label)
+            
+            self._bar_rows.append((row, cat_label, bar, time_label))
+            self._bar_styled_categories.append(None)
+            self.chart_container.addWidget(row)
         
-        # 进度条
+        cat_label.setText(category)
         percentage = (minutes / self._total_minutes * 100) if self._total_minutes > 0 else 0
-        bar = QProgressBar()
-        bar.setRange(0, 100)
         bar.setValue(int(percentage))
-        bar.setTextVisible(False)
-        bar.setFixedHeight(12)
         
-        color = get_category_color(category)
-        bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {t.bg_tertiary};
-                border: none;
-                border-radius: 6px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 6px;
-            }}
-        """)
-        row_layout.addWidget(bar, 1)
+        # 进度条颜色随类别变化，类别未变时不重新解析样式表
+        if self._bar_styled_categories[index] != category:
+            t = get_theme()
+            color = get_category_color(category)
+            bar.setStyleSheet(f"""
+                QProgressBar {{
+                    background-color: {t.bg_tertiary};
+                    border: none;
+                    border-radius: 6px;
+                }}
+                QProgressBar::chunk {{
+                    background-color: {color};
+                    border-radius: 6px;
+                }}
+            """)
+            self._bar_styled_categories[index] = category
         
-        # 时间
         hours = int(minutes // 60)
         mins = int(minutes % 60)
-        time_str = f"{hours}h {mins}m" if hours else f"{mins}m"
-        time_label = QLabel(time_str)
-        time_label.setFixedWidth(50)
-        time_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        time_label.setStyleSheet(f"""
-            font-size: 12px;
-            color: {t.text_muted};
-        """)
-        row_layout.addWidget(time_label)
-        
-        self.chart_container.addWidget(row)
+        time_label.setText(f"{hours}h {mins}m" if hours else f"{mins}m")
+        row.show()
+
+
+# 计入"深度工作"徽章的类别（时长 >= 60 分钟时显示）
+DEEP_WORK_CATEGORIES = frozenset({"工作", "学习", "编程", "会议"})
+
+
+def _set_style_property(widget: QWidget, name: str, value):
+    """设置用于样式表属性选择器的动态属性，值变化时重新 polish 使样式生效"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
 
 
 class ActivityCardWidget(QFrame):
@@ -539,164 +584,84 @@ class ActivityCardWidget(QFrame):
     edit_requested = Signal(ActivityCard)
     delete_requested = Signal(int)  # card_id
     
+    # 最多显示的应用/网站标签数
+    MAX_APP_LABELS = 4
+    
     def __init__(self, card: ActivityCard, parent=None):
         super().__init__(parent)
         self.card = card
         self._setup_ui()
+        self._bind_card()
         self.apply_theme()
         get_theme_manager().theme_changed.connect(self.apply_theme)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
     
     def _setup_ui(self):
+        # 可选元素（徽章、评分、摘要、应用标签）始终创建，由 _bind_card 控制显隐，
+        # 以便 TimelineView 复用卡片实例；样式表由 apply_theme 设置（同主题下所有卡片共用一份），
+        # 卡片内容变化时只通过 objectName 和动态属性选择样式
         t = get_theme()
         self.setObjectName("activityCard")
         self.setCursor(Qt.PointingHandCursor)
         self.setFrameShape(QFrame.StyledPanel)
         
-        # 获取效率颜色
-        efficiency_color = get_efficiency_color(self.card.productivity_score)
-        
-        # 获取类别颜色
-        category_color = get_category_color(self.card.category)
-        
-        # 主布局
-        layout = QVBoxLayout(self)
+        # 主布局：单个网格，顶部一行按列排布，标题/摘要/应用标签跨整行，
+        # 避免每张卡片多套一层 QHBoxLayout；隐藏的行列不占间距
+        layout = QGridLayout(self)
         layout.setContentsMargins(16, 14, 16, 14)
-        layout.setSpacing(8)
+        layout.setHorizontalSpacing(12)
+        layout.setVerticalSpacing(8)
         
-        # 顶部：类别标签 + 时间 + 深度工作徽章
-        top_layout = QHBoxLayout()
-        top_layout.setSpacing(12)
+        # 顶部：类别标签 + 深度工作徽章 + 时间 + （弹性列）+ 评分
         
         # 类别标签
-        category_label = QLabel(self.card.category or "活动")
-        
-        # 解析颜色并转换为 rgba 格式
-        color = QColor(category_color)
-        r, g, b = color.red(), color.green(), color.blue()
-        
-        # 使用 rgba() 格式设置带透明度的背景颜色
-        category_label.setStyleSheet(f"""
-            background-color: rgba({r}, {g}, {b}, 0.4);
-            color: {t.text_primary};
-            padding: 5px 12px;
-            border-radius: 6px;
-            font-size: 12px;
-            font-weight: 600;
-        """)
-        top_layout.addWidget(category_label)
+        self.category_label = QLabel()
+        self.category_label.setObjectName("categoryLabel")
+        layout.addWidget(self.category_label, 0, 0)
         
         # 深度工作徽章 (duration >= 60 分钟，且类别为工作相关)
-        work_categories = ["工作", "学习", "编程", "会议"]
-        if self.card.duration_minutes >= 60 and self.card.category in work_categories:
-            deep_work_badge = QLabel("🔥 深度工作")
-            deep_work_badge._is_deep_work_badge = True
-            deep_work_badge.setStyleSheet(f"""
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #FF6B6B, stop:1 #FF8E53);
-                color: white;
-                padding: 4px 10px;
-                border-radius: 10px;
-                font-size: 11px;
-                font-weight: 600;
-            """)
-            top_layout.addWidget(deep_work_badge)
+        self.deep_work_badge = QLabel("🔥 深度工作")
+        self.deep_work_badge.setObjectName("deepWorkBadge")
+        layout.addWidget(self.deep_work_badge, 0, 1)
         
         # 时间范围
-        time_str = self._format_time_range()
-        time_label = QLabel(time_str)
-        time_label.setObjectName("timeLabel")
-        time_label.setStyleSheet(f"""
-            QLabel#timeLabel {{
-                color: {t.text_muted};
-                font-size: 12px;
-            }}
-        """)
-        top_layout.addWidget(time_label)
-        top_layout.addStretch()
+        self.time_label = QLabel()
+        self.time_label.setObjectName("timeLabel")
+        layout.addWidget(self.time_label, 0, 2)
+        layout.setColumnStretch(3, 1)
         
         # 生产力评分
-        if self.card.productivity_score > 0:
-            score_label = QLabel(f"⚡ {int(self.card.productivity_score)}%")
-            score_label._is_score_label = True
-            score_label.setStyleSheet(f"""
-                color: {efficiency_color};
-                font-size: 12px;
-                font-weight: 600;
-            """)
-            top_layout.addWidget(score_label)
-        
-        layout.addLayout(top_layout)
+        self.score_label = QLabel()
+        self.score_label.setObjectName("scoreLabel")
+        layout.addWidget(self.score_label, 0, 4)
         
         # 标题
-        title_label = QLabel(self.card.title or "未命名活动")
-        title_label.setObjectName("titleLabel")
-        title_label.setWordWrap(True)
-        title_label.setStyleSheet(f"""
-            QLabel#titleLabel {{
-                color: {t.text_primary};
-                font-size: 16px;
-                font-weight: 600;
-            }}
-        """)
-        layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setObjectName("titleLabel")
+        self.title_label.setWordWrap(True)
+        layout.addWidget(self.title_label, 1, 0, 1, 5)
         
         # 摘要
-        if self.card.summary:
-            summary_label = QLabel(self.card.summary)
-            summary_label.setObjectName("summaryLabel")
-            summary_label.setWordWrap(True)
-            summary_label.setStyleSheet(f"""
-                QLabel#summaryLabel {{
-                    color: {t.text_secondary};
-                    font-size: 13px;
-                    line-height: 1.5;
-                }}
-            """)
-            layout.addWidget(summary_label)
-        
-        # 应用/网站标签
-        if self.card.app_sites:
-            apps_layout = QHBoxLayout()
-            apps_layout.setSpacing(6)
-            
-            for i, app in enumerate(self.card.app_sites[:4]):  # 最多显示4个
-                app_label = QLabel(app.name)
-                app_label._is_app_label = True
-                app_label.setStyleSheet(f"""
-                    background-color: {t.bg_tertiary};
-                    color: {t.text_secondary};
-                    padding: 3px 8px;
-                    border-radius: 3px;
-                    font-size: 11px;
-                """)
-                apps_layout.addWidget(app_label)
-            
-            if len(self.card.app_sites) > 4:
-                more_label = QLabel(f"+{len(self.card.app_sites) - 4}")
-                more_label.setStyleSheet(f"""
-                    color: {t.text_muted};
-                    font-size: 11px;
-                """)
-                apps_layout.addWidget(more_label)
-            
-            apps_layout.addStretch()
-            layout.addLayout(apps_layout)
-        
-        # 卡片样式 - 左侧效率指示条 + 右侧圆角
-        self.setStyleSheet(f"""
-            QFrame#activityCard {{
-                background-color: {t.bg_secondary};
-                border: 1px solid {t.border};
-                border-left: 4px solid {efficiency_color};
-                border-radius: 0px 16px 16px 0px;
-            }}
-            QFrame#activityCard:hover {{
-                background-color: {t.bg_hover};
-                border-color: {t.accent};
-                border-left: 4px solid {efficiency_color};
-            }}
-        """)
+        self.summary_label = QLabel()
+        self.summary_label.setObjectName("summaryLabel")
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label, 2, 0, 1, 5)
+        
+        # 应用/网站标签（数量可变的标签条，保留一层水平布局）
+        apps_layout = QHBoxLayout()
+        apps_layout.setSpacing(6)
+        self.app_labels = []
+        for _ in range(self.MAX_APP_LABELS):
+            app_label = QLabel()
+            app_label.setObjectName("appLabel")
+            apps_layout.addWidget(app_label)
+            self.app_labels.append(app_label)
+        self.more_label = QLabel()
+        self.more_label.setObjectName("moreLabel")
+        apps_layout.addWidget(self.more_label)
+        apps_layout.addStretch()
+        layout.addLayout(apps_layout, 3, 0, 1, 5)
         
         # 添加柔和阴影效果
         shadow = QGraphicsDropShadowEffect(self)
@@ -705,102 +670,57 @@ class ActivityCardWidget(QFrame):
         shadow.setOffset(0, 6)
         self.setGraphicsEffect(shadow)
     
-    def apply_theme(self):
-        """应用主题"""
-        t = get_theme()
-        efficiency_color = get_efficiency_color(self.card.productivity_score)
-        category_color = get_category_color(self.card.category)
+    def rebind(self, card: ActivityCard):
+        """复用当前卡片实例显示另一条活动"""
+        self.card = card
+        self._bind_card()
+    
+    def _bind_card(self):
+        """将 self.card 的内容写入各标签"""
+        card = self.card
+        
+        # 样式相关的动态属性（值变化时才重新 polish）
+        efficiency = get_efficiency_level(card.productivity_score)
+        _set_style_property(self, "efficiency", efficiency)
+        _set_style_property(self.score_label, "efficiency", efficiency)
+        _set_style_property(self.category_label, "categoryColor", get_category_color_key(card.category))
+        
+        self.category_label.setText(card.category or "活动")
+        self.deep_work_badge.setVisible(
+            card.duration_minutes >= 60 and card.category in DEEP_WORK_CATEGORIES
+        )
+        self.time_label.setText(self._format_time_range())
         
-        # 解析颜色并转换为 rgba 格式
-        color = QColor(category_color)
-        r, g, b = color.red(), color.green(), color.blue()
+        if card.productivity_score > 0:
+            self.score_label.setText(f"⚡ {int(card.productivity_score)}%")
+            self.score_label.show()
+        else:
+            self.score_label.hide()
         
-        # 更新所有标签的样式
-        for child in self.findChildren(QLabel):
-            object_name = child.objectName()
-            
-            if object_name == "titleLabel":
-                child.setStyleSheet(f"""
-                    QLabel#titleLabel {{
-                        color: {t.text_primary};
-                        font-size: 16px;
-                        font-weight: 600;
-                    }}
-                """)
-            elif object_name == "summaryLabel":
-                child.setStyleSheet(f"""
-                    QLabel#summaryLabel {{
-                        color: {t.text_secondary};
-                        font-size: 13px;
-                        line-height: 1.5;
-                    }}
-                """)
-            elif object_name == "timeLabel":
-                child.setStyleSheet(f"""
-                    QLabel#timeLabel {{
-                        color: {t.text_muted};
-                        font-size: 12px;
-                    }}
-                """)
-            else:
-                # 类别标签或其他标签
-                child.setStyleSheet(f"""
-                    background-color: rgba({r}, {g}, {b}, 0.4);
-                    color: {t.text_primary};
-                    padding: 5px 12px;
-                    border-radius: 6px;
-                    font-size: 12px;
-                    font-weight: 600;
-                """)
-        
-        # 更新应用/网站标签样式
-        for child in self.findChildren(QLabel):
-            if hasattr(child, '_is_app_label'):
-                child.setStyleSheet(f"""
-                    background-color: {t.bg_tertiary};
-                    color: {t.text_secondary};
-                    padding: 3px 8px;
-                    border-radius: 3px;
-                    font-size: 11px;
-                """)
-        
-        # 更新深度工作徽章
-        if self.card.duration_minutes >= 60:
-            for child in self.findChildren(QLabel):
-                if hasattr(child, '_is_deep_work_badge'):
-                    child.setStyleSheet(f"""
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #FF6B6B, stop:1 #FF8E53);
-                        color: white;
-                        padding: 4px 10px;
-                        border-radius: 10px;
-                        font-size: 11px;
-                        font-weight: 600;
-                    """)
-        
-        # 更新生产力评分标签
-        if self.card.productivity_score > 0:
-            for child in self.findChildren(QLabel):
-                if hasattr(child, '_is_score_label'):
-                    child.setStyleSheet(f"""
-                        color: {efficiency_color};
-                        font-size: 12px;
-                        font-weight: 600;
-                    """)
-        
-        # 更新卡片样式
-        self.setStyleSheet(f"""
-            QFrame#activityCard {{
-                background-color: {t.bg_secondary};
-                border: 1px solid {t.border};
-                border-left: 4px solid {efficiency_color};
-                border-radius: 0px 16px 16px 0px;
-            }}
-            QFrame#activityCard:hover {{
-                background-color: {t.bg_hover};
-                border-color: {t.accent};
-                border-left: 4px solid {efficiency_color};
-            }}
-        """)
+        self.title_label.setText(card.title or "未命名活动")
+        
+        if card.summary:
+            self.summary_label.setText(card.summary)
+            self.summary_label.show()
+        else:
+            self.summary_label.hide()
+        
+        app_sites = card.app_sites or []
+        for app_label, app in zip(self.app_labels, app_sites):
+            app_label.setText(app.name)
+            app_label.show()
+        for app_label in self.app_labels[len(app_sites):]:
+            app_label.hide()
+        
+        if len(app_sites) > self.MAX_APP_LABELS:
+            self.more_label.setText(f"+{len(app_sites) - self.MAX_APP_LABELS}")
+            self.more_label.show()
+        else:
+            self.more_label.hide()
+    
+    def apply_theme(self):
+        """应用主题（设置当前主题共用的卡片样式表）"""
+        self.setStyleSheet(get_activity_card_stylesheet())
     
     def _format_time_range(self) -> str:
         """格式化时间范围"""
@@ -821,16 +741,7 @@ class ActivityCardWidget(QFrame):
     
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            t = get_theme()
-            efficiency_color = get_efficiency_color(self.card.productivity_score)
-            self.setStyleSheet(f"""
-                QFrame#activityCard {{
-                    background-color: {t.bg_hover};
-                    border: 2px solid {t.accent};
-                    border-left: 4px solid {efficiency_color};
-                    border-radius: 0px 16px 16px 0px;
-                }}
-            """)
+            _set_style_property(self, "pressed", True)
             self.clicked.emit(self.card)
             try:
                 super().mousePressEvent(event)
@@ -841,43 +752,13 @@ class ActivityCardWidget(QFrame):
     
     def mouseReleaseEvent(self, event):
         # 恢复原始样式
-        t = get_theme()
-        efficiency_color = get_efficiency_color(self.card.productivity_score)
-        self.setStyleSheet(f"""
-            QFrame#activityCard {{
-                background-color: {t.bg_secondary};
-                border: 1px solid {t.border};
-                border-left: 4px solid {efficiency_color};
-                border-radius: 0px 16px 16px 0px;
-            }}
-            QFrame#activityCard:hover {{
-                background-color: {t.bg_hover};
-                border-color: {t.accent};
-                border-left: 4px solid {efficiency_color};
-            }}
-        """)
+        _set_style_property(self, "pressed", False)
         super().mouseReleaseEvent(event)
     
     def _show_context_menu(self, pos):
         """显示右键菜单"""
-        t = get_theme()
         menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {t.bg_secondary};
-                border: 1px solid {t.border};
-                border-radius: 8px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 8px 24px;
-                border-radius: 4px;
-                color: {t.text_primary};
-            }}
-            QMenu::item:selected {{
-                background-color: {t.bg_hover};
-            }}
-        """)
+        menu.setStyleSheet(get_context_menu_stylesheet())
         
         # 编辑
         edit_action = QAction("✏️ 编辑", self)
@@ -898,7 +779,7 @@ class ActivityCardWidget(QFrame):
         reply = show_question(
             self,
             "确认删除",
-            f"确定要删除这条活动记录吗？\n\n「{self.card.title or '未命名活动'}」"
+            f"确定要删除这条活动记录吗？\n\n「{elide_preview_text(self, self.card.title or '未命名活动')}」"
         )
         if reply == QMessageBox.Yes:
             self.delete_requested.emit(self.card.id)
@@ -976,6 +857,9 @@ class TimelineView(QWidget):
         super().__init__(parent)
         self._cards: List[ActivityCard] = []
         self._filtered_cards: List[ActivityCard] = []
+        self._search_index: Optional[List[str]] = None  # 与 _cards 一一对应的小写搜索文本，卡片变化时置空重建
+        self._card_pool: List[ActivityCardWidget] = []  # 已创建的卡片组件，按布局顺序复用
+        self._visible_card_count = 0  # 当前正在使用的卡片组件数量
         self._current_date = datetime.now()
         self._search_text = ""
         
@@ -1036,7 +920,6 @@ class TimelineView(QWidget):
     
     def apply_theme(self):
         """应用主题"""
-        print(f"[TimelineView] apply_theme 开始")
         start_time = time.time()
         
         t = get_theme()
@@ -1060,35 +943,18 @@ class TimelineView(QWidget):
             }}
         """)
         
-        search_time = time.time() - start_time
-        print(f"[TimelineView] 搜索框样式设置耗时: {search_time*1000:.2f}ms")
-        
-        # 只更新现有卡片的样式，不重新创建卡片
-        if self._cards:
-            cards_start = time.time()
-            card_count = 0
-            for i in range(self.cards_layout.count()):
-                item = self.cards_layout.itemAt(i)
-                widget = item.widget()
-                if widget and hasattr(widget, 'apply_theme'):
-                    card_start = time.time()
-                    widget.apply_theme()
-                    card_time = time.time() - card_start
-                    card_count += 1
-                    if card_count <= 3:  # 只打印前3个卡片的耗时
-                        print(f"[TimelineView] 卡片 {card_count} apply_theme 耗时: {card_time*1000:.2f}ms")
-            cards_time = time.time() - cards_start
-            print(f"[TimelineView] 更新 {card_count} 个卡片样式总耗时: {cards_time*1000:.2f}ms, 平均: {(cards_time*1000/card_count if card_count > 0 else 0):.2f}ms/卡片")
-        
-        total_time = time.time() - start_time
-        print(f"[TimelineView] apply_theme 总耗时: {total_time*1000:.2f}ms")
+        # 活动卡片各自监听 theme_changed 重设样式表，这里无需逐个卡片处理
+        
+        logger.debug("[TimelineView] apply_theme 耗时: %.2fms", (time.time() - start_time) * 1000)
     
+    @Slot(str)
     def _on_search_changed(self, text: str):
         """搜索文本变化 - 使用防抖"""
         self._pending_search = text.strip().lower()
         # 300ms 防抖，避免频繁刷新
         self._search_timer.start(300)
     
+    @Slot()
     def _do_search(self):
         """执行搜索"""
         self._search_text = self._pending_search
@@ -1099,30 +965,31 @@ class TimelineView(QWidget):
         if not self._search_text:
             return self._cards
         
-        filtered = []
-        for card in self._cards:
-            # 搜索标题和摘要
-            title = (card.title or "").lower()
-            summary = (card.summary or "").lower()
-            category = (card.category or "").lower()
-            
-            if (self._search_text in title or 
-                self._search_text in summary or 
-                self._search_text in category):
-                filtered.append(card)
-        
-        return filtered
+        # 标题、摘要、类别的小写文本每张卡片只拼接一次，输入搜索词时直接匹配
+        if self._search_index is None:
+            self._search_index = [
+                "\n".join(((card.title or "").lower(), (card.summary or "").lower(), (card.category or "").lower()))
+                for card in self._cards
+            ]
+        
+        return [
+            card for card, haystack in zip(self._cards, self._search_index)
+            if self._search_text in haystack
+        ]
     
     def set_cards(self, cards: List[ActivityCard]):
         """设置卡片列表"""
         import logging
         self._cards = cards
+        self._search_index = None
         self._refresh_cards()
     
     def add_card(self, card: ActivityCard):
         """添加单个卡片"""
         self._cards.append(card)
-        self._add_card_widget(card)
+        self._search_index = None
+        self._bind_card_widget(self._visible_card_count, card)
+        self._visible_card_count += 1
         self._update_empty_state()
     
     def _refresh_cards(self, scroll_to_bottom: bool = False):
@@ -1136,33 +1003,15 @@ class TimelineView(QWidget):
         self.cards_container.setUpdatesEnabled(False)
         
         try:
-            # 清除现有卡片
-            widgets_to_delete = []
-            while self.cards_layout.count() > 1:  # 保留 stretch
-                item = self.cards_layout.takeAt(0)
-                if item.widget() and item.widget() != self.empty_widget:
-                    widget = item.widget()
-                    # 先断开所有信号连接，防止在删除后仍有信号访问
-                    try:
-                        widget.blockSignals(True)
-                    except:
-                        pass
-                    widgets_to_delete.append(widget)
-            
-            # 删除所有旧的 widget
-            for widget in widgets_to_delete:
-                try:
-                    widget.setParent(None)
-                    widget.deleteLater()
-                except:
-                    pass
-            
             # 获取过滤后的卡片
             filtered_cards = self._get_filtered_cards()
             
-            # 批量添加新卡片
-            for card in filtered_cards:
-                self._add_card_widget(card, animate=False)
+            # 复用已有的卡片组件，只在数量不足时新建；多余的隐藏备用
+            for index, card in enumerate(filtered_cards):
+                self._bind_card_widget(index, card)
+            for widget in self._card_pool[len(filtered_cards):self._visible_card_count]:
+                widget.hide()
+            self._visible_card_count = len(filtered_cards)
             
             self._update_empty_state(filtered_cards)
             
@@ -1181,20 +1030,27 @@ class TimelineView(QWidget):
         
         QTimer.singleShot(10, restore_scroll)
     
-    def _add_card_widget(self, card: ActivityCard, animate: bool = True):
-        """添加卡片组件"""
-        widget = ActivityCardWidget(card)
-        widget.clicked.connect(self._on_card_clicked)
-        widget.edit_requested.connect(self._on_edit_card)
-        widget.delete_requested.connect(self._on_delete_card)
-        
-        # 插入到 stretch 之前
-        self.cards_layout.insertWidget(self.cards_layout.count() - 1, widget)
+    def _bind_card_widget(self, index: int, card: ActivityCard):
+        """让第 index 个卡片组件显示 card，组件池不足时新建"""
+        if index < len(self._card_pool):
+            widget = self._card_pool[index]
+            widget.rebind(card)
+        else:
+            widget = ActivityCardWidget(card)
+            widget.clicked.connect(self._on_card_clicked)
+            widget.edit_requested.connect(self._on_edit_card)
+            widget.delete_requested.connect(self._on_delete_card)
+            self._card_pool.append(widget)
+            # 插入到 stretch 之前
+            self.cards_layout.insertWidget(self.cards_layout.count() - 1, widget)
+        widget.show()
     
+    @Slot(object)
     def _on_card_clicked(self, card: ActivityCard):
         """卡片点击 - 打开编辑对话框"""
         self._on_edit_card(card)
     
+    @Slot(object)
     def _on_edit_card(self, card: ActivityCard):
         """打开编辑对话框"""
         dialog = CardEditDialog(card, self)
@@ -1202,6 +1058,7 @@ class TimelineView(QWidget):
         dialog.card_deleted.connect(self._handle_card_deleted)
         dialog.exec()
     
+    @Slot(int)
     def _on_delete_card(self, card_id: int):
         """处理删除请求"""
         self._handle_card_deleted(card_id)
@@ -1209,6 +1066,7 @@ class TimelineView(QWidget):
     def _handle_card_updated(self, card: ActivityCard):
         """处理卡片更新"""
         self.card_updated.emit(card)
+        self._search_index = None
         # 刷新显示
         self._refresh_cards()
     
@@ -1217,6 +1075,7 @@ class TimelineView(QWidget):
         self.card_deleted.emit(card_id)
         # 从本地列表移除
         self._cards = [c for c in self._cards if c.id != card_id]
+        self._search_index = None
         # 刷新显示
         self._refresh_cards()
     
@@ -1238,6 +1097,7 @@ class TimelineView(QWidget):
     def clear(self):
         """清空时间轴"""
         self._cards = []
+        self._search_index = None
         self._refresh_cards()
     
     def get_current_date(self) -> datetime: